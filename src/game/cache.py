@@ -3,7 +3,9 @@ A utility python file that hosts a global cache, global config, and useful
 accessor/setter methods
 """
 
+import functools
 import uuid
+from collections.abc import Sequence
 from typing import Callable
 from loguru import logger
 
@@ -12,20 +14,31 @@ cache: dict[str, any] = {}  # For objects that should have common access
 storage: dict[str, any] = {}  # For objects not intended to have general access
 
 
-def decode_path(path: list[str] | str) -> list[str]:
+@functools.cache
+def _split_path(path: str) -> tuple[str, ...]:
     """
-    Decodes a path and returns a list[str] via dot-notation.
+    Split a dot-notation path into its keys.
+
+    Cache paths are almost always string literals (e.g. "player", "managers.ItemManager"), so the split is memoized
+    rather than repeated on every cache access.
     """
+    return tuple(path.split("."))
 
-    if type(path) is not list and type(path) is not str:
-        raise TypeError(f"Unexpected cache path type: {type(path)}! Allowed types are list[str] and str!")
+
+def decode_path(path: list[str] | str) -> Sequence[str]:
+    """
+    Decodes a path and returns a sequence of keys via dot-notation.
+    """
+
+    if type(path) is str:
+        return _split_path(path)
     elif type(path) is list:
         for key in path:
             if type(key) is not str:
                 raise TypeError(f"Unexpected type within a listed cache path: {type(key)}! Allowed types are str")
         return path
-    elif type(path) is str:
-        return path.split(".")
+    else:
+        raise TypeError(f"Unexpected cache path type: {type(path)}! Allowed types are list[str] and str!")
 
 
 def from_cache(path: list[str] | str) -> any:
@@ -159,7 +172,7 @@ def delete_element(path: str | list[str], delete_branch: bool = False, force: bo
             delete the entire sub-dict tree.
     """
 
-    true_path: list[str] = decode_path(path)
+    true_path: Sequence[str] = decode_path(path)
 
     # Can the entire branch be deleted without breaking other cache values
     is_clean = True
@@ -6,6 +6,8 @@ class TagMixin(ABC):
     A mixin that provides a simple interface for storing arbitrary tags.
     """
 
+    __slots__ = ()
+
     def __init__(self, tags: dict[str, float | None] | list[str] = None, **kwargs):
         super().__init__(**kwargs)
 
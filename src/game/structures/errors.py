@@ -39,3 +39,9 @@ class CombatHandlerError(CompoundError):
     """
 
     pass
+
+
+class LoaderClassError(ValueError):
+    """
+    An error that is thrown when a JSON blob's class field does not match the loader it was passed to
+    """
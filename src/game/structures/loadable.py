@@ -7,6 +7,8 @@ class LoadableMixin:
     from JSON.
     """
 
+    __slots__ = ()
+
     LOADER_KEY: str = "loader"
     ATTR_KEY: str = "from_json"
 
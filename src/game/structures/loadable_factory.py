@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import inspect
+import typing
+from collections.abc import Callable, Sequence
+from itertools import chain
 
 from loguru import logger
 
-from game.cache import get_cache, get_loader
+from game.cache import get_cache
 from game.structures.loadable import LoadableMixin
 
 
 class LoadableFactory:
+    # Fields that every Loadable JSON blob is expected to carry
+    BASE_FIELDS: tuple[tuple[str, type], ...] = (("class", str),)
+
     @classmethod
     def collect_requirements(cls, json: dict, field="requirements") -> list:
         """
@@ -21,17 +27,13 @@ class LoadableFactory:
         if field not in json:
             return None
 
-        reqs = []
-
         from game.systems.requirement.requirements import Requirement
 
-        for requirement_json in json[field]:
-            req = LoadableFactory.get(requirement_json)
+        reqs = LoadableFactory.get_many(json[field])
+        for req in reqs:
             if not isinstance(req, Requirement):
                 raise TypeError(f"Expected requirement of type Requirement, got {type(req)} instead!")
 
-            reqs.append(req)
-
         return reqs
 
     @classmethod
@@ -46,7 +48,9 @@ class LoadableFactory:
         return json[field] if field in json else None
 
     @classmethod
-    def collect_optional_fields(cls, fields: list[tuple[str, type]], json: dict, implicit_fields: bool = True) -> dict:
+    def collect_optional_fields(
+        cls, fields: Sequence[tuple[str, type]], json: dict, implicit_fields: bool = True
+    ) -> dict:
         """
         Search for optional fields within a JSON blob and bundle them into a dict. Any fields not found will simply not
         be included.
@@ -76,22 +80,21 @@ class LoadableFactory:
 
     @classmethod
     def validate_fields(
-        cls, fields: list[tuple[str, type | tuple[type]]], json: dict, required=True, implicit_fields=True
+        cls, fields: Sequence[tuple[str, type | tuple[type]]], json: dict, required=True, implicit_fields=True
     ) -> bool:
         """
         Verify that the expected json fields are present and correctly typed.
 
         args:
-            fields: A list of tuples mapping each field to a type
+            fields: A list or tuple of tuples mapping each field to a type. It is never mutated, so it is safe to pass
+                a shared module-level constant.
             json: A dict-form representation of a json object
             required: If True, treat each field as if it is required and throw an error if it is missing
             implicit_fields: If True, add in a set of pre-defined common fields in the background.
 
         returns: True if all the fields are present and correctly typed.
         """
-        base_fields = [("class", str)]
-
-        for field_name, field_type in fields + (base_fields if implicit_fields else []):
+        for field_name, field_type in chain(fields, cls.BASE_FIELDS if implicit_fields else ()):
             # Verify valid tuple typings
             if type(field_name) is not str:
                 raise TypeError(f"field_name must be of type 'str'! Got {type(field_name)} instead.")
@@ -129,6 +132,70 @@ class LoadableFactory:
 
         return True
 
+    @classmethod
+    def compile_validator(
+        cls,
+        required: Sequence[tuple[str, type | tuple[type]]] = (),
+        optional: Sequence[tuple[str, type | tuple[type]]] = (),
+        implicit_fields: bool = True,
+    ) -> Callable[[dict], bool]:
+        """
+        Build a validator for a fixed set of required and optional fields.
+
+        The returned function is equivalent to calling validate_fields(required, json, True, implicit_fields) followed
+        by validate_fields(optional, json, False, False), but the field specs are checked and normalized once, here,
+        rather than on every call. Generic aliases such as list[str] are checked against their origin type. Loadable
+        classes keep their specs and validator as module-level constants next to the class, so they are built once rather
+        than for every loaded asset.
+
+        args:
+            required: A sequence of tuples mapping each required field to a type or tuple of types
+            optional: A sequence of tuples mapping each optional field to a type or tuple of types
+            implicit_fields: If True, add in a set of pre-defined common fields to the required fields.
+
+        returns: A function that accepts a JSON blob and returns True if all the fields are present and correctly typed.
+        """
+
+        def normalize(field_name, field_type) -> tuple[str, type | tuple[type]]:
+            if type(field_name) is not str:
+                raise TypeError(f"field_name must be of type 'str'! Got {type(field_name)} instead.")
+
+            if inspect.isclass(field_type):
+                return field_name, field_type
+
+            if type(field_type) is tuple and all(inspect.isclass(t) for t in field_type):
+                return field_name, field_type
+
+            if inspect.isclass(typing.get_origin(field_type)):
+                return field_name, typing.get_origin(field_type)
+
+            raise TypeError(f"field_type must be of type 'type' or type 'tuple[type]' got {type(field_type)} instead!")
+
+        required_fields = tuple(
+            normalize(*spec) for spec in chain(required, cls.BASE_FIELDS if implicit_fields else ())
+        )
+        optional_fields = tuple(normalize(*spec) for spec in optional)
+
+        def validate(json: dict) -> bool:
+            for field_name, field_type in required_fields:
+                if field_name not in json:
+                    raise ValueError(f"Field {field_name} not found!")
+
+                if not isinstance(json[field_name], field_type):
+                    raise TypeError(
+                        f"Expected field {field_name} to be of type {field_type}, got {type(json[field_name])} instead!"
+                    )
+
+            for field_name, field_type in optional_fields:
+                if field_name in json and not isinstance(json[field_name], field_type):
+                    raise TypeError(
+                        f"Expected field {field_name} to be of type {field_type}, got {type(json[field_name])} instead!"
+                    )
+
+            return True
+
+        return validate
+
     @classmethod
     def get(cls, json: dict[str, any]) -> any:
         """
@@ -140,17 +207,42 @@ class LoadableFactory:
         Returns: An object of the type specified in the JSON.
         """
 
+        return cls._load(get_cache()[LoadableMixin.LOADER_KEY], json)
+
+    @classmethod
+    def get_many(cls, jsons: Sequence[dict[str, any]]) -> list:
+        """
+        Instantiate a Loadable object from each JSON blob in a sequence.
+
+        Equivalent to calling `get` on each blob, except that the loader table is fetched from the cache once for the
+        whole sequence.
+
+        Args:
+            jsons: a sequence of dict-form representations of Loadable objects
+
+        Returns: A list of objects of the types specified in each JSON, in order.
+        """
+
+        loaders = get_cache()[LoadableMixin.LOADER_KEY]
+        return [cls._load(loaders, json) for json in jsons]
+
+    @staticmethod
+    def _load(loaders: dict[str, dict[str, Callable]], json: dict[str, any]) -> any:
+        """
+        Validate a JSON blob and run the loader registered for its class in `loaders`.
+        """
+
         if type(json) is not dict:
             raise TypeError(f"Argument 'json' must be of type dict, got type {type(json)} instead!")
 
         if "class" not in json:
             raise ValueError("Cannot load a JSON blob without a class field!")
 
-        if json["class"] not in get_cache()[LoadableMixin.LOADER_KEY]:
+        if json["class"] not in loaders:
             raise ValueError(f"No loader for class {json['class']} has been registered!")
 
         try:
-            return get_loader(json["class"])(json=json)
+            return loaders[json["class"]][LoadableMixin.ATTR_KEY](json=json)
 
         except Exception as e:
             logger.error(f"Something wen wrong while trying to load an object of type {json['class']}!")
@@ -71,8 +71,8 @@ class ComponentFactory:
     @classmethod
     def get(
         cls,
-        content: list[str | StringContent] | None = None,
-        options: list[list[str | StringContent]] | None = None,
+        content: list[str | StringContent] | tuple[str | StringContent, ...] | None = None,
+        options: list[list[str | StringContent]] | tuple[list[str | StringContent], ...] | None = None,
         cols: list[str] | None = None,
         listing_type: str | None = None,
     ) -> dict[str, list]:
@@ -80,9 +80,9 @@ class ComponentFactory:
         A components dict only has two fields: content and options. 'content' is required while 'options' is not.
 
         Args:
-            content: A list of str or str-like objects. This is the main text the user sees.
-            options: A list of lists of str or str-like objects. If there are options for the user to choose from within
-                     a given frame, they are embedded inside 'options'.
+            content: A list or tuple of str or str-like objects. This is the main text the user sees.
+            options: A list or tuple of lists of str or str-like objects. If there are options for the user to choose
+                     from within a given frame, they are embedded inside 'options'.
             cols: A list of strs. cols[0] is the name of the column of indexes, cols[1] is the name of the column of
                     text.
             listing_type: A str. Available options are "numbered" and "dashed". Informs the client of the prefered
@@ -109,11 +109,11 @@ class ComponentFactory:
                 "primary_resource_max": entity.resource_controller[primary_resource].max,
             }
 
-        if content and type(content) is not list:
-            raise TypeError(f"components.content must be of type list! Got {type(content)} instead.")
+        if content and type(content) not in (list, tuple):
+            raise TypeError(f"components.content must be of type list or tuple! Got {type(content)} instead.")
 
-        if options and type(options) is not list:
-            raise TypeError(f"components.options must be of type list! Got {type(options)} instead.")
+        if options and type(options) not in (list, tuple):
+            raise TypeError(f"components.options must be of type list or tuple! Got {type(options)} instead.")
 
         data = {
             "content": content,
@@ -6,12 +6,11 @@ object, the vast majority of which are actually further sub-divided into states
 within a FiniteStateDevice object.
 """
 
-import copy
 import enum
 import inspect
 import weakref
 from abc import abstractmethod, ABC
-from typing import Callable
+from typing import Callable, ClassVar, NamedTuple
 
 from loguru import logger
 
@@ -37,6 +36,8 @@ class StateDevice(ABC):
     a FiniteStateDevice.
     """
 
+    __slots__ = ("__weakref__", "_controller", "_input_range", "_input_type", "name")
+
     def __init__(self, input_type: InputType, input_range: dict[str, int] = None, name: str = None):
         self._input_type: InputType = input_type
         self._input_range: dict[str, int] = input_range or to_range()
@@ -333,12 +334,44 @@ class StateDevice(ABC):
         return self.__frame__()
 
 
+class StateSpec(NamedTuple):
+    """
+    A declarative description of a single state within a FiniteStateDevice.
+
+    StateSpecs allow a FiniteStateDevice subclass to describe its states once, at class-definition time, rather than
+    building and registering a fresh set of closures within every instance's __init__. Any plain functions stored in a
+    StateSpec (logic, content, and callable input bounds) are expected to accept the device instance as their first
+    argument and are bound to each instance when the spec is installed.
+
+    Attributes:
+        input_type: The input type for the state
+        logic: The logic provider for the state
+        content: The content provider for the state, if any
+        input_min: The input range's min for the state. May be an int or a callable that returns an int.
+        input_max: The input range's max for the state. May be an int or a callable that returns an int.
+        input_len: The input range's length for the state.
+    """
+
+    input_type: InputType
+    logic: Callable
+    content: Callable | None = None
+    input_min: int | Callable | None = None
+    input_max: int | Callable | None = None
+    input_len: int | None = None
+
+
 class FiniteStateDevice(StateDevice, ABC):
     """
     A subclass of StateDevice that adds support for explicit state ordering and
     transitions.
     """
 
+    __slots__ = ("_current_state_data", "current_state", "default_state", "state_data", "state_history", "states")
+
+    # The StateSpec table that install_state_table last validated for a class. It is read from each class's own
+    # __dict__, so every subclass validates its table once, and it holds the table itself rather than its id
+    _validated_state_table: ClassVar[dict[enum.Enum, StateSpec] | None] = None
+
     state_data_dict = {
         "input_type": enums.InputType.ANY,
         "min": None,
@@ -369,34 +402,30 @@ class FiniteStateDevice(StateDevice, ABC):
 
         self.states: type[enum.Enum] = states
         self.current_state = self.default_state = default_state
-        self.state_data: dict[states, dict] = {k.value: copy.deepcopy(self.state_data_dict) for k in self.states}
+        # state_data_dict only holds scalars and None, so a shallow copy per state is sufficient
+        self.state_data: dict[states, dict] = {k.value: dict(self.state_data_dict) for k in self.states}
+        self._current_state_data: dict = self.state_data[self.current_state.value]
         self.state_history: list[states] = [self.current_state]
         self.set_defaults()
 
     def set_state(self, next_state) -> None:
-        if next_state.value not in self.state_data:
+        # Bind the state's record once so that logic and components do not need to look it up again on every tick
+        try:
+            data = self._current_state_data = self.state_data[next_state.value]
+        except KeyError:
             raise StateDeviceInternalError(f"Unknown state {next_state}!")
 
         self.current_state = next_state
-        self.input_type = self.state_data[next_state.value]["input_type"]
+        self.input_type = data["input_type"]
 
         # Assign min
-        if callable(self.state_data[next_state.value]["min"]):
-            self.domain_min = self.state_data[next_state.value]["min"]()
-        else:
-            self.domain_min = self.state_data[next_state.value]["min"]
+        self.domain_min = data["min"]() if callable(data["min"]) else data["min"]
 
         # Assign max
-        if callable(self.state_data[next_state.value]["max"]):
-            self.domain_max = self.state_data[next_state.value]["max"]()
-        else:
-            self.domain_max = self.state_data[next_state.value]["max"]
+        self.domain_max = data["max"]() if callable(data["max"]) else data["max"]
 
         # Assign length
-        if callable(self.state_data[next_state.value]["len"]):
-            self.domain_length = self.state_data[next_state.value]["len"]()
-        else:
-            self.domain_length = self.state_data[next_state.value]["len"]
+        self.domain_length = data["len"]() if callable(data["len"]) else data["len"]
 
         # Append history for debugging purposes
         self.state_history.append(next_state)
@@ -455,12 +484,17 @@ class FiniteStateDevice(StateDevice, ABC):
             Register to instance and then return the function untouched.
             """
 
-            spec = inspect.getfullargspec(fn)
-            if len(spec.args) != 1:
+            # inspect.signature omits the 'self' parameter of bound methods
+            positional_args = [
+                p
+                for p in inspect.signature(fn).parameters.values()
+                if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)
+            ]
+            if len(positional_args) != 1:
                 raise ValueError(
                     f"""Error registering logic provider for state {state}.
                     State logic functions must accept only a single positional 
-                    argument, not {len(spec.args)}!"""
+                    argument, not {len(positional_args)}!"""
                 )
 
             self.state_data[state.value]["input_type"] = input_type
@@ -506,56 +540,93 @@ class FiniteStateDevice(StateDevice, ABC):
 
         return decorate
 
+    def install_state_table(self, table: dict[enum.Enum, StateSpec]) -> None:
+        """
+        Register every state described by a table of StateSpecs.
+
+        Plain functions within each StateSpec are bound to this instance before being registered. They read any state
+        they need from the instance they are bound to, so a class keeps one table as a class-level constant and shares
+        it between all of its instances.
+
+        The first time a given class installs a table, each state is registered through state_logic and state_content
+        so that the specs are fully validated. Later installs of the same table by the same class skip that validation
+        and write each state's record directly.
+
+        Args:
+            table: A map of states to the StateSpec describing them
+
+        Returns: None
+        """
+
+        def bind(value):
+            return value.__get__(self, type(self)) if inspect.isfunction(value) else value
+
+        cls = type(self)
+        if cls.__dict__.get("_validated_state_table") is not table:
+            for state, spec in table.items():
+                self.state_logic(state, spec.input_type, bind(spec.input_min), bind(spec.input_max), spec.input_len)(
+                    bind(spec.logic)
+                )
+
+                if spec.content is not None:
+                    self.state_content(state)(bind(spec.content))
+
+            cls._validated_state_table = table
+            return
+
+        for state, spec in table.items():
+            record = self.state_data[state.value]
+            if record["logic"]:
+                raise StateDeviceInternalError(
+                    f"State.logic collision! {state} already has a logic function registered."
+                )
+
+            record["input_type"] = spec.input_type
+            record["min"] = bind(spec.input_min)
+            record["max"] = bind(spec.input_max)
+            record["len"] = spec.input_len
+            record["logic"] = bind(spec.logic)
+            record["content"] = bind(spec.content)
+
     def _update_dynamic_input_domains(self) -> None:
         """
         When the user transitions to a state, check if the min and/or max are
         defined dynamically. If so, force the value to refresh.
         """
 
-        if callable(self.state_data[self.current_state.value]["max"]):
-            self.domain_max = self.state_data[self.current_state.value]["max"]()
+        if callable(self._current_state_data["max"]):
+            self.domain_max = self._current_state_data["max"]()
 
-        if callable(self.state_data[self.current_state.value]["min"]):
-            self.domain_min = self.state_data[self.current_state.value]["min"]()
+        if callable(self._current_state_data["min"]):
+            self.domain_min = self._current_state_data["min"]()
 
     def logic(self, user_input: any) -> None:
         self._update_dynamic_input_domains()
 
-        # Check for bad state data
-        if self.current_state.value not in self.state_data:
-            raise ValueError(f"State {self.current_state} has not been registered with {self.name}!")
-
-        if (
-            "logic" not in self.state_data[self.current_state.value]
-            or not self.state_data[self.current_state.value]["logic"]
-        ):
+        logic_provider = self._current_state_data["logic"]
+        if not logic_provider:
             raise StateDeviceInternalError(
                 f"No logical provider has been registered for state {self.current_state}!", {KeyError: ""}
             )
-        self.state_data[self.current_state.value]["logic"](user_input)
+
+        logic_provider(user_input)
 
     @property
     def components(self) -> dict[str, any]:
         self._update_dynamic_input_domains()
 
-        # Check for bad state data
-        if self.current_state.value not in self.state_data:
-            raise ValueError(f"State {self.current_state} has not been registered with {self.name}!")
-
         # If the state is silent, simply return an empty component dict.
         # This circumvents checks for silent states
-        if self.state_data[self.current_state.value]["input_type"] == InputType.SILENT:
+        if self._current_state_data["input_type"] == InputType.SILENT:
             return ComponentFactory.get()
 
-        if (
-            "content" not in self.state_data[self.current_state.value]
-            or not self.state_data[self.current_state.value]["content"]
-        ):
+        content_provider = self._current_state_data["content"]
+        if not content_provider:
             raise KeyError(
                 f"No content provider has been registered for state {self.current_state} in device {self.name}!"
             )
 
-        return self.state_data[self.current_state.value]["content"]()
+        return content_provider()
 
     def reset(self) -> None:
         self.set_state(self.default_state)
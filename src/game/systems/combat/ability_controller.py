@@ -19,6 +19,19 @@ class AbilityController:
                     raise ValueError(f"{ab} is not a known Ability!")
 
         self.abilities: set[str] = set(abilities) if abilities is not None else set()
+        self._sorted_abilities: tuple[str, ...] | None = None  # Built on demand, cleared when an ability is learned
+
+    @property
+    def sorted_abilities(self) -> tuple[str, ...]:
+        """
+        The names of all learned abilities, in sorted order.
+
+        The sorted tuple is cached until another ability is learned.
+        """
+        if self._sorted_abilities is None:
+            self._sorted_abilities = tuple(sorted(self.abilities))
+
+        return self._sorted_abilities
 
     def is_learnable(self, ability_name: str) -> bool:
         """
@@ -59,6 +72,7 @@ class AbilityController:
         """
         if not self.is_learned(ability_name):
             self.abilities.add(ability_name)
+            self._sorted_abilities = None
             return True
 
         return False
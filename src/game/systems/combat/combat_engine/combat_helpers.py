@@ -56,8 +56,7 @@ def calculate_target_resistance(ability: Ability, target: CombatEntity) -> float
         if ability_tag in tags_on_target:
             tag_values += tags_on_target[ability_tag]  # Add resistances to queue
 
-    tag_values = sorted(tag_values, reverse=True)
-
+    # sum_a_tag sorts the resistances itself
     return round(sum_a_tag(tag_values), 2)
 
 
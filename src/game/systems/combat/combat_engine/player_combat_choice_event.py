@@ -175,7 +175,7 @@ class PlayerCombatChoiceEvent(Event):
 
         @self.state_content(self.States.CANNOT_USE_ABILITY)
         def _content() -> dict:
-            return ComponentFactory.get(["You cannot use that Ability."])
+            return ComponentFactory.get(("You cannot use that Ability.",))
 
         # CHOOSE_AN_ITEM
         @self.state_logic(self.States.CHOOSE_AN_ITEM, InputType.SILENT)
@@ -77,7 +77,10 @@ class CraftingController:
         """
         Check if the owning Entity has sufficient quantity of ingredients to execute the recipe
         """
-        return len(self.get_missing_ingredients(recipe_id)) < 1
+        total_quantity = self.owner.inventory.total_quantity
+
+        # Stop at the first short ingredient, rather than building the full missing-ingredient list
+        return all(total_quantity(item_id) >= quantity for item_id, quantity in recipe_manager[recipe_id].items_in)
 
     def get_max_crafts(self, recipe_id) -> int:
         """
@@ -87,14 +90,16 @@ class CraftingController:
         has the lowest quantity_in_inventory / quantity_demand_from_recipe.
         """
 
-        min_crafts: int = 9999999
-        for ingredient_id, ingredient_quantity in recipe_manager[recipe_id].items_in:  # For each ingredient bundle
-            in_inv: int = self.owner.inventory.total_quantity(ingredient_id)  # Check amount the user has
-            max_crafts: int = int(in_inv / ingredient_quantity)  # Calculate how many bundles are available from the inv
-            min_crafts = max_crafts if max_crafts < min_crafts else min_crafts  # Update minimum bundle quantity
+        total_quantity = self.owner.inventory.total_quantity
 
         # The maximum number of crafts for the recipe is determined by the ingredient with the lowest relative quantity
-        return min_crafts
+        return min(
+            (
+                total_quantity(ingredient_id) // ingredient_quantity
+                for ingredient_id, ingredient_quantity in recipe_manager[recipe_id].items_in
+            ),
+            default=9999999,
+        )
 
     def get_recipes_as_options(self) -> list[list[str | StringContent]]:
         """
@@ -106,11 +111,14 @@ class CraftingController:
 
         opts: list[list[str | StringContent]] = []
 
-        for recipe in self.learned_recipes:
-            if self.has_sufficient_ingredients(recipe):
-                opts.append([StringContent(value=recipe_manager.get_recipe(recipe).name, formatting="valid_recipe")])
-            else:
-                opts.append([StringContent(value=recipe_manager.get_recipe(recipe).name, formatting="invalid_recipe")])
+        for recipe_id in self.learned_recipes:
+            # Only read from here, so the registered Recipe is used rather than a deep copy from get_recipe
+            recipe = recipe_manager[recipe_id]
+
+            sufficient = self.has_sufficient_ingredients(recipe_id)
+            opts.append(
+                [StringContent(value=recipe.name, formatting="valid_recipe" if sufficient else "invalid_recipe")]
+            )
 
         return opts
 
@@ -121,11 +129,15 @@ class CraftingController:
         """
         payload = []
 
+        # The max crafts and the ItemManager are the same for every ingredient, so look them up once
+        max_crafts = f"\t({self.get_max_crafts(recipe_id)})"
+        get_name = from_cache("managers.ItemManager").get_name
+
         for ingredient_id, ingredient_quantity in self.get_missing_ingredients(recipe_id):
             opt = [
-                StringContent(value=from_cache("managers.ItemManager").get_name(ingredient_id), fomatting="item_name"),
+                StringContent(value=get_name(ingredient_id), fomatting="item_name"),
                 f"\tx{ingredient_quantity}",
-                f"\t({self.get_max_crafts(recipe_id)})",
+                max_crafts,
             ]
             payload.append(opt)
 
@@ -1,9 +1,14 @@
 from abc import ABC
 
 from game.cache import cached
+from game.structures.errors import LoaderClassError
 from game.structures.loadable import LoadableMixin
 from game.structures.loadable_factory import LoadableFactory
 
+_CURRENCY_REQUIRED = (("id", int), ("name", str), ("stages", dict))
+_CURRENCY_OPTIONAL = (("quantity", int), ("allow_negative", bool))
+_CURRENCY_VALIDATOR = LoadableFactory.compile_validator(_CURRENCY_REQUIRED, _CURRENCY_OPTIONAL)
+
 
 class BaseCurrency(ABC):
     """Currency records information about money an entity owns.
@@ -154,16 +159,12 @@ class Currency(LoadableMixin, BaseCurrency):
         - allow_negative: bool = False
         """
 
-        required_fields = [("id", int), ("name", str), ("stages", dict)]
-
-        optional_fields = [("quantity", int), ("allow_negative", bool)]
-
-        LoadableFactory.validate_fields(required_fields, json)
-        LoadableFactory.validate_fields(optional_fields, json, False, False)
+        # Reject mis-classified blobs before paying for a full validation pass
+        if json.get("class") != "Currency":
+            raise LoaderClassError(f"Invalid class field! Expected Currency, got {json.get('class')}")
 
-        if json["class"] != "Currency":
-            raise ValueError("Invalid class field!")
+        _CURRENCY_VALIDATOR(json)
 
-        kwargs = LoadableFactory.collect_optional_fields(optional_fields, json)
+        kwargs = LoadableFactory.collect_optional_fields(_CURRENCY_OPTIONAL, json)
 
         return Currency(json["id"], json["name"], json["stages"], **kwargs)
@@ -5,7 +5,7 @@ from loguru import logger
 from game.structures import manager as manager
 from game.structures.loadable_factory import LoadableFactory
 from game.systems.currency import Currency
-from game.util.asset_utils import get_asset
+from game.util.asset_utils import get_asset_content
 
 
 class CurrencyManager(manager.Manager):
@@ -63,9 +63,7 @@ class CurrencyManager(manager.Manager):
         self._manifest[currency.id] = currency
 
     def load(self) -> None:
-        raw_asset = get_asset(self.CURRENCY_ASSET_PATH)
-
-        for raw_currency in raw_asset["content"]:
+        for raw_currency in get_asset_content(self.CURRENCY_ASSET_PATH):
             currency = LoadableFactory.get(raw_currency)
 
             if not isinstance(currency, Currency):
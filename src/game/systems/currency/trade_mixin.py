@@ -16,6 +16,8 @@ class TradeMixin(ABC):
     A mixin that defines an interface for assigning currency value to an object.
     """
 
+    __slots__ = ()
+
     def __init__(self, market_values: dict[int, int] = None, **kwargs):
         super().__init__(**kwargs)
 
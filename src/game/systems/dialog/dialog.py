@@ -3,7 +3,6 @@ All Dialog system related classes. Includes the Dialog logical components, JSON
 translation functions, and related Events.
 """
 
-import copy
 import dataclasses
 from abc import ABC
 
@@ -152,16 +151,16 @@ class DialogNodeBase(ABC):
 
     def get_events(self) -> list[Event]:
         """
-        Return a deep copy of each on_enter Event object.
+        Return a fresh copy of each on_enter Event object, via Event.clone.
 
-        If an Event does not implement a custom __deep_copy__ method, unexpected
-        behavior is likely.
+        If an Event does not implement a custom __copy__ method, it falls back
+        to a deep copy and unexpected behavior is likely.
         """
-        return [copy.deepcopy(e) for e in self.on_enter]
+        return [e.clone() for e in self.on_enter]
 
     def trigger_events(self) -> None:
         """
-        Run a deep copy of each event, as supplied by `get_events`
+        Run a copy of each event, as supplied by `get_events`
         """
 
         for event in self.get_events():
@@ -3,7 +3,7 @@ import copy
 from game.structures import manager as manager
 from game.structures.loadable_factory import LoadableFactory
 from game.systems.entity import entities as entities
-from game.util.asset_utils import get_asset
+from game.util.asset_utils import get_asset_content
 
 
 class EntityManager(manager.Manager):
@@ -62,8 +62,7 @@ class EntityManager(manager.Manager):
         return copy.deepcopy(self._manifest[entity_id])
 
     def load(self) -> None:
-        raw_asset: dict[str, any] = get_asset(self.ENTITY_ASSET_PATH)
-        for raw_entity in raw_asset["content"]:
+        for raw_entity in get_asset_content(self.ENTITY_ASSET_PATH):
             entity = LoadableFactory.get(raw_entity)
             if not isinstance(entity, entities.Entity):
                 raise TypeError(f"Expected object of type Entity, got {type(entity)} instead!")
@@ -143,6 +143,8 @@ class ResourceModifierMixin:
     Would set up a modifier for +10 health, -5 stamina, +25% mana, -10% faith.
     """
 
+    __slots__ = ()
+
     @classmethod
     def validate_modifier(cls, resource_name, modifier):
         if type(resource_name) is not str:
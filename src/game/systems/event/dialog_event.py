@@ -3,6 +3,7 @@ from enum import Enum
 import game
 from game.cache import from_cache, cached
 from game.structures.enums import InputType
+from game.structures.errors import LoaderClassError
 from game.structures.loadable import LoadableMixin
 from game.structures.loadable_factory import LoadableFactory
 from game.structures.messages import ComponentFactory
@@ -10,6 +11,9 @@ from game.systems.dialog.dialog import DialogNode, Dialog
 from game.systems.event import Event
 from game.systems.event.events import TextEvent
 
+_DIALOG_EVENT_REQUIRED = (("dialog_id", int),)
+_DIALOG_EVENT_VALIDATOR = LoadableFactory.compile_validator(_DIALOG_EVENT_REQUIRED)
+
 
 class DialogEvent(Event):
     """
@@ -77,27 +81,31 @@ class DialogEvent(Event):
             input_max=lambda: len(self.current_node.get_option_text()) - 1,
         )
         def _logic(user_input: int):
-            self.current_node.visited = True
-            user_choice: str = self.current_node.get_option_text()[user_input][0]
-            next_node: int = self.current_node.options[user_choice]
+            # Resolve the current node once rather than walking the Dialog on every access
+            node: DialogNode = self.current_node
+            node.visited = True
+            user_choice: str = node.get_option_text()[user_input][0]
+            next_node: int = node.options[user_choice]
             if next_node < 0:
                 self.set_state(self.States.TERMINATE)
                 return
 
-            self.current_node = self.dialog.nodes[next_node].node_id
-            if self.current_node.should_trigger_events():
-                self.current_node.trigger_events()
+            node = self.dialog.nodes[next_node]
+            self.current_node = node.node_id
+            if node.should_trigger_events():
+                node.trigger_events()
 
-                if self.current_node.text_before_events:
+                if node.text_before_events:
                     # Add a text event on top of the triggered events with the
                     # node's main text.
                     # This will allow the user to read the text of the node
                     # before "seeing" the triggered events.
-                    game.add_state_device(TextEvent(self.current_node.text))
+                    game.add_state_device(TextEvent(node.text))
 
         @self.state_content(self.States.VISIT_NODE)
         def _content() -> dict:
-            return ComponentFactory.get([self.current_node.text], self.current_node.get_option_text())
+            node: DialogNode = self.current_node
+            return ComponentFactory.get([node.text], node.get_option_text())
 
     @staticmethod
     @cached([LoadableMixin.LOADER_KEY, "DialogEvent", LoadableMixin.ATTR_KEY])
@@ -109,11 +117,10 @@ class DialogEvent(Event):
         - dialog_id (int)
         """
 
-        required_fields = [("dialog_id", int)]
-
-        LoadableFactory.validate_fields(required_fields, json)
+        # Reject mis-classified blobs before paying for a full validation pass
+        if json.get("class") != "DialogEvent":
+            raise LoaderClassError(f"Invalid class field! Expected DialogEvent, got {json.get('class')}")
 
-        if json["class"] != "DialogEvent":
-            raise ValueError()
+        _DIALOG_EVENT_VALIDATOR(json)
 
         return DialogEvent(json["dialog_id"])
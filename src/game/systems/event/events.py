@@ -3,20 +3,22 @@ A collection of Event sublasses.
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
+import copy
 from abc import ABC
-from enum import Enum
+from enum import Enum, IntEnum
 
 import game
 import game.systems.currency as currency
+from game.systems.entity import entities
 import game.systems.flag as flag
 from game.cache import from_cache, cached
 from game.structures.enums import InputType
 from game.structures.loadable import LoadableMixin
 from game.structures.loadable_factory import LoadableFactory
 from game.structures.messages import StringContent, ComponentFactory
-from game.structures.state_device import FiniteStateDevice
+from game.structures.state_device import FiniteStateDevice, StateSpec
 from game.systems.combat.combat_engine.combat_engine import CombatEngine
 from game.systems.combat.combat_engine.termination_handler import TerminationHandler
 from game.systems.crafting import recipe_manager
@@ -25,18 +27,43 @@ from game.systems.entity.resource import ResourceController
 if TYPE_CHECKING:
     from game.systems.entity.entities import CombatEntity
 
+# Fixed message fragments are never modified once built, so every Event instance shares the same objects
+_ALREADY_LEARNED_PREFIX = StringContent(value="You already learned ")
+_LEARNED_PREFIX = StringContent(value="You learned a new ability!\n")
+_REPUTATION_PREFIX = StringContent(value="Your reputation with ")
+_REPUTATION_INCREASED = StringContent(value="increased")
+_REPUTATION_DECREASED = StringContent(value="decreased")
+
 
 class Event(FiniteStateDevice, LoadableMixin, ABC):
     """
     An abstract base class defining the core behaviors of an Event for TXEngine.
+
+    Subclasses may describe their states declaratively by mapping each state to a StateSpec in _STATE_TABLE. The table
+    is installed on every instance at init, so that per-instance closures do not need to be built and registered.
     """
 
+    __slots__ = ()
+
+    _STATE_TABLE: ClassVar[dict[Enum, StateSpec]] = {}
+
     def __init__(self, default_input_type: InputType, states: type[Enum], default_state):
         super().__init__(default_input_type, states, default_state)
+        self.install_state_table(self._STATE_TABLE)
 
     def __str__(self) -> str:
         return f"{self.__class__}"
 
+    def clone(self) -> Event:
+        """
+        Return a fresh copy of this Event, suitable for running on its own.
+
+        Events that define __copy__ rebuild themselves from their constructor arguments, so that is called directly
+        rather than going through deepcopy's memo bookkeeping. All other Events fall back to a deepcopy.
+        """
+        copier = getattr(self, "__copy__", None)
+        return copier() if copier is not None else copy.deepcopy(self)
+
 
 class EntityTargetMixin(ABC):
     """
@@ -44,12 +71,12 @@ class EntityTargetMixin(ABC):
     type-checking, getter and setter methods, and more.
     """
 
+    __slots__ = ()
+
     def __init__(self, target: CombatEntity = None, **kwargs):
         super().__init__(**kwargs)
 
-        from game.systems.entity.entities import CombatEntity
-
-        if target is not None and not isinstance(target, CombatEntity):
+        if target is not None and not isinstance(target, entities.CombatEntity):
             raise TypeError(f"Invalid target of type {type(target)}")
 
         self._target: CombatEntity = target
@@ -66,11 +93,15 @@ class EntityTargetMixin(ABC):
 
     @target.setter
     def target(self, entity) -> None:
-        from game.systems.entity.entities import CombatEntity
-
-        if not isinstance(entity, CombatEntity):
+        if not isinstance(entity, entities.CombatEntity):
             raise TypeError(f"Invalid target entity type! Got type {type(entity)}, expected type Entity")
 
+        self._target = entity
+
+
+_FLAG_EVENT_REQUIRED = (("flags", list[list[str | bool]]),)
+_FLAG_EVENT_VALIDATOR = LoadableFactory.compile_validator(_FLAG_EVENT_REQUIRED)
+
 
 class FlagEvent(Event):
     """An event that sets a specific flag to a given value
@@ -86,17 +117,20 @@ class FlagEvent(Event):
         flags['this']['is']['a']['deep']['flag'] = False
     """
 
+    __slots__ = ("_flags",)
+
     def __init__(self, flags: list[tuple[str, bool]]):
         super().__init__(InputType.SILENT, self.States, self.States.DEFAULT)
-        self._flags = flags  # The flags to set and their corresponding values
+        self._flags: tuple[tuple[str, bool], ...] = tuple(flags)  # The flags to set and their corresponding values
+
+    def _default_logic(self, _: any) -> None:
+        """
+        Perform some logic for setting flags
+        """
+        flag.flag_manager.set_flags(self._flags)
+        self.set_state(self.States.TERMINATE)
 
-        @self.state_logic(input_type=InputType.SILENT, state=self.States.DEFAULT)
-        def _logic(_: any) -> None:
-            """
-            Perform some logic for setting flags
-            """
-            for f in self._flags:
-                flag.flag_manager.set_flag(*f)
+    _STATE_TABLE: ClassVar[dict[Enum, StateSpec]] = {Event.States.DEFAULT: StateSpec(InputType.SILENT, _default_logic)}
 
     def __copy__(self):
         return FlagEvent(self._flags)
@@ -114,9 +148,7 @@ class FlagEvent(Event):
         - flags[[str, bool]]
         """
 
-        required_fields = [("flags", list[list[str | bool]])]
-
-        LoadableFactory.validate_fields(required_fields, json)
+        _FLAG_EVENT_VALIDATOR(json)
 
         _flags = []
 
@@ -132,10 +164,23 @@ class FlagEvent(Event):
         return FlagEvent(_flags)
 
 
+_LEARN_ABILITY_EVENT_REQUIRED = (("ability_name", str),)
+_LEARN_ABILITY_EVENT_VALIDATOR = LoadableFactory.compile_validator(_LEARN_ABILITY_EVENT_REQUIRED)
+
+
 class LearnAbilityEvent(Event):
     """Causes the player to learn a given ability"""
 
-    class States(Enum):
+    __slots__ = (
+        "_ability",
+        "_already_learned_message",
+        "_learned_message",
+        "_requirements_not_met_message",
+        "player_ref",
+        "target_ability",
+    )
+
+    class States(IntEnum):
         """
         Internal state Enum
         """
@@ -151,66 +196,68 @@ class LearnAbilityEvent(Event):
         super().__init__(InputType.SILENT, LearnAbilityEvent.States, self.States.DEFAULT)
         self.target_ability: str = ability_name
         self.player_ref = None
+        self._ability = None  # Fetched from the AbilityManager only if its requirements need to be shown
+
+        # Each message only depends on the ability's name, so assemble them once rather than on every frame
+        ability_name_content = StringContent(value=ability_name, formatting="ability_name")
+        self._already_learned_message = (_ALREADY_LEARNED_PREFIX, ability_name_content)
+        self._learned_message = (_LEARNED_PREFIX, ability_name_content)
+        self._requirements_not_met_message = (
+            "You do not meet the requirements for learning ",
+            ability_name_content,
+            ".",
+        )
 
-        @self.state_logic(self.States.DEFAULT, InputType.SILENT)
-        def _logic(_: any) -> None:
-            if not self.player_ref:
-                self.player_ref = from_cache("player")
-
-            if self.player_ref.ability_controller.is_learned(ability_name):
-                self.set_state(self.States.ALREADY_LEARNED)
-            else:
-                self.set_state(self.States.NOT_ALREADY_LEARNED)
-
-        @self.state_logic(self.States.NOT_ALREADY_LEARNED, InputType.SILENT)
-        def _logic(_: any) -> None:
-            if self.player_ref.ability_controller.is_learnable(ability_name):
-                self.set_state(self.States.REQUIREMENTS_MET)
-
-            else:
-                self.set_state(self.States.REQUIREMENTS_NOT_MET)
-
-        @self.state_logic(self.States.ALREADY_LEARNED, input_type=InputType.ANY)
-        def _logic(_: any):
-            self.set_state(self.States.TERMINATE)
-
-        @self.state_content(self.States.ALREADY_LEARNED)
-        def _content() -> dict:
-            already_learned_message = [
-                StringContent(value="You already learned "),
-                StringContent(value=ability_name, formatting="ability_name"),
-            ]
-            return ComponentFactory.get(already_learned_message)
-
-        @self.state_logic(self.States.REQUIREMENTS_MET, InputType.ANY)
-        def _logic(_: any) -> None:
-            self.player_ref.ability_controller.learn(ability_name)
-            self.set_state(self.States.TERMINATE)
-
-        @self.state_content(self.States.REQUIREMENTS_MET)
-        def _content() -> dict:
-            learn_message = [
-                StringContent(value="You learned a new ability!\n"),
-                StringContent(value=ability_name, formatting="ability_name"),
-            ]
-            return ComponentFactory.get(learn_message)
-
-        @self.state_logic(self.States.REQUIREMENTS_NOT_MET, InputType.ANY)
-        def _logic(_: any) -> None:
-            self.set_state(self.States.TERMINATE)
-
-        @self.state_content(self.States.REQUIREMENTS_NOT_MET)
-        def _content():
-            return ComponentFactory.get(
-                [
-                    "You do not meet the requirements for learning ",
-                    StringContent(value=ability_name, formatting="ability_name"),
-                    ".",
-                ],
-                # Retrieve the requirements for this ability and pass them
-                # through the options argument
-                from_cache("managers.AbilityManager").get_instance(ability_name).get_requirements_as_options(),
-            )
+    def _default_logic(self, _: any) -> None:
+        if not self.player_ref:
+            self.player_ref = from_cache("player")
+
+        if self.player_ref.ability_controller.is_learned(self.target_ability):
+            self.set_state(self.States.ALREADY_LEARNED)
+        else:
+            self.set_state(self.States.NOT_ALREADY_LEARNED)
+
+    def _not_already_learned_logic(self, _: any) -> None:
+        if self.player_ref.ability_controller.is_learnable(self.target_ability):
+            self.set_state(self.States.REQUIREMENTS_MET)
+
+        else:
+            self._ability = from_cache("managers.AbilityManager").get_instance(self.target_ability)
+            self.set_state(self.States.REQUIREMENTS_NOT_MET)
+
+    def _already_learned_logic(self, _: any):
+        self.set_state(self.States.TERMINATE)
+
+    def _already_learned_content(self) -> dict:
+        return ComponentFactory.get(self._already_learned_message)
+
+    def _requirements_met_logic(self, _: any) -> None:
+        self.player_ref.ability_controller.learn(self.target_ability)
+        self.set_state(self.States.TERMINATE)
+
+    def _requirements_met_content(self) -> dict:
+        return ComponentFactory.get(self._learned_message)
+
+    def _requirements_not_met_logic(self, _: any) -> None:
+        self.set_state(self.States.TERMINATE)
+
+    def _requirements_not_met_content(self):
+        return ComponentFactory.get(
+            self._requirements_not_met_message,
+            # Retrieve the requirements for this ability and pass them
+            # through the options argument
+            self._ability.get_requirements_as_options(),
+        )
+
+    _STATE_TABLE: ClassVar[dict[Enum, StateSpec]] = {
+        States.DEFAULT: StateSpec(InputType.SILENT, _default_logic),
+        States.NOT_ALREADY_LEARNED: StateSpec(InputType.SILENT, _not_already_learned_logic),
+        States.ALREADY_LEARNED: StateSpec(InputType.ANY, _already_learned_logic, _already_learned_content),
+        States.REQUIREMENTS_MET: StateSpec(InputType.ANY, _requirements_met_logic, _requirements_met_content),
+        States.REQUIREMENTS_NOT_MET: StateSpec(
+            InputType.ANY, _requirements_not_met_logic, _requirements_not_met_content
+        ),
+    }
 
     def __copy__(self):
         return LearnAbilityEvent(self.target_ability)
@@ -228,9 +275,7 @@ class LearnAbilityEvent(Event):
         - ability_name (str)
         """
 
-        required_fields = [("ability_name", str)]
-
-        LoadableFactory.validate_fields(required_fields, json)
+        _LEARN_ABILITY_EVENT_VALIDATOR(json)
 
         if json["class"] != "LearnAbilityEvent":
             raise ValueError()
@@ -238,11 +283,18 @@ class LearnAbilityEvent(Event):
         return LearnAbilityEvent(json["ability_name"])
 
 
+_CURRENCY_EVENT_REQUIRED = (("currency_id", int), ("quantity", int))
+_CURRENCY_EVENT_OPTIONAL = (("silent", bool),)
+_CURRENCY_EVENT_VALIDATOR = LoadableFactory.compile_validator(_CURRENCY_EVENT_REQUIRED, _CURRENCY_EVENT_OPTIONAL)
+
+
 class CurrencyEvent(Event):
     """
     A currency event changes the player's balance for a specific currency.
     """
 
+    __slots__ = ("_cur", "_currency_id", "_message", "_player_ref", "_quantity", "_silent")
+
     def __init__(self, currency_id: int | str, quantity: int, silent: bool = False):
         super().__init__(InputType.ANY, self.States, self.States.DEFAULT)
         self._currency_id = currency_id
@@ -251,22 +303,28 @@ class CurrencyEvent(Event):
         self._player_ref = from_cache("player")
         self._silent = silent
 
-        def get_message() -> list[str | StringContent]:
+        def get_message() -> tuple[str | StringContent, ...]:
             if quantity >= 0:
-                return [f"{self._player_ref.name} gained ", StringContent(value=str(self._cur))]
+                return f"{self._player_ref.name} gained ", StringContent(value=str(self._cur))
 
-            return [f"{self._player_ref.name} lost ", StringContent(value=str(self._cur))]
+            return f"{self._player_ref.name} lost ", StringContent(value=str(self._cur))
 
         self._message = get_message()
 
-        @self.state_logic(self.States.DEFAULT, InputType.ANY if not silent else InputType.SILENT)
-        def _logic(_: any) -> None:
-            self._player_ref.coin_purse.adjust(self._currency_id, self._quantity)
-            self.set_state(self.States.TERMINATE)
+        # A silent CurrencyEvent does not wait for the user to acknowledge its message
+        if silent:
+            self.state_data[self.States.DEFAULT.value]["input_type"] = InputType.SILENT
+
+    def _default_logic(self, _: any) -> None:
+        self._player_ref.coin_purse.adjust(self._currency_id, self._quantity)
+        self.set_state(self.States.TERMINATE)
 
-        @self.state_content(self.States.DEFAULT)
-        def _content():
-            return ComponentFactory.get(self._message)
+    def _default_content(self):
+        return ComponentFactory.get(self._message)
+
+    _STATE_TABLE: ClassVar[dict[Enum, StateSpec]] = {
+        Event.States.DEFAULT: StateSpec(InputType.ANY, _default_logic, _default_content)
+    }
 
     def __copy__(self):
         return CurrencyEvent(self._currency_id, self._quantity, self._silent)
@@ -288,30 +346,28 @@ class CurrencyEvent(Event):
         - silent: bool
         """
 
-        required_fields = [
-            ("currency_id", int),
-            ("quantity", int),
-        ]
-
-        optional_fields = [("silent", bool)]
-
-        LoadableFactory.validate_fields(required_fields, json, required=True)
-        LoadableFactory.validate_fields(optional_fields, json, required=False, implicit_fields=False)
+        _CURRENCY_EVENT_VALIDATOR(json)
 
         if json["class"] != "CurrencyEvent":
             raise ValueError()
 
-        kwargs = LoadableFactory.collect_optional_fields(optional_fields, json)
+        kwargs = LoadableFactory.collect_optional_fields(_CURRENCY_EVENT_OPTIONAL, json)
 
         return CurrencyEvent(json["currency_id"], json["quantity"], **kwargs)
 
 
+_LEARN_RECIPE_EVENT_REQUIRED = (("recipe_id", int),)
+_LEARN_RECIPE_EVENT_VALIDATOR = LoadableFactory.compile_validator(_LEARN_RECIPE_EVENT_REQUIRED)
+
+
 class LearnRecipeEvent(Event):
     """
     A RecipeEvent unlocks a specified recipe for the Player.
     """
 
-    class States(Enum):
+    __slots__ = ("_player_ref", "_recipe", "recipe_id")
+
+    class States(IntEnum):
         """
         Internal State Enum
         """
@@ -325,35 +381,37 @@ class LearnRecipeEvent(Event):
         super().__init__(InputType.ANY, self.States, self.States.DEFAULT)
         self.recipe_id = recipe_id
         self._player_ref = from_cache("player")
+        self._recipe = None  # Looked up when the event runs, since events may be loaded before recipes
+
+    def _default_logic(self, _: any):
+        self._recipe = recipe_manager[self.recipe_id]
+
+        if self._player_ref.crafting_controller.can_learn_recipe(self.recipe_id):
+            self.set_state(self.States.CAN_LEARN)
+        else:
+            self.set_state(self.States.CANNOT_LEARN)
+
+    def _can_learn_logic(self, _: any) -> None:
+        self._player_ref.crafting_controller.learn_recipe(self.recipe_id)
+        self.set_state(self.States.TERMINATE)
+
+    def _can_learn_content(self):
+        return ComponentFactory.get([f"{self._player_ref.name} learned a recipe!\n{self._recipe.name}"])
+
+    def _cannot_learn_logic(self, _: any) -> None:
+        self.set_state(self.States.TERMINATE)
 
-        @self.state_logic(self.States.DEFAULT, InputType.SILENT)
-        def _logic(_: any):
-            if self._player_ref.crafting_controller.can_learn_recipe(self.recipe_id):
-                self.set_state(self.States.CAN_LEARN)
-            else:
-                self.set_state(self.States.CANNOT_LEARN)
-
-        @self.state_logic(self.States.CAN_LEARN, InputType.ANY)
-        def _logic(_: any) -> None:
-            self._player_ref.crafting_controller.learn_recipe(recipe_id)
-            self.set_state(self.States.TERMINATE)
-
-        @self.state_content(self.States.CAN_LEARN)
-        def _content():
-            return ComponentFactory.get(
-                [f"{self._player_ref.name} learned a recipe!\n{recipe_manager[recipe_id].name}"]
-            )
-
-        @self.state_logic(self.States.CANNOT_LEARN, InputType.ANY)
-        def _logic(_: any) -> None:
-            self.set_state(self.States.TERMINATE)
-
-        @self.state_content(self.States.CANNOT_LEARN)
-        def _content():
-            return ComponentFactory.get(
-                [f"{self._player_ref.name} cannot learn {recipe_manager[recipe_id].name}!"],
-                recipe_manager[recipe_id].get_requirements_as_options(),
-            )
+    def _cannot_learn_content(self):
+        return ComponentFactory.get(
+            [f"{self._player_ref.name} cannot learn {self._recipe.name}!"],
+            self._recipe.get_requirements_as_options(),
+        )
+
+    _STATE_TABLE: ClassVar[dict[Enum, StateSpec]] = {
+        States.DEFAULT: StateSpec(InputType.SILENT, _default_logic),
+        States.CAN_LEARN: StateSpec(InputType.ANY, _can_learn_logic, _can_learn_content),
+        States.CANNOT_LEARN: StateSpec(InputType.ANY, _cannot_learn_logic, _cannot_learn_content),
+    }
 
     def __copy__(self):
         return LearnRecipeEvent(self.recipe_id)
@@ -371,9 +429,7 @@ class LearnRecipeEvent(Event):
         - recipe_id (int)
         """
 
-        required_fields = [("recipe_id", int)]
-
-        LoadableFactory.validate_fields(required_fields, json)
+        _LEARN_RECIPE_EVENT_VALIDATOR(json)
 
         if json["class"] != "LearnRecipeEvent":
             raise ValueError()
@@ -381,32 +437,41 @@ class LearnRecipeEvent(Event):
         return LearnRecipeEvent(json["recipe_id"])
 
 
+_REPUTATION_EVENT_REQUIRED = (("faction_id", int), ("reputation_change", int))
+_REPUTATION_EVENT_OPTIONAL = (("silent", bool),)
+_REPUTATION_EVENT_VALIDATOR = LoadableFactory.compile_validator(_REPUTATION_EVENT_REQUIRED, _REPUTATION_EVENT_OPTIONAL)
+
+
 class ReputationEvent(Event):
     """
     A ReputationEvent modifies the Player's reputation with a specified Faction
     """
 
+    __slots__ = ("_silent", "faction_id", "message", "reputation_change")
+
     def __init__(self, faction_id: int, reputation_change: int, silent: bool = False):
         super().__init__(InputType.SILENT, self.States, self.States.DEFAULT)
         self.faction_id = faction_id
         self.reputation_change = reputation_change
         self._silent = silent
-        self.message = [
-            StringContent(value="Your reputation with "),
+        self.message = (
+            _REPUTATION_PREFIX,
             StringContent(value=f"faction::{faction_id}", formatting="faction_name"),
-            StringContent(value="decreased" if self.reputation_change < 0 else "increased"),
+            _REPUTATION_DECREASED if self.reputation_change < 0 else _REPUTATION_INCREASED,
             StringContent(value=f" by {reputation_change}"),
-        ]
+        )
+
+    def _default_logic(self, _: any) -> None:
+        from_cache("managers.FactionManager").adjust_affinity(self.faction_id, self.reputation_change)
 
-        @self.state_logic(self.States.DEFAULT, InputType.ANY)
-        def _logic(_: any) -> None:
-            from_cache("managers.FactionManager").adjust_affinity(self.faction_id, self.reputation_change)
+        self.set_state(self.States.TERMINATE)
 
-            self.set_state(self.States.TERMINATE)
+    def _default_content(self) -> dict:
+        return ComponentFactory.get(self.message)
 
-        @self.state_content(self.States.DEFAULT)
-        def _content() -> dict:
-            return ComponentFactory.get(self.message)
+    _STATE_TABLE: ClassVar[dict[Enum, StateSpec]] = {
+        Event.States.DEFAULT: StateSpec(InputType.ANY, _default_logic, _default_content)
+    }
 
     def __copy__(self):
         return ReputationEvent(self.faction_id, self.reputation_change, self._silent)
@@ -428,27 +493,29 @@ class ReputationEvent(Event):
         - silent (bool)
         """
 
-        required_fields = [("faction_id", int), ("reputation_change", int)]
-
-        optional_fields = [("silent", bool)]
-
-        LoadableFactory.validate_fields(required_fields, json)
-        LoadableFactory.validate_fields(optional_fields, json, required=False, implicit_fields=False)
+        _REPUTATION_EVENT_VALIDATOR(json)
 
         if json["class"] != "ReputationEvent":
             raise ValueError()
 
-        kwargs = LoadableFactory.collect_optional_fields(optional_fields, json)
+        kwargs = LoadableFactory.collect_optional_fields(_REPUTATION_EVENT_OPTIONAL, json)
 
         return ReputationEvent(json["faction_id"], json["reputation_change"], **kwargs)
 
 
+_RESOURCE_EVENT_REQUIRED = (("resource_name", str), ("quantity", (int, float)))
+_RESOURCE_EVENT_OPTIONAL = (("silent", bool),)
+_RESOURCE_EVENT_VALIDATOR = LoadableFactory.compile_validator(_RESOURCE_EVENT_REQUIRED, _RESOURCE_EVENT_OPTIONAL)
+
+
 class ResourceEvent(EntityTargetMixin, Event):
     """
     A ResourceEvent modifies the specified Resource for a given Entity.
     """
 
-    class States(Enum):
+    __slots__ = ("_silent", "_summary", "_target", "amount", "stat_name")
+
+    class States(IntEnum):
         """
         Internal State Enum
         """
@@ -463,47 +530,45 @@ class ResourceEvent(EntityTargetMixin, Event):
         Assemble a list[str | StringContent] to be printed within the SUMMARY
         state.
         """
-        self._summary = [
+        self._summary = (
             f"{self.target.name} {'lost' if self.amount < 0 else 'gained'} ",
             f"{abs(start_value - end_value)} ",
             StringContent(value=f"{self.stat_name}.", formatting="resource_name"),
-        ]
+        )
 
     def __init__(self, resource_name: str, quantity: int | float, target=None, silent: bool = False):
         super().__init__(
-            target=target, default_input_type=InputType.ANY, states=self.States, default_state=self.States.DEFAULT
+            target=target, default_input_type=InputType.ANY, states=self.States, default_state=self.States.APPLY
         )
         self.stat_name: str = resource_name
         self.amount: int | float = quantity
-        self._summary: list[str | StringContent] = None
+        self._summary: tuple[str | StringContent, ...] = None
         self._silent = silent
 
-        @self.state_logic(self.States.DEFAULT, InputType.SILENT)
-        def _logic(_):
-            from game.systems.entity.entities import Entity  # Import locally to prevent circular import issues
+        # A silent ResourceEvent does not wait for the user to acknowledge its summary
+        if silent:
+            self.state_data[self.States.SUMMARY.value]["input_type"] = InputType.SILENT
 
-            if not isinstance(self.target, Entity):
-                raise TypeError(f"Cannot apply a ResourceEvent to an object of type {self.target}")
+    def _apply_logic(self, _: any):
+        # The target's type is enforced when it is assigned, so it does not need to be re-checked here
+        resource_controller: ResourceController = self.target.resource_controller
+        self._build_summary(
+            resource_controller.resources[self.stat_name]["instance"].value,
+            # Current value
+            resource_controller.resources[self.stat_name]["instance"].adjust(self.amount),
+        )  # Post-adjust value
+        self.set_state(self.States.SUMMARY)
 
-            self.set_state(self.States.APPLY)
+    def _summary_logic(self, _: any):
+        self.set_state(self.States.TERMINATE)
 
-        @self.state_logic(self.States.APPLY, InputType.SILENT)
-        def _logic(_: any):
-            resource_controller: ResourceController = self.target.resource_controller
-            self._build_summary(
-                resource_controller.resources[self.stat_name]["instance"].value,
-                # Current value
-                resource_controller.resources[self.stat_name]["instance"].adjust(self.amount),
-            )  # Post-adjust value
-            self.set_state(self.States.SUMMARY)
+    def _summary_content(self):
+        return ComponentFactory.get(self._summary)
 
-        @self.state_logic(self.States.SUMMARY, InputType.SILENT if self._silent else InputType.ANY)
-        def _logic(_: any):
-            self.set_state(self.States.TERMINATE)
-
-        @self.state_content(self.States.SUMMARY)
-        def _content():
-            return ComponentFactory.get(self._summary)
+    _STATE_TABLE: ClassVar[dict[Enum, StateSpec]] = {
+        States.APPLY: StateSpec(InputType.SILENT, _apply_logic),
+        States.SUMMARY: StateSpec(InputType.ANY, _summary_logic, _summary_content),
+    }
 
     def __copy__(self):
         return ResourceEvent(self.stat_name, self.amount, self.target, self._silent)
@@ -534,37 +599,41 @@ class ResourceEvent(EntityTargetMixin, Event):
         - silent (bool)
         """
 
-        required_fields = [("resource_name", str), ("quantity", (int, float))]
-
-        optional_fields = [("silent", bool)]
-
-        LoadableFactory.validate_fields(required_fields, json)
-        LoadableFactory.validate_fields(optional_fields, json, False, False)
+        _RESOURCE_EVENT_VALIDATOR(json)
 
         if json["class"] != "ResourceEvent":
             raise ValueError()
 
-        kwargs = LoadableFactory.collect_optional_fields(optional_fields, json)
+        kwargs = LoadableFactory.collect_optional_fields(_RESOURCE_EVENT_OPTIONAL, json)
 
         return ResourceEvent(json["resource_name"], json["quantity"], None, **kwargs)
 
 
+_TEXT_EVENT_REQUIRED = (("text", str),)
+_TEXT_EVENT_VALIDATOR = LoadableFactory.compile_validator(_TEXT_EVENT_REQUIRED)
+
+
 class TextEvent(Event):
     """
     A simple Event subclass that prints some text to the user then terminates.
     """
 
+    __slots__ = ("_content_lines", "text")
+
     def __init__(self, text: str | list[str | StringContent]):
         super().__init__(InputType.ANY, self.States, self.States.DEFAULT)
         self.text: str | list[str | StringContent] = text
+        self._content_lines: list[str | StringContent] = text if type(text) is list else [text]
+
+    def _default_logic(self, _: any) -> None:
+        self.set_state(self.States.TERMINATE)
 
-        @self.state_logic(self.States.DEFAULT, InputType.ANY)
-        def _logic(_: any) -> None:
-            self.set_state(self.States.TERMINATE)
+    def _default_content(self) -> dict:
+        return ComponentFactory.get(self._content_lines)
 
-        @self.state_content(self.States.DEFAULT)
-        def _content() -> dict:
-            return ComponentFactory.get(self.text if type(text) is list else [self.text])
+    _STATE_TABLE: ClassVar[dict[Enum, StateSpec]] = {
+        Event.States.DEFAULT: StateSpec(InputType.ANY, _default_logic, _default_content)
+    }
 
     def __copy__(self):
         return TextEvent(self.text)
@@ -584,13 +653,15 @@ class TextEvent(Event):
         - none
         """
 
-        required_fields = [("text", str)]
-
-        LoadableFactory.validate_fields(required_fields, json)
+        _TEXT_EVENT_VALIDATOR(json)
 
         return TextEvent(json["text"])
 
 
+_SKILL_XP_EVENT_REQUIRED = (("skill_id", int), ("xp_gained", int))
+_SKILL_XP_EVENT_VALIDATOR = LoadableFactory.compile_validator(_SKILL_XP_EVENT_REQUIRED)
+
+
 class SkillXPEvent(EntityTargetMixin, Event):
     """
     An Event that gives a specific skill XP.
@@ -598,7 +669,9 @@ class SkillXPEvent(EntityTargetMixin, Event):
     Flow handles both level-up and non-level-up scenarios.
     """
 
-    class States(Enum):
+    __slots__ = ("_skill_id", "_target", "_xp_gained")
+
+    class States(IntEnum):
         """
         Internal State Enum
         """
@@ -610,32 +683,31 @@ class SkillXPEvent(EntityTargetMixin, Event):
 
     def __init__(self, skill_id: int, xp_gain: int, target=None):
         super().__init__(
-            default_input_type=InputType.SILENT, states=self.States, default_state=self.States.DEFAULT, target=target
+            default_input_type=InputType.SILENT,
+            states=self.States,
+            default_state=self.States.GAIN_MESSAGE,
+            target=target,
         )
         self._skill_id = skill_id
         self._xp_gained = xp_gain
 
-        @self.state_logic(self.States.DEFAULT, InputType.SILENT)
-        def _logic(_: any) -> None:
-            if self._target is None:
-                self._target = from_cache("player")
-
-            self.set_state(self.States.GAIN_MESSAGE)
-
-        @self.state_logic(self.States.GAIN_MESSAGE, InputType.ANY)
-        def _logic(_: any) -> None:
-            self._target.skill_controller[self._skill_id].gain_xp(self._xp_gained)
-            self.set_state(self.States.TERMINATE)
+    def _gain_message_logic(self, _: any) -> None:
+        self.target.skill_controller[self._skill_id].gain_xp(self._xp_gained)
+        self.set_state(self.States.TERMINATE)
+
+    def _gain_message_content(self) -> dict:
+        target = self.target  # Falls back to the player if no target was supplied
+        return ComponentFactory.get(
+            [
+                f"{target.name} gained {self._xp_gained} ",
+                StringContent(value=target.skill_controller[self._skill_id].name, formatting="skill_name"),
+                " xp!",
+            ]
+        )
 
-        @self.state_content(self.States.GAIN_MESSAGE)
-        def _content() -> dict:
-            return ComponentFactory.get(
-                [
-                    f"{self._target.name} gained {self._xp_gained} ",
-                    StringContent(value=self._target.skill_controller[self._skill_id].name, formatting="skill_name"),
-                    " xp!",
-                ]
-            )
+    _STATE_TABLE: ClassVar[dict[Enum, StateSpec]] = {
+        States.GAIN_MESSAGE: StateSpec(InputType.ANY, _gain_message_logic, _gain_message_content),
+    }
 
     def __copy__(self):
         return SkillXPEvent(self._skill_id, self._xp_gained, self._target)
@@ -657,29 +729,31 @@ class SkillXPEvent(EntityTargetMixin, Event):
         - None
         """
 
-        required_fields = [("skill_id", int), ("xp_gained", int)]
-
-        LoadableFactory.validate_fields(required_fields, json)
+        _SKILL_XP_EVENT_VALIDATOR(json)
 
         return SkillXPEvent(json["skill_id"], json["xp_gained"])
 
 
 class ViewResourcesEvent(EntityTargetMixin, Event):
+    __slots__ = ("_target",)
+
     def __init__(self, target=None):
         super().__init__(
             target=target, default_input_type=InputType.ANY, states=self.States, default_state=self.States.DEFAULT
         )
-        self._target = target  # The entity to read Resource values from
 
-        @self.state_logic(self.States.DEFAULT, InputType.ANY)
-        def _logic(_: any) -> None:
-            self.set_state(self.States.TERMINATE)
+    def _default_logic(self, _: any) -> None:
+        self.set_state(self.States.TERMINATE)
 
-        @self.state_content(self.States.DEFAULT)
-        def _content() -> dict:
-            return ComponentFactory.get(
-                [f"{self.target.name}'s resources:"], self.target.resource_controller.get_resources_as_options()
-            )
+    def _default_content(self) -> dict:
+        target = self.target  # The entity to read Resource values from
+        return ComponentFactory.get(
+            [f"{target.name}'s resources:"], target.resource_controller.get_resources_as_options()
+        )
+
+    _STATE_TABLE: ClassVar[dict[Enum, StateSpec]] = {
+        Event.States.DEFAULT: StateSpec(InputType.ANY, _default_logic, _default_content)
+    }
 
     def __copy__(self):
         return ViewResourcesEvent(self.target)
@@ -702,17 +776,24 @@ class ViewResourcesEvent(EntityTargetMixin, Event):
         return ViewResourcesEvent()
 
 
+_COMBAT_EVENT_REQUIRED = (("allies", list), ("enemies", list))
+_COMBAT_EVENT_OPTIONAL = (("termination_conditions", list),)
+_COMBAT_EVENT_VALIDATOR = LoadableFactory.compile_validator(_COMBAT_EVENT_REQUIRED, _COMBAT_EVENT_OPTIONAL)
+
+
 class CombatEvent(Event):
     """
     An Event that functions as a wrapper for an instance of a CombatEngine
     object.
 
     Since only a single CombatEngine can go on the StateDeviceStack at once, the
-    instantiation of the CombatEngine is placed behind the Default state to
-    avoid premature creation.
+    instantiation of the CombatEngine is deferred to the LAUNCH_COMBAT_ENGINE
+    state to avoid premature creation.
     """
 
-    class States(Enum):
+    __slots__ = ("_allies", "_enemies", "_termination_conditions")
+
+    class States(IntEnum):
         """
         An internal state enum
         """
@@ -722,24 +803,21 @@ class CombatEvent(Event):
         TERMINATE = -1
 
     def __init__(self, allies: list[int], enemies: list[int], termination_conditions: list[TerminationHandler] = None):
-        super().__init__(InputType.SILENT, self.States, self.States.DEFAULT)
+        # DEFAULT is kept for compatibility, but the event starts directly at LAUNCH_COMBAT_ENGINE
+        super().__init__(InputType.SILENT, self.States, self.States.LAUNCH_COMBAT_ENGINE)
 
         self._allies: list[int] = allies
         self._enemies: list[int] = enemies
         self._termination_conditions: list[TerminationHandler] | None = termination_conditions
 
-        self._setup_states()
+    def _launch_combat_engine_logic(self, _: any) -> None:
+        combat = CombatEngine(self._allies, self._enemies, self._termination_conditions)
+        game.add_state_device(combat)
+        self.set_state(self.States.TERMINATE)
 
-    def _setup_states(self):
-        @self.state_logic(self.States.DEFAULT, InputType.SILENT)
-        def _logic(_: any) -> None:
-            self.set_state(self.States.LAUNCH_COMBAT_ENGINE)
-
-        @self.state_logic(self.States.LAUNCH_COMBAT_ENGINE, InputType.SILENT)
-        def _logic(_: any) -> None:
-            combat = CombatEngine(self._allies, self._enemies, self._termination_conditions)
-            game.add_state_device(combat)
-            self.set_state(self.States.TERMINATE)
+    _STATE_TABLE: ClassVar[dict[Enum, StateSpec]] = {
+        States.LAUNCH_COMBAT_ENGINE: StateSpec(InputType.SILENT, _launch_combat_engine_logic),
+    }
 
     @staticmethod
     @cached([LoadableMixin.LOADER_KEY, "CombatEvent", LoadableMixin.ATTR_KEY])
@@ -754,14 +832,10 @@ class CombatEvent(Event):
         Optional JSON fields:
         - termination_conditions: list[dict[str, any]]
         """
-        required_fields = [("allies", list), ("enemies", list)]
-
-        optional_fields = [("termination_conditions", list)]
 
-        LoadableFactory.validate_fields(required_fields, json)
-        LoadableFactory.validate_fields(optional_fields, json, False, False)
+        _COMBAT_EVENT_VALIDATOR(json)
 
-        kw = LoadableFactory.collect_optional_fields(optional_fields, json)
+        kw = LoadableFactory.collect_optional_fields(_COMBAT_EVENT_OPTIONAL, json)
         if "termination_conditions" in kw:
             # Transform embedded raw JSON blobs into TerminationCondition
             # objects by calling their JSON loaders
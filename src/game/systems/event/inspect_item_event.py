@@ -6,6 +6,7 @@ from game.cache import from_cache
 from game.structures.enums import InputType
 from game.structures.messages import ComponentFactory
 from game.systems.event import Event
+from game.systems.item.item import Equipment, Item, Usable
 
 
 class InspectItemEvent(Event):
@@ -22,33 +23,37 @@ class InspectItemEvent(Event):
 
     class States(Enum):
         DEFAULT = 0
-        CHECK_TYPE = 1
         INSPECT_ITEM = 2
         INSPECT_USABLE = 3
         INSPECT_EQUIPMENT = 4
         TERMINATE = -1
 
+    # Item types mapped to the state that inspects them, most specific first
+    _INSPECT_STATES = (
+        (Equipment, States.INSPECT_EQUIPMENT),
+        (Usable, States.INSPECT_USABLE),
+        (Item, States.INSPECT_ITEM),
+    )
+
     def __init__(self, item_id: int):
         super().__init__(InputType.SILENT, self.States, self.States.DEFAULT)
         self.item_id = item_id
         self.ref = from_cache("managers.ItemManager").get_instance(self.item_id)
 
-        @self.state_logic(self.States.DEFAULT, InputType.SILENT)
-        def _logic(_: any) -> None:
-            self.set_state(self.States.CHECK_TYPE)
+        # An item's type is fixed, so the state used to inspect it can be chosen up front
+        for item_type, state in self._INSPECT_STATES:
+            if isinstance(self.ref, item_type):
+                self._inspect_state = state
+                break
+        else:
+            raise TypeError("ref did not fetch an Item instance!")
 
-        @self.state_logic(self.States.CHECK_TYPE, InputType.SILENT)
-        def _logic(_: any) -> None:
-            from game.systems.item.item import Item, Usable, Equipment
+        # The item's summary does not change while this event is on the stack, so it is assembled on first render
+        self._content_lines: tuple | None = None
 
-            if isinstance(self.ref, Equipment):
-                self.set_state(self.States.INSPECT_EQUIPMENT)
-            elif isinstance(self.ref, Usable):
-                self.set_state(self.States.INSPECT_USABLE)
-            elif isinstance(self.ref, Item):
-                self.set_state(self.States.INSPECT_ITEM)
-            else:
-                raise TypeError("ref did not fetch an Item instance!")
+        @self.state_logic(self.States.DEFAULT, InputType.SILENT)
+        def _logic(_: any) -> None:
+            self.set_state(self._inspect_state)
 
         @self.state_logic(self.States.INSPECT_ITEM, InputType.ANY)
         def _logic(_: any) -> None:
@@ -56,8 +61,8 @@ class InspectItemEvent(Event):
 
         @self.state_content(self.States.INSPECT_ITEM)
         def _content() -> dict:
-            return ComponentFactory.get(
-                [
+            if self._content_lines is None:
+                self._content_lines = (
                     self.ref.name,
                     "'s Summary",
                     "\n",
@@ -66,8 +71,9 @@ class InspectItemEvent(Event):
                     "Market Values:",
                     "\n",
                     "\n".join([f" - {c.name}: {str(c)}" for c in self.ref.market_values]),
-                ]
-            )
+                )
+
+            return ComponentFactory.get(self._content_lines)
 
         @self.state_logic(self.States.INSPECT_USABLE, InputType.ANY)
         def _logic(_: any) -> None:
@@ -75,8 +81,8 @@ class InspectItemEvent(Event):
 
         @self.state_content(self.States.INSPECT_USABLE)
         def _content() -> dict:
-            return ComponentFactory.get(
-                [
+            if self._content_lines is None:
+                self._content_lines = (
                     self.ref.name,
                     "'s Summary",
                     "\n",
@@ -87,8 +93,9 @@ class InspectItemEvent(Event):
                     "Market Values:",
                     "\n",
                     "\n".join([f" - {c.name}: {str(c)}" for c in self.ref.market_values]),
-                ]
-            )
+                )
+
+            return ComponentFactory.get(self._content_lines)
 
         @self.state_logic(self.States.INSPECT_EQUIPMENT, InputType.ANY)
         def _logic(_: any) -> None:
@@ -103,8 +110,8 @@ class InspectItemEvent(Event):
                 * |cur.name\t|cur.value\t|
                 * item.desc
             """
-            return ComponentFactory.get(
-                [
+            if self._content_lines is None:
+                lines = [
                     self.ref.name,
                     "'s Summary",
                     "\n",
@@ -116,19 +123,20 @@ class InspectItemEvent(Event):
                     "\n",
                     "\n".join([f" - {k}: {v}" for k, v in self.ref.get_stats().items()]),
                 ]
-                + (
-                    [
+
+                if len(self.ref.tags):
+                    lines += [
                         "\n\nType Resistances:",
                         "\n",
                         "\n".join([f" - {t}: {v * 100}%" for t, v in self.ref.tags.items()]),
                     ]
-                    if len(self.ref.tags)
-                    else []
-                )
-                + [
+
+                lines += [
                     "\n\n",
                     "Market Values:",
                     "\n",
                     "\n".join([f" - {c.name}: {str(c)}" for c in self.ref.market_values]),
                 ]
-            )
+                self._content_lines = tuple(lines)
+
+            return ComponentFactory.get(self._content_lines)
@@ -1,13 +1,15 @@
-from enum import Enum
+from enum import Enum, IntEnum
+from typing import ClassVar
 
 from game.cache import from_cache
 from game.structures.enums import InputType
 from game.structures.messages import ComponentFactory
+from game.structures.state_device import StateSpec
 from game.systems.event import Event
 
 
 class ManageEquippedItemEvent(Event):
-    class States(Enum):
+    class States(IntEnum):
         DEFAULT = 0
         DISPLAY = 1
         UNEQUIP = 2
@@ -23,47 +25,51 @@ class ManageEquippedItemEvent(Event):
             from_cache("player").equipment_controller[slot].item_id
         )
 
-        @self.state_logic(self.States.DEFAULT, InputType.INT, -1, 0)
-        def _logic(user_input: int) -> None:
-            if user_input == -1:
-                self.set_state(self.States.TERMINATE)
-                return
+        # The item's summary does not change while this event is on the stack, so assemble it once
+        lines = [
+            self.ref.name,
+            "'s Summary",
+            "\n",
+            self.ref.functional_description,
+            "\n",
+            self.ref.description,
+            "\n",
+            "Stats:",
+            "\n",
+            "\n".join([f" - {k}: {v}" for k, v in self.ref.get_stats().items()]),
+        ]
 
-            if user_input == 0:
-                self.set_state(self.States.UNEQUIP)
+        if len(self.ref.tags):
+            lines += [
+                "\n\nType Resistances:",
+                "\n",
+                "\n".join([f" - {t}: {v * 100}%" for t, v in self.ref.tags.items()]),
+            ]
 
-        @self.state_content(self.States.DEFAULT)
-        def _content() -> dict:
-            return ComponentFactory.get(
-                [
-                    self.ref.name,
-                    "'s Summary",
-                    "\n",
-                    self.ref.functional_description,
-                    "\n",
-                    self.ref.description,
-                    "\n",
-                    "Stats:",
-                    "\n",
-                    "\n".join([f" - {k}: {v}" for k, v in self.ref.get_stats().items()]),
-                ]
-                + [
-                    "\n\nType Resistances:",
-                    "\n",
-                    "\n".join([f" - {t}: {v * 100}%" for t, v in self.ref.tags.items()]),
-                ]
-                if len(self.ref.tags)
-                else []
-                + [
-                    "\n\n",
-                    "Market Values:",
-                    "\n",
-                    "\n".join([f" - {c.name}: {str(c)}" for c in self.ref.market_values]),
-                ],
-                [["Unequip"]],
-            )
+        lines += [
+            "\n\n",
+            "Market Values:",
+            "\n",
+            "\n".join([f" - {c.name}: {str(c)}" for c in self.ref.market_values]),
+        ]
+        self._content_lines: tuple = tuple(lines)
 
-        @self.state_logic(self.States.UNEQUIP, InputType.SILENT)
-        def _logic(_) -> None:
-            from_cache("player").equipment_controller.unequip(self.target_slot)
+    def _default_logic(self, user_input: int) -> None:
+        if user_input == -1:
             self.set_state(self.States.TERMINATE)
+            return
+
+        if user_input == 0:
+            self.set_state(self.States.UNEQUIP)
+
+    def _default_content(self) -> dict:
+        return ComponentFactory.get(self._content_lines, (("Unequip",),))
+
+    def _unequip_logic(self, _) -> None:
+        from_cache("player").equipment_controller.unequip(self.target_slot)
+        self.set_state(self.States.TERMINATE)
+
+    _STATE_TABLE: ClassVar[dict[Enum, StateSpec]] = {
+        States.DEFAULT: StateSpec(InputType.INT, _default_logic, _default_content, -1, 0),
+        States.UNEQUIP: StateSpec(InputType.SILENT, _unequip_logic),
+    }
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Sequence
 from enum import Enum
-from typing import Callable, Iterable
+from typing import ClassVar
 
 from game.cache import request_storage_key, store_element, from_cache, loader
 from game.structures.enums import InputType
 from game.structures.messages import ComponentFactory
+from game.structures.state_device import StateSpec
+from game.systems.entity.entities import CombatEntity, Entity, Player
+from game.systems.entity.mixins.inventory_mixin import InventoryMixin
 from game.systems.event import Event
+from game.systems.item.item import Equipment, Usable
 
 
 class SelectElementEvent(Event):
@@ -44,84 +49,106 @@ class SelectElementEvent(Event):
 
     def __init__(
         self,
-        collection: list,
+        collection: Sequence,
         key: Callable,
         element_filter: Callable = None,
         to_listing: Callable = str,
         prompt: str = "Choose an element",
         must_select: bool = True,
     ):
-        super().__init__(default_input_type=InputType.SILENT, states=self.States, default_state=self.States.DEFAULT)
+        # Without a filter, the collection is shown as-is and DEFAULT has nothing to do, so start in SHOW_ELEMENTS
+        if element_filter is None:
+            super().__init__(
+                default_input_type=InputType.INT, states=self.States, default_state=self.States.SHOW_ELEMENTS
+            )
+        else:
+            super().__init__(default_input_type=InputType.SILENT, states=self.States, default_state=self.States.DEFAULT)
 
         self._element_filter: Callable = element_filter
-        self._collection: list = collection
+        self._collection: Sequence = collection
         self._key: Callable = key
 
-        # A pre-built dict to hold storage keys
-        self._storage_keys: dict[str, any] = {"selected_element": None}
+        # Storage key for the selected element, acquired when the event is linked
+        self._selected_element_key: str | None = None
 
         self._prompt: str = prompt
         self._to_listing: Callable = to_listing
         self._must_select: bool = must_select
 
         # Temp values
-        self.__filtered_collection: list | None = None
+        self.__filtered_collection: Sequence | None = None
         self.__filtered_collection_len: int | None = None
+        self.__listings: list[str] | None = None
 
         if len(self._collection) < 1:
             raise RuntimeError("Cannot instantiate a SelectElementEvent with a collection of size 0!")
 
-        self._setup_states()
+        if element_filter is None:
+            self.__filtered_collection = self._collection
+            self.__filtered_collection_len = len(self._collection)
 
     def _link(self) -> dict[str, str]:
         """
         Override default link logic to store
         """
         # Storage key for the selected element data
-        self._storage_keys["selected_element"] = request_storage_key()
-        return self._storage_keys
-
-    def _setup_states(self) -> None:
-        # DEFAULT
-        @self.state_logic(self.States.DEFAULT, InputType.SILENT)
-        def _logic(_: any) -> None:
-            # Check for a filter and use it if available
-            if self._element_filter is not None:
-                self.__filtered_collection = [element for element in self._collection if self._element_filter(element)]
-            else:
+        self._selected_element_key = request_storage_key()
+        return {"selected_element": self._selected_element_key}
+
+    def _default_logic(self, _: any) -> None:
+        # Check for a filter and use it if available
+        if self._element_filter is not None:
+            self.__filtered_collection = [element for element in self._collection if self._element_filter(element)]
+
+            # If nothing was filtered out, drop the copy and use the original collection
+            if len(self.__filtered_collection) == len(self._collection):
                 self.__filtered_collection = self._collection
+        else:
+            self.__filtered_collection = self._collection
 
-            # Pre-compute len of remaining items
-            self.__filtered_collection_len = len(self.__filtered_collection)
+        # Pre-compute len of remaining items
+        self.__filtered_collection_len = len(self.__filtered_collection)
 
-            # Check for broken collections
-            if self.__filtered_collection_len < 1:
-                raise RuntimeError("SelectElementEvent cannot have a filtered collection size of 0!")
-            self.set_state(self.States.SHOW_ELEMENTS)
+        # Check for broken collections
+        if self.__filtered_collection_len < 1:
+            raise RuntimeError("SelectElementEvent cannot have a filtered collection size of 0!")
 
-        # SHOW_ELEMENTS
-        @self.state_logic(
-            self.States.SHOW_ELEMENTS,
-            InputType.INT,
-            input_min=0 if self._must_select else -1,
-            input_max=lambda: int(self.__filtered_collection_len) - 1,
-        )
-        def _logic(user_input: int) -> None:
-            """
-            If the user chooses to 'go back' via entering -1, None will be
-            stored. Otherwise, the _key transformation will occur and the
-            resulting value will be stored.
-            """
-            if user_input == -1 and not self._must_select:
-                store_element(self._storage_keys["selected_element"], None)
-            else:
-                store_element(self._storage_keys["selected_element"], self._key(self.__filtered_collection[user_input]))
+        # Listings must be re-rendered for the new filtered collection
+        self.__listings = None
+        self.set_state(self.States.SHOW_ELEMENTS)
+
+    def _show_elements_min(self) -> int:
+        return 0 if self._must_select else -1
+
+    def _show_elements_max(self) -> int:
+        return self.__filtered_collection_len - 1
+
+    def _show_elements_logic(self, user_input: int) -> None:
+        """
+        If the user chooses to 'go back' via entering -1, None will be
+        stored. Otherwise, the _key transformation will occur and the
+        resulting value will be stored.
+        """
+        if user_input == -1 and not self._must_select:
+            store_element(self._selected_element_key, None)
+        else:
+            store_element(self._selected_element_key, self._key(self.__filtered_collection[user_input]))
+
+        self.set_state(self.States.TERMINATE)
 
-            self.set_state(self.States.TERMINATE)
+    def _show_elements_content(self) -> dict:
+        # Render each listing once rather than on every redraw of SHOW_ELEMENTS
+        if self.__listings is None:
+            self.__listings = [self._to_listing(e) for e in self.__filtered_collection]
 
-        @self.state_content(self.States.SHOW_ELEMENTS)
-        def _content():
-            return ComponentFactory.get([self._prompt], [self._to_listing(e) for e in self.__filtered_collection])
+        return ComponentFactory.get((self._prompt,), self.__listings)
+
+    _STATE_TABLE: ClassVar[dict[Enum, StateSpec]] = {
+        States.DEFAULT: StateSpec(InputType.SILENT, _default_logic),
+        States.SHOW_ELEMENTS: StateSpec(
+            InputType.INT, _show_elements_logic, _show_elements_content, _show_elements_min, _show_elements_max
+        ),
+    }
 
     @staticmethod
     @loader("SelectElementEvent")
@@ -153,23 +180,20 @@ class SelectElementEventFactory:
         # If only_castable is True, create an inner function to act as the
         # filter.
         if only_requirements_met is True:
+            get_ability = from_cache("managers.AbilityManager").get_instance
 
             def test_for_usable_ability(ability_name) -> bool:
                 """
                 Access the AbilityManager to get an instance of the Ability,
                 then test its requirements against the given CombatEntity.
                 """
-                inst = from_cache("managers.AbilityManager").get_instance(ability_name)
-                print(inst)
-                return inst.is_requirements_fulfilled(combat_entity)
+                return get_ability(ability_name).is_requirements_fulfilled(combat_entity)
 
             ability_filter = test_for_usable_ability
 
-        abilities = list(combat_entity.ability_controller.abilities)
-        abilities.sort()
         event = SelectElementEvent(
-            collection=abilities,
-            key=lambda x: str(x),
+            collection=combat_entity.ability_controller.sorted_abilities,
+            key=str,
             element_filter=ability_filter,
             prompt="Select an ability:",
             must_select=must_select,
@@ -206,8 +230,6 @@ class SelectElementEventFactory:
         """
 
         if combat_entity is not None:
-            from game.systems.entity.entities import CombatEntity
-
             if not isinstance(combat_entity, CombatEntity):
                 raise TypeError("combat_entity must be an instance of CombatEntity!")
         else:
@@ -219,8 +241,6 @@ class SelectElementEventFactory:
         # id-quantity tuples
         collection: list[tuple[int, int]] | None = None
 
-        from game.systems.entity.mixins.inventory_mixin import InventoryMixin
-
         if collection_override is None:
             collection = [(stack.id, stack.quantity) for stack in combat_entity.inventory.items]
 
@@ -233,39 +253,38 @@ class SelectElementEventFactory:
         elif isinstance(collection_override, list):
             if len(collection_override) < 1:
                 raise ValueError("list typed collection overrides must be of size > 0")
-            if (
-                not isinstance(collection_override[0], tuple)
-                or not isinstance(collection_override[0][0], int)
-                or not isinstance(collection_override[0][1], int)
-            ):
+            first = collection_override[0]
+            if not isinstance(first, tuple) or not isinstance(first[0], int) or not isinstance(first[1], int):
                 raise ValueError("list typed collection overrides must only contain objects of type tuple[int, int]")
             collection = collection_override
 
-        # Define an inner-function to handle translating the tuple to a str
-        def to_listing(stack_tuple: tuple[int, int]) -> str:
+        # Fetch each stack's Item once so that the filter and the listing can share the same instance
+        get_item = from_cache("managers.ItemManager").get_instance
+        stacks = [(item_id, quantity, get_item(item_id)) for item_id, quantity in collection]
+
+        # Define an inner-function to handle translating the stack to a str
+        def to_listing(stack: tuple[int, int, any]) -> str:
             """
-            Translate an id-stack tuple into a string with
+            Translate an id-quantity-item stack into a string with
             item.name xitem.quantity
             """
-            instance = from_cache("managers.ItemManager").get_instance(stack_tuple[0])
-            return f"{instance.name}\tx{stack_tuple[1]}"
+            return f"{stack[2].name}\tx{stack[1]}"
 
-        def usable_filter(stack_tuple: tuple[int, int]):
-            instance = from_cache("managers.ItemManager").get_instance(stack_tuple[0])
-
-            from game.systems.item.item import Usable
+        # Pick the filter once, rather than re-checking only_requirements_met for every stack
+        if only_requirements_met is True:
 
-            if not isinstance(instance, Usable):
-                return False
+            def usable_filter(stack: tuple[int, int, any]):
+                instance = stack[2]
+                return isinstance(instance, Usable) and instance.is_requirements_fulfilled(combat_entity)
 
-            if only_requirements_met is True and (not instance.is_requirements_fulfilled(combat_entity)):
-                return False
+        else:
 
-            return True
+            def usable_filter(stack: tuple[int, int, any]):
+                return isinstance(stack[2], Usable)
 
         event = SelectElementEvent(
-            collection=collection,
-            key=lambda stack_tuple: stack_tuple[0],  # Get item.id from stack
+            collection=stacks,
+            key=lambda stack: stack[0],  # Get item.id from stack
             element_filter=usable_filter,
             prompt="Select an item to use:",
             to_listing=to_listing,
@@ -277,7 +296,7 @@ class SelectElementEventFactory:
     @classmethod
     def get_select_entity_event(
         cls,
-        collection: list,
+        collection: Sequence,
         fields_of_interest: tuple[str] = None,
         allow_player: bool = False,
         must_select: bool = False,
@@ -292,7 +311,7 @@ class SelectElementEventFactory:
 
         Args:
             collection:
-                A list of Entity objects from which to select
+                A sequence of Entity objects from which to select
             fields_of_interest: tuple[str]:
                 A collection of variable names to inject into the to_listing
                 function.
@@ -303,7 +322,7 @@ class SelectElementEventFactory:
         Returns: None
         """
 
-        if not isinstance(collection, list):
+        if not isinstance(collection, Sequence):
             raise TypeError()
 
         if not isinstance(must_select, bool):
@@ -311,8 +330,6 @@ class SelectElementEventFactory:
 
         foi = fields_of_interest or tuple(["name"])
 
-        from game.systems.entity.entities import Entity, Player
-
         # Define an inner-function to handle translating the entities to strings
         def to_listing(entity: Entity) -> str:
             if not isinstance(entity, Entity):
@@ -342,7 +359,7 @@ class SelectElementEventFactory:
     @classmethod
     def get_select_equipment_event(
         cls,
-        collection: list,
+        collection: Sequence,
         only_requirements_met: bool = False,
         fields_of_interest: Iterable[str] = tuple(["name"]),
         must_select: bool = False,
@@ -357,7 +374,7 @@ class SelectElementEventFactory:
 
         Args:
             collection:
-                A list of Entity objects from which to select
+                A sequence of Entity objects from which to select
             only_requirements_met:
                 If True only show equipment that the player is qualified to use
             fields_of_interest: tuple[str]:
@@ -370,7 +387,7 @@ class SelectElementEventFactory:
         equipment from an Inventory.
         """
 
-        if not isinstance(collection, list):
+        if not isinstance(collection, Sequence):
             raise TypeError()
 
         if not isinstance(only_requirements_met, bool):
@@ -382,8 +399,6 @@ class SelectElementEventFactory:
         if not hasattr(fields_of_interest, "__iter__"):
             raise TypeError()
 
-        from game.systems.item.item import Equipment
-
         # Define an inner-function to handle translating Equipment to strings
         def to_listing(equipment: Equipment) -> str:
             if not isinstance(equipment, Equipment):
@@ -401,12 +416,19 @@ class SelectElementEventFactory:
 
             return " ".join(field_values)
 
+        equipment_filter = None
+
+        # Resolve the player once for the filter, rather than once per Equipment
+        if only_requirements_met:
+            player = from_cache("player")
+
+            def equipment_filter(equipment: Equipment) -> bool:
+                return equipment.is_requirements_fulfilled(player)
+
         event = SelectElementEvent(
             collection=collection,
             key=lambda e: e,
-            element_filter=None
-            if not only_requirements_met
-            else lambda e: e.is_requirements_fulfilled(from_cache("player")),
+            element_filter=equipment_filter,
             prompt="Select an Equipment",
             to_listing=to_listing,
             must_select=must_select,
@@ -64,7 +64,7 @@ class SelectItemEvent(EntityTargetMixin, Event):
 
         @self.state_content(self.States.SHOW_ITEMS)
         def _content():
-            return ComponentFactory.get(["Choose an item:"], self.target.inventory.to_options(self._inventory_filter))
+            return ComponentFactory.get(("Choose an item:",), self.target.inventory.to_options(self._inventory_filter))
 
     @staticmethod
     @cached([LoadableMixin.LOADER_KEY, "SelectItemEvent", LoadableMixin.ATTR_KEY])
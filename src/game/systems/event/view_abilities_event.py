@@ -36,6 +36,7 @@ class ViewAbilitiesEvent(Event):
         self.target = target  # Defaults to the player at runtime
         self.selected_ability: str | None = None
         self._selected_instance = None
+        self._abilities: tuple[str, ...] = ()  # A snapshot of the target's abilities, taken on entering DEFAULT
 
         @self.state_logic(self.States.DEFAULT, InputType.SILENT)
         def _logic(_: any) -> None:
@@ -50,25 +51,22 @@ class ViewAbilitiesEvent(Event):
             if not isinstance(self.target, AbilityMixin):
                 raise TypeError(f"Cannot view Abilities for non-AbilityMixin entity! ({self.target})")
 
-            if len(self.target.ability_controller.abilities) < 1:
+            self._abilities = tuple(self.target.ability_controller.abilities)
+
+            if len(self._abilities) < 1:
                 self.set_state(self.States.EMPTY)
                 return
 
             self.set_state(self.States.VIEW_ABILITIES)
 
-        # This state is highly inefficient. TODO: Improve
-        @self.state_logic(
-            self.States.VIEW_ABILITIES,
-            InputType.INT,
-            -1,
-            lambda: len(list(self.target.ability_controller.abilities)) - 1,
-        )
+        # The target's abilities cannot change while they are being viewed, so use the snapshot taken in DEFAULT
+        @self.state_logic(self.States.VIEW_ABILITIES, InputType.INT, -1, lambda: len(self._abilities) - 1)
         def _logic(user_input: int) -> None:
             if user_input == -1:
                 self.set_state(self.States.TERMINATE)
                 return
 
-            self.selected_ability = list(self.target.ability_controller.abilities)[user_input]
+            self.selected_ability = self._abilities[user_input]
             self.set_state(self.States.INSPECT_ABILITY)
 
         @self.state_content(self.States.VIEW_ABILITIES)
@@ -100,7 +98,7 @@ class ViewAbilitiesEvent(Event):
 
         @self.state_content(self.States.EMPTY)
         def _content() -> dict:
-            return ComponentFactory.get(["No learned abilities!"])
+            return ComponentFactory.get(("No learned abilities!",))
 
     @staticmethod
     @cached([LoadableMixin.LOADER_KEY, "ViewAbilitiesEvent", LoadableMixin.ATTR_KEY])
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from typing import TYPE_CHECKING
 
 import game
 from game.structures.enums import InputType
@@ -10,6 +11,9 @@ from game.systems.event import Event
 from game.systems.event.events import EntityTargetMixin
 from game.systems.event.manage_equipped_item_event import ManageEquippedItemEvent
 
+if TYPE_CHECKING:
+    from game.systems.inventory import EquipmentController
+
 
 class ViewEquipmentEvent(EntityTargetMixin, Event):
     class States(Enum):
@@ -30,11 +34,37 @@ class ViewEquipmentEvent(EntityTargetMixin, Event):
 
         self._inspect_item_slot: str = None
 
+        # The enabled slots and their rendered options, along with the controller and version they were built from
+        self._slots_cache: list[str] | None = None
+        self._options_cache: list | None = None
+        self._cache_controller: EquipmentController | None = None
+        self._cache_version: int | None = None
+
         if not isinstance(self.target, CombatEntity):
             raise TypeError(f"ViewEquipmentEvent.target must be of type CombatEntity! Got {type(self.target)} instead.")
 
         self._setup_states()
 
+    def _refresh_caches(self) -> None:
+        """
+        Rebuild the cached slots and options if the target's equipment has changed since they were last built.
+
+        Every write to a slot bumps the controller's version, including ones made directly on an EquipSlot. The
+        controller itself is compared too, since a replacement controller may happen to be at the same version.
+        """
+        equipment_controller = self.target.equipment_controller
+        if self._cache_controller is equipment_controller and self._cache_version == equipment_controller.version:
+            return
+
+        self._slots_cache = equipment_controller.enabled_slots
+        self._options_cache = equipment_controller.get_equipment_as_options()
+        self._cache_controller = equipment_controller
+        self._cache_version = equipment_controller.version
+
+    def _display_equipment_max(self) -> int:
+        self._refresh_caches()
+        return len(self._slots_cache) - 1
+
     def _setup_states(self):
         @self.state_logic(self.States.DEFAULT, InputType.SILENT)
         def _logic(_: any) -> None:
@@ -44,14 +74,15 @@ class ViewEquipmentEvent(EntityTargetMixin, Event):
             self.States.DISPLAY_EQUIPMENT,
             InputType.INT,
             input_min=-1,
-            input_max=lambda: len(self.target.equipment_controller.enabled_slots) - 1,
+            input_max=self._display_equipment_max,
         )
         def _logic(user_input: int) -> None:
             if user_input == -1:
                 self.set_state(self.States.TERMINATE)
                 return
 
-            slot = self.target.equipment_controller.enabled_slots[user_input]
+            self._refresh_caches()
+            slot = self._slots_cache[user_input]
             if self.target.equipment_controller[slot].item_id is None:
                 self.set_state(self.States.SLOT_IS_EMPTY)
                 return
@@ -61,9 +92,8 @@ class ViewEquipmentEvent(EntityTargetMixin, Event):
 
         @self.state_content(self.States.DISPLAY_EQUIPMENT)
         def _content() -> dict:
-            return ComponentFactory.get(
-                [self.target.name, "'s Equipment:"], self.target.equipment_controller.get_equipment_as_options()
-            )
+            self._refresh_caches()
+            return ComponentFactory.get([self.target.name, "'s Equipment:"], self._options_cache)
 
         @self.state_logic(self.States.SLOT_IS_EMPTY, InputType.ANY)
         def _logic(_: any) -> None:
@@ -71,7 +101,7 @@ class ViewEquipmentEvent(EntityTargetMixin, Event):
 
         @self.state_content(self.States.SLOT_IS_EMPTY)
         def _content() -> dict:
-            return ComponentFactory.get(["This equipment slot is empty."])
+            return ComponentFactory.get(("This equipment slot is empty.",))
 
         @self.state_logic(self.States.INSPECT_EQUIPMENT, InputType.SILENT)
         def _logic(_: any) -> None:
@@ -90,7 +90,7 @@ class ViewInventoryEvent(EntityTargetMixin, Event):
 
         @self.state_content(self.States.CHOOSE_ITEM)
         def _content() -> dict:
-            return ComponentFactory.get(["What stack would you like to inspect?"], self.target.inventory.to_options())
+            return ComponentFactory.get(("What stack would you like to inspect?",), self.target.inventory.to_options())
 
         @self.state_logic(self.States.CALCULATE_INSPECTION_OPTIONS, InputType.SILENT)
         def _logic(_: any) -> None:
@@ -43,7 +43,7 @@ class ViewSkillsEvent(Event):
 
         @self.state_content(self.States.VIEW_SKILLS)
         def _content() -> dict:
-            return ComponentFactory.get(["Skills: "], self.target.skill_controller.get_skills_as_options())
+            return ComponentFactory.get(("Skills: ",), self.target.skill_controller.get_skills_as_options())
 
         @self.state_logic(self.States.SKILL_SELECTED, InputType.ANY)
         def _logic(_: any) -> None:
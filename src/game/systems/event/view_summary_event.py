@@ -86,7 +86,7 @@ class ViewSummaryEvent(Event):
 
         @self.state_content(self.States.DEFAULT)
         def _content() -> dict:
-            return ComponentFactory.get(["What would you like to do?"], self.options)
+            return ComponentFactory.get(("What would you like to do?",), self.options)
 
     def __copy__(self):
         return ViewSummaryEvent(self.target)
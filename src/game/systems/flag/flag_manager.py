@@ -1,3 +1,5 @@
+from collections.abc import Iterable
+
 from game.structures.manager import Manager
 from game.util.asset_utils import get_asset
 
@@ -7,10 +9,15 @@ class FlagManager(Manager):
 
     def __init__(self):
         super().__init__()
-        self._manifest: dict[str, any] = {}
+
+        # Flags are stored flat, keyed by their full dotted path. Every subgroup implied by a stored key (for example,
+        # "some" for some.flag) is recorded in _prefixes so that collisions can be detected without walking a tree.
+        self._manifest: dict[str, bool] = {}
+        self._prefixes: set[str] = set()
 
     def clear(self) -> None:
         self._manifest = {}
+        self._prefixes = set()
 
     def get_flag(self, key: str) -> bool:
         """
@@ -22,21 +29,16 @@ class FlagManager(Manager):
         TXEngine Flags are slightly different from exact str-bool mappings. A Flag may define itself to be a part of a
         flag "subgroup" using dot-notation.
         For example:
-         - A flag with a key of some.flag = True would store itself in the flags cache as flags['some']['flag'] = True
-         - A flag with a key of this.is.a.deep.flag = False would be flags['this']['is']['a']['deep']['flag'] = False
-        """
+         - A flag with a key of some.flag = True is a member of the subgroup 'some'
+         - A flag with a key of this.is.a.deep.flag = False is a member of the subgroups 'this', 'this.is', and so on
 
-        level: dict | bool = self._manifest
-        for part in key.split("."):
-            if part not in level:
-                return False
-
-            level = level[part]
+        A subgroup is not itself a flag, so getting the value of a key that names a subgroup raises a KeyError.
+        """
 
-        if type(level) is not bool:
-            raise KeyError(f"Flag {key} not found! {key} points to a dict.")
+        if key in self._prefixes:
+            raise KeyError(f"Flag {key} not found! {key} is a flag subgroup.")
 
-        return level
+        return self._manifest.get(key, False)
 
     def set_flag(self, key: str, value: bool) -> None:
         """
@@ -45,8 +47,11 @@ class FlagManager(Manager):
         TXEngine Flags are slightly different from exact str-bool mappings. A Flag may define itself to be a part of a
         flag "subgroup" using dot-notation.
         For example:
-         - A flag with a key of some.flag = True would store itself in the flags cache as flags['some']['flag'] = True
-         - A flag with a key of this.is.a.deep.flag = False would be flags['this']['is']['a']['deep']['flag'] = False
+         - A flag with a key of some.flag = True is a member of the subgroup 'some'
+         - A flag with a key of this.is.a.deep.flag = False is a member of the subgroups 'this', 'this.is', and so on
+
+        A flag may not share its key with a subgroup. Setting a flag that would collide with an existing subgroup, or
+        whose subgroups would collide with an existing flag, raises a KeyError.
         """
 
         if type(key) is not str:
@@ -55,30 +60,33 @@ class FlagManager(Manager):
         if type(value) is not bool:
             raise TypeError(f"Cannot set flag {key} to value of type {type(value)}! Value must be of type bool.")
 
-        if "." not in key:
-            self._manifest[key] = value
+        if key in self._prefixes:
+            raise KeyError(f"Cannot set flag {key}, a collision with subgroup {key} was found!")
+
+        if "." in key and key not in self._manifest:
+            # Collect each subgroup of the key, checking that none of them is already a flag
+            prefixes = []
+            end = key.find(".")
+            while end != -1:
+                prefix = key[:end]
+                if prefix in self._manifest:
+                    raise KeyError(f"Cannot set flag {key}, a collision with key {prefix} was found!")
 
-        else:
-            level = self._manifest  # Record only deepest dict visited so far, starting with the root of the flags dict
-            parts = key.split(".")  # Split the key into sub-keys
+                prefixes.append(prefix)
+                end = key.find(".", end + 1)
 
-            # For each sub-key except the last one, traverse through the flags dict, creating new dicts where needed
-            for i in range(len(parts) - 1):
-                # If a new dict must be made
-                if parts[i] not in level:
-                    level[parts[i]] = {}
-                    level = level[parts[i]]
+            self._prefixes.update(prefixes)
 
-                # If a flag exists in the way of creating a new dict, raise an error
-                elif type(level[parts[i]]) is not dict:
-                    raise KeyError(f"Cannot set flag {key}, a collision with key {'.'.join(parts[:i])} was found!")
+        self._manifest[key] = value
 
-                # If the dict already exists, traverse to it
-                else:
-                    level = level[parts[i]]
+    def set_flags(self, flags: Iterable[tuple[str, bool]]) -> None:
+        """
+        Sets each flag in a collection of (key, value) pairs. Equivalent to calling set_flag on each pair in order.
+        """
 
-            # Set the final sub-key's value in the lowest-traversed dict
-            level[parts[-1]] = value
+        set_flag = self.set_flag
+        for key, value in flags:
+            set_flag(key, value)
 
     def load(self) -> None:
         raw_asset: dict[str, dict[str, bool]] = get_asset(self.FLAG_ASSET_PATH)
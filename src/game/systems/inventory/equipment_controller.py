@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import copy
+import weakref
+from collections.abc import Callable
+from typing import ClassVar
+
 from loguru import logger
 
 import game
@@ -7,11 +12,7 @@ from game.cache import get_cache, cached, from_cache
 from game.structures.loadable import LoadableMixin
 from game.structures.loadable_factory import LoadableFactory
 from game.structures.messages import StringContent
-
-from typing import TYPE_CHECKING
-
-if TYPE_CHECKING:
-    from game.systems.inventory.structures import EquipSlot
+from game.systems.inventory.structures import EquipSlot
 
 
 class EquipmentController(LoadableMixin):
@@ -26,12 +27,36 @@ class EquipmentController(LoadableMixin):
     are ignored.
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_dmg_resistance",
+        "_dmg_resistance_version",
+        "_owner",
+        "_slots",
+        "_tag_resistance",
+        "_tag_resistance_version",
+        "player_mode",
+        "version",
+    )
+
     def __init__(self, owner=None, equipment: list[int] = None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.owner = owner
         self.player_mode: bool = False
         self._slots: dict[str, EquipSlot] = get_cache()["managers"]["EquipmentManager"].get_slots()
 
+        # Incremented by the slots on every change to them, so that views of the equipment can tell when they are stale
+        self.version: int = 0
+        self._adopt_slots()
+
+        # all_tag_resistance, along with the version it was collected at
+        self._tag_resistance: dict[str, list[float]] | None = None
+        self._tag_resistance_version: int | None = None
+
+        # total_dmg_resistance, along with the version it was summed at
+        self._dmg_resistance: int | None = None
+        self._dmg_resistance_version: int | None = None
+
         # If the equipment list is not None
         if equipment is not None and isinstance(equipment, list):
             # For each equipment id
@@ -59,6 +84,37 @@ class EquipmentController(LoadableMixin):
     def __contains__(self, item: str) -> bool:
         return self._slots.__contains__(item)
 
+    def __deepcopy__(self, memo: dict[int, any]) -> EquipmentController:
+        """
+        Copy the controller along with the entity that owns it, as EntityManager does for every new entity instance.
+
+        An EquipSlot only holds immutable values, so the slots are rebuilt directly rather than walked by deepcopy. This
+        also leaves each slot's cached Equipment instance behind. Only the owner needs a real deep copy.
+        """
+        clone = EquipmentController.__new__(EquipmentController)
+        memo[id(self)] = clone
+
+        clone._owner = copy.deepcopy(self._owner, memo)
+        clone.player_mode = self.player_mode
+        clone._slots = {key: EquipSlot(slot.name, slot.item_id, slot.enabled) for key, slot in self._slots.items()}
+        clone.version = self.version
+        clone._adopt_slots()
+        clone._tag_resistance = None
+        clone._tag_resistance_version = None
+        clone._dmg_resistance = None
+        clone._dmg_resistance_version = None
+
+        return clone
+
+    def _adopt_slots(self) -> None:
+        """
+        Point each slot back at this controller, so that writes made directly to a slot (for example
+        `EquipSlot.unlock`) still bump `version`. The reference is weak, so a slot does not keep its controller alive.
+        """
+        controller_ref = weakref.ref(self)
+        for slot in self._slots.values():
+            slot._controller = controller_ref
+
     def __getitem__(self, item: str) -> EquipSlot:
         return self._slots.__getitem__(item)
 
@@ -75,33 +131,44 @@ class EquipmentController(LoadableMixin):
         if key not in self._slots:
             raise KeyError(f"Unknown slot: {key}!")
 
-        # If value is a bool, treat is an enable/disable slot
-        if type(value) is bool:
-            self._slots[key].enabled = value
+        setter = self._SETTERS.get(type(value))
+        if setter is None:
+            raise TypeError(f"Unknown type for value! Expected int, bool, or None. Got {type(value)}!")
 
-        # If an int, treat it as set-id
-        elif type(value) is int:
-            from game.systems.item import item_manager
+        setter(self, key, value)
 
-            ref = item_manager.get_ref(value)
+    def _set_enabled(self, key: str, value: bool) -> None:
+        """
+        Enable or disable a slot.
+        """
+        self._slots[key].enabled = value
 
-            from game.systems.item.item import Equipment
+    def _set_item_id(self, key: str, value: int) -> None:
+        """
+        Place an item in a slot, checking that the item is an Equipment that fits the slot.
+        """
+        from game.systems.item import item_manager
 
-            if not isinstance(ref, Equipment):
-                raise ValueError(f"Cannot assign item {str(ref)} to slot {key}! Item {str(ref)} is not an Equipment!")
+        ref = item_manager.get_ref(value)
 
-            if ref.slot != key:
-                raise ValueError(f"Cannot assign item {str(ref)} to slot {key}! Wrong slot! {key} != {ref.slot}")
+        from game.systems.item.item import Equipment
 
-            self._slots[key].item_id = value
+        if not isinstance(ref, Equipment):
+            raise ValueError(f"Cannot assign item {str(ref)} to slot {key}! Item {str(ref)} is not an Equipment!")
 
-        # If None, treat it as clear-slot
-        elif value is None:
-            self._slots[key].item_id = value
+        if ref.slot != key:
+            raise ValueError(f"Cannot assign item {str(ref)} to slot {key}! Wrong slot! {key} != {ref.slot}")
 
-        # That's not right
-        else:
-            raise TypeError(f"Unknown type for value! Expected int, bool, or None. Got {type(value)}!")
+        self._slots[key].item_id = value
+
+    def _clear_item_id(self, key: str, _: None) -> None:
+        """
+        Empty a slot.
+        """
+        self._slots[key].item_id = None
+
+    # Maps the exact type of a value passed to __setitem__ to the method that applies it
+    _SETTERS: ClassVar[dict[type, Callable]] = {bool: _set_enabled, int: _set_item_id, type(None): _clear_item_id}
 
     def equip(self, item_id: int) -> bool:
         """
@@ -119,29 +186,29 @@ class EquipmentController(LoadableMixin):
 
         from game.systems.item.item import Equipment
 
-        if isinstance(item_ref, Equipment):
-            if not self._slots[item_ref.slot].enabled:
-                raise RuntimeError(
-                    f"Cannot equip {item_ref.name} to slot {item_ref.slot} since slot {item_ref.slot} is disabled."
-                )
+        if not isinstance(item_ref, Equipment):
+            raise TypeError(f"Cannot equip item of type {type(item_ref)}! Expected item of type Equipment")
 
-            # If operating in player mode, check for quantity and requirements
-            if self.player_mode:
-                if not item_ref.is_requirements_fulfilled(self._owner):
-                    return False
+        if not self._slots[item_ref.slot].enabled:
+            raise RuntimeError(
+                f"Cannot equip {item_ref.name} to slot {item_ref.slot} since slot {item_ref.slot} is disabled."
+            )
 
-                if self._owner.inventory.total_quantity(item_ref.id) < 1:
-                    return False
+        # If operating in player mode, check for quantity and requirements
+        if self.player_mode:
+            if not item_ref.is_requirements_fulfilled(self._owner):
+                return False
 
-                # Consume item from inventory before equipping
-                self._owner.inventory.consume_item(item_ref.id, 1)
+            if self._owner.inventory.total_quantity(item_ref.id) < 1:
+                return False
 
-            self.unequip(item_ref.slot)  # Attempt to unequip existing item
-            self[item_ref.slot] = item_id  # Set slot id to item id
+            # Consume item from inventory before equipping
+            self._owner.inventory.consume_item(item_ref.id, 1)
 
-            return True
+        self.unequip(item_ref.slot)  # Attempt to unequip existing item
+        self[item_ref.slot] = item_id  # Set slot id to item id
 
-        raise TypeError(f"Cannot equip item of type {type(item_ref)}! Expected item of type Equipment")
+        return True
 
     def unequip(self, slot: str) -> bool:
         """
@@ -153,13 +220,15 @@ class EquipmentController(LoadableMixin):
         returns: True if the slot is enabled, false otherwise
         """
 
-        if not get_cache()["managers"]["EquipmentManager"].is_valid_slot(slot):
+        # The controller's own slots mirror the EquipmentManager's, so they are enough to validate the slot name
+        slot_obj = self._slots.get(slot)
+        if slot_obj is None:
             raise ValueError(f"Unknown slot: {slot}!")
 
-        if not self._slots[slot].enabled:
+        if not slot_obj.enabled:
             return False
 
-        temp = self[slot].item_id
+        temp = slot_obj.item_id
 
         # Add-item-event to handle moving the item back in player inventory
         if self.player_mode and temp is not None:
@@ -169,7 +238,9 @@ class EquipmentController(LoadableMixin):
         elif not self.player_mode and temp is not None:
             self.owner.inventory.new_stack(temp, 1)
 
-        self[slot] = None
+        if temp is not None:
+            slot_obj.item_id = None
+
         return True
 
     def get_equipment_as_options(self) -> list[list[str | StringContent]]:
@@ -192,17 +263,18 @@ class EquipmentController(LoadableMixin):
         """
         from game.systems.entity import Entity, Player
 
-        if entity is not None and not isinstance(entity, Entity):
-            raise TypeError(f"Cannot assign an owner of type {type(entity)}, owner must of type entities.Entity")
-
-        elif isinstance(entity, Player):
+        # Player is the most specific case, so it is checked first; every other owner needs only one more check
+        if isinstance(entity, Player):
             self._owner = entity
             self.player_mode = True
 
-        else:
+        elif entity is None or isinstance(entity, Entity):
             self._owner = entity
             self.player_mode = False
 
+        else:
+            raise TypeError(f"Cannot assign an owner of type {type(entity)}, owner must of type entities.Entity")
+
     @property
     def enabled_slots(self) -> list[str]:
         return [slot for slot in self._slots if self._slots[slot].enabled]
@@ -211,15 +283,20 @@ class EquipmentController(LoadableMixin):
     def total_dmg_resistance(self) -> int:
         """
         Calculate and return the total resistance of equipment attached to the
-        entity in all enabled slots
+        entity in all enabled slots. Like all_tag_resistance, the total is cached until the equipment changes.
         """
+        if self._dmg_resistance_version == self.version:
+            return self._dmg_resistance
+
         instances = [
             from_cache("managers.ItemManager").get_instance(s.item_id)
             for s in self._slots.values()
             if (s.enabled and s.item_id is not None)
         ]
 
-        return sum([e.damage_resist for e in instances])
+        self._dmg_resistance = sum([e.damage_resist for e in instances])
+        self._dmg_resistance_version = self.version
+        return self._dmg_resistance
 
     @property
     def total_dmg_buff(self) -> int:
@@ -238,8 +315,13 @@ class EquipmentController(LoadableMixin):
     @property
     def all_tag_resistance(self) -> dict[str, list[float]]:
         """
-        Collect and return lists of tag resistances from all enabled slots
+        Collect and return lists of tag resistances from all enabled slots.
+
+        The result is cached until the equipment changes, so combat can look it up for every hit without re-fetching
+        each Equipment. Callers must not mutate it.
         """
+        if self._tag_resistance_version == self.version:
+            return self._tag_resistance
 
         instances = [
             from_cache("managers.ItemManager").get_instance(s.item_id)
@@ -254,6 +336,8 @@ class EquipmentController(LoadableMixin):
 
                 total_tags[tag].append(equipment.tags[tag])
 
+        self._tag_resistance = total_tags
+        self._tag_resistance_version = self.version
         return total_tags
 
     @property
@@ -269,8 +353,8 @@ class EquipmentController(LoadableMixin):
 
         total_resistances: dict[str, float] = {}
 
-        for tag in self.all_tag_resistance:
-            total_resistances[tag] = sum_a_tag(self.all_tag_resistance[tag])
+        for tag, resistances in self.all_tag_resistance.items():
+            total_resistances[tag] = sum_a_tag(resistances)
 
         return total_resistances
 
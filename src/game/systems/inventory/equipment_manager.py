@@ -1,17 +1,16 @@
 from __future__ import annotations
 
-import copy
-from typing import TYPE_CHECKING
+import sys
+from collections.abc import Callable
+from typing import ClassVar
 
 from loguru import logger
 
 from game.structures.loadable_factory import LoadableFactory
 from game.structures.manager import Manager
+from game.systems.inventory.structures import EquipSlot
 from game.util.asset_utils import get_asset
 
-if TYPE_CHECKING:
-    from game.systems.inventory.structures import EquipSlot
-
 
 class EquipmentManager(Manager):
     """
@@ -47,14 +46,22 @@ class EquipmentManager(Manager):
         if key not in self._slots:
             raise KeyError(f"Unknown slot: {key}!")
 
-        if type(value) is bool:
-            self._slots[key].enabled = value
+        setter = self._SETTERS.get(type(value))
+        if setter is None:
+            raise TypeError(f"Unknown type for value! Expected int, bool, or None. Got {type(value)}!")
 
-        elif type(value) is int or value is None:
-            self._slots[key].item_id = value
+        setter(self._slots[key], value)
 
-        else:
-            raise TypeError(f"Unknown type for value! Expected int, bool, or None. Got {type(value)}!")
+    @staticmethod
+    def _set_enabled(slot: EquipSlot, value: bool) -> None:
+        slot.enabled = value
+
+    @staticmethod
+    def _set_item_id(slot: EquipSlot, value: int | None) -> None:
+        slot.item_id = value
+
+    # Maps the exact type of a value passed to __setitem__ to the function that applies it
+    _SETTERS: ClassVar[dict[type, Callable]] = {bool: _set_enabled, int: _set_item_id, type(None): _set_item_id}
 
     def register_slot(
         self, instance: EquipSlot = None, name: str = None, item_id: int | None = None, enabled: bool = True
@@ -64,9 +71,9 @@ class EquipmentManager(Manager):
 
         Pass either an instance of EquipSlot or a `name` value. If a `name` value is passed, `item_id` and `enabled` may also
         be passed.
-        """
 
-        from game.systems.inventory.structures import EquipSlot
+        Slot names are interned, so that the keys of every slot dict and each Equipment's `slot` share one str object.
+        """
 
         # Handle registering instance
         if isinstance(instance, EquipSlot):
@@ -74,6 +81,7 @@ class EquipmentManager(Manager):
                 logger.error(f"Failed to register slot {instance.name}: A slot with that name already exists!")
                 raise RuntimeError(f"Failed to register slot {instance.name}!")
 
+            instance.name = sys.intern(instance.name)
             self._slots[instance.name] = instance
 
         # Handle registering by name
@@ -87,13 +95,16 @@ class EquipmentManager(Manager):
             if not isinstance(enabled, bool):
                 raise TypeError()
 
+            name = sys.intern(name)
             self._slots[name] = EquipSlot(name, item_id, enabled)
 
     def get_slots(self) -> dict:
         """
-        Get a deep copy of the slot properties for each slot.
+        Get a copy of the slot properties for each slot.
+
+        An EquipSlot only holds immutable values, so rebuilding each slot directly is equivalent to a deep copy.
         """
-        return copy.deepcopy(self._slots)
+        return {key: EquipSlot(slot.name, slot.item_id, slot.enabled) for key, slot in self._slots.items()}
 
     def is_valid_slot(self, slot: str) -> str:
         """
@@ -103,12 +114,12 @@ class EquipmentManager(Manager):
         args:
             slot: The slot key to validate
 
-        returns: `slot` if `slot` exists
+        returns: The interned form of `slot` if `slot` exists
         """
         if slot in self._slots:
-            return slot
+            return sys.intern(slot)
 
-        raise ValueError(f"Slot {slot} does not exist! Possible slots are {','.join(list(self._slots.keys()))}")
+        raise ValueError(f"Slot {slot} does not exist! Possible slots are {','.join(self._slots)}")
 
     def load(self) -> None:
         """
@@ -118,8 +129,6 @@ class EquipmentManager(Manager):
         for raw_slot in raw_asset["content"]:
             slot = LoadableFactory.get(raw_slot)
 
-            from game.systems.inventory.structures import EquipSlot
-
             if not isinstance(slot, EquipSlot):
                 raise TypeError(f"Expected object of type EquipSlot, got {type(slot)} instead!")
 
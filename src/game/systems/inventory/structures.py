@@ -1,5 +1,7 @@
 from __future__ import annotations
-from dataclasses import dataclass
+import sys
+import weakref
+from dataclasses import dataclass, field
 from game.cache import from_cache, cached
 from game.structures.loadable import LoadableMixin
 from game.structures.loadable_factory import LoadableFactory
@@ -10,18 +12,52 @@ from loguru import logger
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from game.systems.inventory.equipment_controller import EquipmentController
     from game.systems.item.item import Equipment
 
 
-@dataclass
+@dataclass(slots=True)
 class EquipSlot:
     """
     A simple dataclass for storing the properties of an equipment slot.
     """
 
     name: str  # Name of the slot
-    item_id: int | None  # ID of the item placed in the slot
-    enabled: bool  # If the slot is allowed to be used
+    _item_id: int | None  # ID of the item placed in the slot
+    _enabled: bool  # If the slot is allowed to be used
+
+    # The last Equipment instance fetched for the slot, and the item_id it was fetched for
+    _instance: Equipment | None = field(default=None, init=False, repr=False, compare=False)
+    _instance_item_id: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    # A weak reference to the EquipmentController holding the slot, whose version tracks item_id and enabled
+    _controller: weakref.ref[EquipmentController] | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def item_id(self) -> int | None:
+        return self._item_id
+
+    @item_id.setter
+    def item_id(self, value: int | None) -> None:
+        self._item_id = value
+        self._bump_controller_version()
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+        self._bump_controller_version()
+
+    def _bump_controller_version(self) -> None:
+        """
+        Mark the equipment of the controller holding this slot, if there is one, as changed.
+        """
+        controller = self._controller() if self._controller is not None else None
+        if controller is not None:
+            controller.version += 1
 
     def unlock(self) -> None:
         """
@@ -37,23 +73,25 @@ class EquipSlot:
          of a Frame. Includes the slot's name and the name of the item in the
          slot.
         """
-        return [
-            self.name,
-            ": ",
-            from_cache("managers.ItemManager").get_instance(self.item_id).name if self.item_id is not None else "Empty",
-        ]
+        return [self.name, ": ", self.instance.name if self.item_id is not None else "Empty"]
 
     @property
     def instance(self) -> Equipment | None:
         """
         Get an instance of the Equipment in the slot.
 
+        The instance is fetched once and reused until the slot's item_id changes.
+
         returns: An Equipment instance or None if the slot is empty.
         """
         if self.item_id is None:
             return None
 
-        return from_cache("managers.ItemManager").get_instance(self.item_id)
+        if self._instance is None or self._instance_item_id != self.item_id:
+            self._instance = from_cache("managers.ItemManager").get_instance(self.item_id)
+            self._instance_item_id = self.item_id
+
+        return self._instance
 
     @staticmethod
     @cached([LoadableMixin.LOADER_KEY, "EquipSlot", LoadableMixin.ATTR_KEY])
@@ -81,4 +119,4 @@ class EquipSlot:
         LoadableFactory.validate_fields(required_fields, json)
         LoadableFactory.validate_fields(optional_fields, json, False, False)
 
-        return EquipSlot(json["name"], json["item_id"] if "item_id" in json else None, json["enabled"])
+        return EquipSlot(sys.intern(json["name"]), json["item_id"] if "item_id" in json else None, json["enabled"])
@@ -1,4 +1,3 @@
-import copy
 from abc import ABC
 
 import game
@@ -12,12 +11,31 @@ from game.systems.currency.trade_mixin import TradeMixin
 from game.systems.entity.resource import ResourceModifierMixin
 from game.systems.event.events import Event
 
+_ITEM_REQUIRED = (("name", str), ("id", int), ("description", str))
+_ITEM_OPTIONAL = (("max_quantity", int), ("market_values", dict))
+_ITEM_VALIDATOR = LoadableFactory.compile_validator(_ITEM_REQUIRED, _ITEM_OPTIONAL)
+
+_USABLE_REQUIRED = _ITEM_REQUIRED + (("functional_description", str),)
+_USABLE_OPTIONAL = _ITEM_OPTIONAL + (("on_use_events", list), ("consumable", bool))
+_USABLE_VALIDATOR = LoadableFactory.compile_validator(_USABLE_REQUIRED, _USABLE_OPTIONAL)
+
+_EQUIPMENT_REQUIRED = _USABLE_REQUIRED + (("equipment_slot", str), ("damage_buff", int), ("damage_resist", int))
+_EQUIPMENT_OPTIONAL = _ITEM_OPTIONAL + (
+    ("start_of_combat_effects", list),
+    ("requirements", list),
+    ("resource_modifiers", dict),
+    ("tags", dict),
+)
+_EQUIPMENT_VALIDATOR = LoadableFactory.compile_validator(_EQUIPMENT_REQUIRED, _EQUIPMENT_OPTIONAL)
+
 
 class ItemBase(ABC):
     """
     Base class of Item object
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str, iid: int, description: str, max_quantity: int = 10):
         self.name: str = name  # Name of item
         self.id: int = iid  # Unique id of item
@@ -37,6 +55,10 @@ class Item(LoadableMixin, TradeMixin, ItemBase):
         market_values: A map of Currency ID to Currency value
     """
 
+    # The mixins declare empty slots so that each concrete item class can own its full attribute layout. __weakref__
+    # is kept for ItemManager.get_ref.
+    __slots__ = ("__weakref__", "_market_values", "description", "id", "max_quantity", "name")
+
     def __init__(self, name: str, iid: int, description: str, max_quantity: int = 10, **kwargs):
         super().__init__(name=name, iid=iid, description=description, max_quantity=max_quantity, **kwargs)
 
@@ -61,13 +83,8 @@ class Item(LoadableMixin, TradeMixin, ItemBase):
         - market_values: dict[int, int]
         """
 
-        required_fields = [("name", str), ("id", int), ("description", str)]
-
-        optional_fields = [("max_quantity", int), ("market_values", dict)]
-
-        LoadableFactory.validate_fields(required_fields, json)
-        LoadableFactory.validate_fields(optional_fields, json, False, False)
-        kwargs = LoadableFactory.collect_optional_fields(optional_fields, json)
+        _ITEM_VALIDATOR(json)
+        kwargs = LoadableFactory.collect_optional_fields(_ITEM_OPTIONAL, json)
 
         if "market_values" in kwargs:
             kwargs["market_values"] = {int(k): v for k, v in kwargs["market_values"].items()}
@@ -81,6 +98,8 @@ class Usable(req.RequirementsMixin, Item):
     triggered in sequence.
     """
 
+    __slots__ = ("consumable", "functional_description", "on_use_events", "requirements")
+
     def __init__(
         self,
         name: str,
@@ -95,6 +114,10 @@ class Usable(req.RequirementsMixin, Item):
         super().__init__(name=name, iid=iid, description=description, max_quantity=max_quantity, **kwargs)
 
         self.on_use_events: list[Event] = on_use_events or []  # List of Events that trigger when item is used
+        for e in self.on_use_events:
+            if not isinstance(e, Event):
+                raise TypeError(f"Invalid use_event object type! Got type {type(e)}. Expected type Event!")
+
         self.consumable: bool = consumable  # Determines if the item should decrement quantity after each use.
         self.functional_description: str = functional_description
 
@@ -104,11 +127,9 @@ class Usable(req.RequirementsMixin, Item):
         if not isinstance(target, Entity):
             raise TypeError("Usable target must be an instance of Entity!")
 
+        # on_use_events is type-checked once in __init__
         for e in self.on_use_events:
-            if not isinstance(e, Event):
-                raise TypeError(f"Invalid use_event object type! Got type {type(e)}. Expected type Event!")
-
-            dce = copy.deepcopy(e)
+            dce = e.clone()
             if hasattr(dce, "_target"):
                 dce._target = target
 
@@ -143,35 +164,31 @@ class Usable(req.RequirementsMixin, Item):
         - market_values: dict[int, int]
         """
 
-        required_fields = [
-            ("name", str),
-            ("id", int),
-            ("description", str),
-            ("functional_description", str),
-        ]
+        _USABLE_VALIDATOR(json)
 
-        optional_fields = [
-            ("max_quantity", int),
-            ("on_use_events", list),
-            ("consumable", bool),
-            ("market_values", dict),
-        ]
-
-        LoadableFactory.validate_fields(required_fields, json)
-        LoadableFactory.validate_fields(optional_fields, json, False, False)
-
-        kwargs = LoadableFactory.collect_optional_fields(optional_fields, json)
+        kwargs = LoadableFactory.collect_optional_fields(_USABLE_OPTIONAL, json)
 
         if "market_values" in kwargs:
             kwargs["market_values"] = {int(k): v for k, v in kwargs["market_values"].items()}
 
         if "on_use_events" in kwargs:
-            kwargs["on_use_events"] = [LoadableFactory.get(raw_effect) for raw_effect in kwargs["on_use_events"]]
+            kwargs["on_use_events"] = LoadableFactory.get_many(kwargs["on_use_events"])
 
         return Usable(json["name"], json["id"], json["description"], json["functional_description"], **kwargs)
 
 
 class Equipment(req.RequirementsMixin, ResourceModifierMixin, TagMixin, Item):
+    __slots__ = (
+        "damage_buff",
+        "damage_resist",
+        "functional_description",
+        "requirements",
+        "resource_modifiers",
+        "slot",
+        "start_of_combat_effects",
+        "tags",
+    )
+
     def __init__(
         self,
         name: str,
@@ -188,6 +205,9 @@ class Equipment(req.RequirementsMixin, ResourceModifierMixin, TagMixin, Item):
         self.functional_description: str = functional_description
         self.slot: str = from_cache("managers.EquipmentManager").is_valid_slot(equipment_slot)
         self.start_of_combat_effects: list[CombatEffect] = start_of_combat_effects or []
+        for ef in self.start_of_combat_effects:
+            if not isinstance(ef, CombatEffect):
+                raise TypeError(f"Expected effect of type CombatEffect, got {type(ef)} instead!")
 
         self.damage_buff: int = damage_buff
         self.damage_resist: int = damage_resist
@@ -252,44 +272,17 @@ class Equipment(req.RequirementsMixin, ResourceModifierMixin, TagMixin, Item):
         - market_values: dict[int, int]
         """
 
-        required_fields = [
-            ("name", str),
-            ("id", int),
-            ("description", str),
-            ("functional_description", str),
-            ("equipment_slot", str),
-            ("damage_buff", int),
-            ("damage_resist", int),
-        ]
-        optional_fields = [
-            ("max_quantity", int),
-            ("start_of_combat_effects", list),
-            ("requirements", list),
-            ("resource_modifiers", dict),
-            ("tags", dict),
-            ("market_values", dict),
-        ]
-
-        LoadableFactory.validate_fields(required_fields, json)
-        LoadableFactory.validate_fields(optional_fields, json, False, False)
+        _EQUIPMENT_VALIDATOR(json)
 
         # Implicitly collect requirements, resource_modifiers
-        kwargs = LoadableFactory.collect_optional_fields(optional_fields, json)
+        kwargs = LoadableFactory.collect_optional_fields(_EQUIPMENT_OPTIONAL, json)
 
         if "market_values" in kwargs:
             kwargs["market_values"] = {int(k): v for k, v in kwargs["market_values"].items()}
 
         # Overwrite SOCE since its contents must be cast to Python via LoadableFactory
-        start_of_combat_effects = []
-        if "start_of_combat_effects" in json:
-            for effect_json in json["start_of_combat_effects"]:
-                ef = LoadableFactory.get(effect_json)
-                if not isinstance(ef, CombatEffect):
-                    raise TypeError(f"Expected effect of type CombatEffect, got {type(ef)} instead!")
-
-                start_of_combat_effects.append(ef)
-
-        kwargs["start_of_combat_effects"] = start_of_combat_effects
+        # Equipment.__init__ checks that each loaded object is a CombatEffect
+        kwargs["start_of_combat_effects"] = LoadableFactory.get_many(json.get("start_of_combat_effects", ()))
 
         return Equipment(
             json["name"],
@@ -1,62 +1,95 @@
 from abc import ABC
-from random import randint
+from collections import Counter
+from math import fsum, isclose
+from random import random, randrange
 
 
 from game.cache import from_cache, cached
 from game.structures.loadable import LoadableMixin
 from game.structures.loadable_factory import LoadableFactory
 
+_LOOT_TABLE_REQUIRED = (("id", int), ("item_probabilities", dict), ("drop_probabilities", dict))
+_LOOT_TABLE_VALIDATOR = LoadableFactory.compile_validator(_LOOT_TABLE_REQUIRED)
 
-class LootTable(LoadableMixin):
+
+class AliasTable:
     """
-    LootTable objects store organized data about the types of items that can drop and how many of them should drop.
+    A table of weighted outcomes that can be sampled in constant time using Vose's alias method.
+
+    The table is split into one column per outcome. Column i keeps its own outcome with probability `_thresholds[i]` and
+    otherwise yields `_aliases[i]`, so each draw is one column pick and one coin flip regardless of how many outcomes
+    there are. Probabilities must sum to 1.0, up to floating-point rounding.
     """
 
-    ITEM_TABLE_RESOLUTION = 1000  # The length of the loot table array
-    DROP_TABLE_RESOLUTION = 1000  # The length of the drop table array
+    __slots__ = ("_aliases", "_thresholds", "outcomes")
 
-    def __init__(self, id: int, item_probabilities: dict[int, float], drop_probabilities: dict[int, float]):
-        super().__init__()
-        self.id = id
-        self.item_table = self._generate_item_table(item_probabilities)  # Probability a drop is a specific item
-        self.drop_table = self._generate_drop_table(drop_probabilities)
+    def __init__(self, probabilities: dict[int, float]):
+        self.outcomes: list[int] = list(probabilities.keys())
 
-    @classmethod
-    def _generate_item_table(cls, item_probabilities: dict[int, float]) -> list[int]:
-        """
-        Transform a dict of item probabilities into a list of item IDs.
-        """
-        if item_probabilities is None:
-            return []
+        weights = list(probabilities.values())
+        if any(w < 0 for w in weights):
+            raise ValueError("Probabilities in a loot table cannot be negative!")
 
-        if sum(item_probabilities.values()) != 1.0:
-            raise ValueError("The sum of probabilities in a loot table must be exactly 1.0!")
+        # fsum rounds only once, so the total does not pick up rounding error from each addition
+        total = fsum(weights)
+        if weights and not isclose(total, 1.0, rel_tol=1e-9, abs_tol=1e-12):
+            raise ValueError("The sum of probabilities in a loot table must be 1.0!")
 
-        res = []
+        n = len(weights)
+        scaled = [w * n / total for w in weights]
 
-        for item_id, prob in item_probabilities.items():
-            for i in range(int(prob * LootTable.ITEM_TABLE_RESOLUTION)):
-                res.append(item_id)
+        # Columns default to always keeping their own outcome; only under-full columns need an alias
+        self._thresholds: list[float] = [1.0] * n
+        self._aliases: list[int] = list(self.outcomes)
 
-        return res
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+
+            # Top up column s with the excess of column g
+            self._thresholds[s] = scaled[s]
+            self._aliases[s] = self.outcomes[g]
+
+            scaled[g] = scaled[g] + scaled[s] - 1.0
+            (small if scaled[g] < 1.0 else large).append(g)
+
+        # Anything left in either queue is full up to rounding error, and keeps its default threshold of 1.0
+
+    def __len__(self) -> int:
+        return len(self.outcomes)
+
+    def sample(self) -> int:
+        """
+        Draw a single outcome.
+        """
+        i = randrange(len(self.outcomes))
+        return self.outcomes[i] if random() < self._thresholds[i] else self._aliases[i]
 
-    @classmethod
-    def _generate_drop_table(cls, drop_probabilities: dict[int, float]) -> list[int]:
+    def sample_many(self, k: int) -> list[int]:
         """
-        Transform a dict of item probabilities into a list of item quantities.
+        Draw `k` independent outcomes in one batch.
         """
-        if drop_probabilities is None:
-            return cls._generate_drop_table({0: 1.0})
+        outcomes, thresholds, aliases = self.outcomes, self._thresholds, self._aliases
+        columns = [randrange(len(outcomes)) for _ in range(k)]
 
-        if sum(drop_probabilities.values()) != 1.0:
-            raise ValueError("The sum of probabilities in a drop table must be exactly 1.0!")
+        return [outcomes[i] if random() < thresholds[i] else aliases[i] for i in columns]
 
-        res = []
 
-        for quantity, prob in drop_probabilities.items():
-            for i in range(int(prob * LootTable.DROP_TABLE_RESOLUTION)):
-                res.append(quantity)
-        return res
+class LootTable(LoadableMixin):
+    """
+    LootTable objects store organized data about the types of items that can drop and how many of them should drop.
+    """
+
+    __slots__ = ("drop_table", "id", "item_table")
+
+    def __init__(self, id: int, item_probabilities: dict[int, float], drop_probabilities: dict[int, float]):
+        super().__init__()
+        self.id = id
+        self.item_table = AliasTable(item_probabilities or {})  # Probability a drop is a specific item
+        self.drop_table = AliasTable(drop_probabilities or {0: 1.0})  # Probability of each number of drops
 
     @staticmethod
     @cached([LoadableMixin.LOADER_KEY, "LootTable", LoadableMixin.ATTR_KEY])
@@ -78,9 +111,7 @@ class LootTable(LoadableMixin):
         - None
         """
 
-        required_fields = [("id", int), ("item_probabilities", dict), ("drop_probabilities", dict)]
-
-        LoadableFactory.validate_fields(required_fields, json)
+        _LOOT_TABLE_VALIDATOR(json)
 
         item_probabilities = {int(k): v for k, v in json["item_probabilities"].items()}
         drop_probabilities = {int(k): v for k, v in json["drop_probabilities"].items()}
@@ -143,19 +174,6 @@ class LootableMixin(ABC):
         else:
             return self._loot_table_instance
 
-    def _get_num_drops(self) -> int:
-        """
-        Generate a random number to determine how many drops should be generated
-        """
-        idx = randint(0, len(self.loot_table.drop_table) - 1)
-        return self.loot_table.drop_table[idx]
-
-    def _get_item_from_pool(self) -> int:
-        """
-        Generate a random number to determine which item should drop
-        """
-        return self.loot_table.item_table[randint(0, len(self.loot_table.item_table) - 1)]
-
     def get_loot(self) -> dict[int, int]:
         """
         Fetch loot in the form of a dict.
@@ -163,16 +181,10 @@ class LootableMixin(ABC):
         Each key represents an Item ID and the mapped values represents quantity
         """
 
-        drops: dict[int, int] = {}
-
-        if self.loot_table is None:
-            return drops
+        # Resolved once, since a global loot table is looked up through the LootManager on every access
+        loot_table = self.loot_table
 
-        for i in range(0, self._get_num_drops()):
-            item_id = self._get_item_from_pool()
-            if item_id not in drops:
-                drops[item_id] = 1
-            else:
-                drops[item_id] = drops[item_id] + 1
+        if loot_table is None:
+            return {}
 
-        return drops
+        return dict(Counter(loot_table.item_table.sample_many(loot_table.drop_table.sample())))
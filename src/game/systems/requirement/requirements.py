@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from abc import ABC
 from enum import Enum
+from functools import cached_property
 
 from loguru import logger
 
@@ -49,6 +50,8 @@ class RequirementsMixin:
     A mixin class that enables a child class to accept requirements.
     """
 
+    __slots__ = ()
+
     def __init__(self, requirements: list[Requirement] = None, **kwargs):
         super().__init__(**kwargs)
         self.requirements: list[Requirement] = requirements or []
@@ -60,10 +63,11 @@ class RequirementsMixin:
 
         """
 
-        if self.requirements is None or self.requirements == []:
+        if not self.requirements:
             return True
 
-        return all([req.fulfilled(entity) for req in self.requirements])
+        # A generator lets all() stop at the first unfulfilled requirement
+        return all(req.fulfilled(entity) for req in self.requirements)
 
     def get_requirements_as_str(self) -> list[str]:
         """Get a list of strings that represent the conditions for the requirements associated with this object"""
@@ -103,16 +107,12 @@ class SkillRequirement(Requirement):
         self.skill_id: int = skill_id
         self.level: int = level
 
-        self._skill_name: str | None = None
-
     def fulfilled(self, entity) -> bool:
         from game.systems.entity.mixins.skill_mixin import SkillMixin
 
         if isinstance(entity, SkillMixin):
-            if self.skill_id not in entity.skill_controller.skills:
-                return False
-
-            return entity.skill_controller.get_level(self.skill_id) >= self.level
+            skill = entity.skill_controller.skills.get(self.skill_id)
+            return skill is not None and skill.level >= self.level
 
         # If the target entity does not have support for skills
         # (IE, NPC CombatEntities) simply return True
@@ -120,12 +120,11 @@ class SkillRequirement(Requirement):
             logger.warning(f"SkillRequirement defaulted to True for entity: {str(entity)}")
             return True
 
-    @property
+    @cached_property
     def description(self) -> list[str | StringContent]:
-        if self._skill_name is None:
-            self._skill_name = from_cache("managers.SkillManager").get_skill(self.skill_id).name
-
-        return ["Requires ", StringContent(value=self._skill_name), f" level {self.level}"]
+        # skill_id and level never change, so the description is built once, on first use
+        skill_name = from_cache("managers.SkillManager").get_skill(self.skill_id).name
+        return ["Requires ", StringContent(value=skill_name), f" level {self.level}"]
 
     @staticmethod
     @cached([LoadableMixin.LOADER_KEY, "SkillRequirement", LoadableMixin.ATTR_KEY])
@@ -156,25 +155,31 @@ class ResourceRequirement(Requirement):
         self.resource_name: str = resource_name
         self.adjust_quantity: int | float = adjust_quantity
 
-    def fulfilled(self, entity) -> bool:
+        # The kind of check depends only on the type of adjust_quantity, so it is chosen once here. A bool would pass as
+        # an int, so it is rejected explicitly.
+        if isinstance(adjust_quantity, bool):
+            raise TypeError("Adjustment must be of type int or float, not bool!")
+        elif isinstance(adjust_quantity, int):
+            self._check = self._check_value
+        elif isinstance(adjust_quantity, float):
+            self._check = self._check_percent
+        else:
+            raise TypeError("Adjustment must be of type int or float!")
+
+    def _check_value(self, entity) -> bool:
         # Resource must be gte adjustment quantity
-        if isinstance(self.adjust_quantity, int):
-            if entity.resource_controller[self.resource_name].value < self.adjust_quantity:
-                return False
+        return entity.resource_controller[self.resource_name].value >= self.adjust_quantity
 
+    def _check_percent(self, entity) -> bool:
         # Resource % must be >= adjust_quantity
-        elif isinstance(self.adjust_quantity, float):
-            _resource = entity.resource_controller[self.resource_name]
-            if _resource.percent_remaining < self.adjust_quantity:
-                return False
+        return entity.resource_controller[self.resource_name].percent_remaining >= self.adjust_quantity
 
-        else:
-            raise TypeError("Adjustment must be of type int or float!")
-
-        return True
+    def fulfilled(self, entity) -> bool:
+        return self._check(entity)
 
-    @property
+    @cached_property
     def description(self) -> list[str | StringContent]:
+        # resource_name and adjust_quantity never change, so the description is built once, on first use
         sss = f"{self.adjust_quantity}" if isinstance(self.adjust_quantity, int) else f"{self.adjust_quantity * 100}%"
         return [
             "Requires ",
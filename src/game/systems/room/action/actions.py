@@ -16,6 +16,18 @@ from game.structures.loadable_factory import LoadableFactory
 from game.structures.state_device import FiniteStateDevice, StateDevice
 from game.systems.requirement.requirements import RequirementsMixin
 
+_EXIT_ACTION_REQUIRED = (("target_room", int),)
+_EXIT_ACTION_OPTIONAL = (
+    ("menu_name", str),
+    ("visible", bool),
+    ("reveal_after_use", list),
+    ("hide_after_use", bool),
+    ("requirements", list),
+    ("on_exit", list),
+    ("tags", list),
+)
+_EXIT_ACTION_VALIDATOR = LoadableFactory.compile_validator(_EXIT_ACTION_REQUIRED, _EXIT_ACTION_OPTIONAL)
+
 
 class Action(LoadableMixin, RequirementsMixin, FiniteStateDevice, ABC):
     """
@@ -43,10 +55,10 @@ class Action(LoadableMixin, RequirementsMixin, FiniteStateDevice, ABC):
 
         self._menu_name: str = menu_name  # Name of the Action when viewed from a room
         self.activation_text: str = activation_text  # Text that is printed when the Action is run
-        self.visible: bool = visible  # If True, visible in the owning Room
+        self.room: room.Room = None  # The Room that owns this action. Should ONLY be a weakref.proxy
+        self._visible: bool = visible  # If True, visible in the owning Room
         self.hide_after_use: bool = hide_after_use  # If True, the action will set itself to hidden after being used
         self.reveal_after_use: list[str] = reveal_after_use  # Hide other actions in the room after this action is used
-        self.room: room.Room = None  # The Room that owns this action. Should ONLY be a weakref.proxy
         self.persistent: bool = persistent
         self.tags: list[str] = tags  # Arbitrary string tags assigned to the action by the game designer
 
@@ -58,6 +70,18 @@ class Action(LoadableMixin, RequirementsMixin, FiniteStateDevice, ABC):
 
         return self._menu_name
 
+    @property
+    def visible(self) -> bool:
+        return self._visible
+
+    @visible.setter
+    def visible(self, value: bool) -> None:
+        self._visible = value
+
+        # The owning Room caches its visible actions, so it must be told when one of them changes
+        if self.room is not None:
+            self.room.invalidate_visible_actions()
+
 
 class ExitAction(Action):
     """
@@ -114,21 +138,8 @@ class ExitAction(Action):
     @staticmethod
     @cache.cached([LoadableMixin.LOADER_KEY, "ExitAction", LoadableMixin.ATTR_KEY])
     def from_json(json: dict[str, any]) -> any:
-        required_fields = [("target_room", int)]
-
-        optional_fields = [
-            ("menu_name", str),
-            ("visible", bool),
-            ("reveal_after_use", list),
-            ("hide_after_use", bool),
-            ("requirements", list),
-            ("on_exit", list),
-            ("tags", list),
-        ]
-
-        LoadableFactory.validate_fields(required_fields, json)
-        LoadableFactory.validate_fields(optional_fields, json, False, False)
-        kwargs = LoadableFactory.collect_optional_fields(optional_fields, json)
+        _EXIT_ACTION_VALIDATOR(json)
+        kwargs = LoadableFactory.collect_optional_fields(_EXIT_ACTION_OPTIONAL, json)
 
         return ExitAction(json["target_room"], **kwargs)
 
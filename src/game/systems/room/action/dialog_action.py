@@ -1,13 +1,19 @@
 import enum
+from typing import ClassVar
 
 import game
 from game.cache import cached
 from game.structures.enums import InputType
 from game.structures.loadable import LoadableMixin
 from game.structures.loadable_factory import LoadableFactory
+from game.structures.state_device import StateSpec
 from game.systems.event.dialog_event import DialogEvent
 from game.systems.room.action.actions import Action
 
+_DIALOG_ACTION_REQUIRED = (("menu_name", str), ("activation_text", str), ("dialog_id", int))
+_DIALOG_ACTION_OPTIONAL = (("visible", bool), ("reveal_after_use", list), ("persistent", bool), ("tags", list))
+_DIALOG_ACTION_VALIDATOR = LoadableFactory.compile_validator(_DIALOG_ACTION_REQUIRED, _DIALOG_ACTION_OPTIONAL)
+
 
 class DialogAction(Action):
     """
@@ -29,10 +35,13 @@ class DialogAction(Action):
 
         self.dialog_id = dialog_id
 
-        @self.state_logic(self.States.DEFAULT, InputType.SILENT)
-        def _logic(_) -> None:
-            game.add_state_device(DialogEvent(self.dialog_id))
-            self.set_state(self.States.TERMINATE)
+        self.install_state_table(self._STATE_TABLE)
+
+    def _default_logic(self, _) -> None:
+        game.add_state_device(DialogEvent(self.dialog_id))
+        self.set_state(self.States.TERMINATE)
+
+    _STATE_TABLE: ClassVar[dict[enum.Enum, StateSpec]] = {States.DEFAULT: StateSpec(InputType.SILENT, _default_logic)}
 
     @staticmethod
     @cached([LoadableMixin.LOADER_KEY, "DialogAction", LoadableMixin.ATTR_KEY])
@@ -63,16 +72,11 @@ class DialogAction(Action):
 
         """
 
-        required_fields = [("menu_name", str), ("activation_text", str), ("dialog_id", int)]
-
-        optional_fields = [("visible", bool), ("reveal_after_use", list), ("persistent", bool), ("tags", list)]
-
-        LoadableFactory.validate_fields(required_fields, json)
-        LoadableFactory.validate_fields(optional_fields, json, False, False)
+        _DIALOG_ACTION_VALIDATOR(json)
 
         if json["class"] != "DialogAction":
             raise ValueError()
 
-        kwargs = LoadableFactory.collect_optional_fields(optional_fields, json)
+        kwargs = LoadableFactory.collect_optional_fields(_DIALOG_ACTION_OPTIONAL, json)
 
         return DialogAction(json["menu_name"], json["activation_text"], json["dialog_id"], **kwargs)
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import ClassVar
 
 import game
 from game import cache as cache
@@ -6,6 +7,7 @@ from game.structures.enums import InputType
 from game.structures.loadable import LoadableMixin
 from game.structures.loadable_factory import LoadableFactory
 from game.structures.messages import ComponentFactory, StringContent
+from game.structures.state_device import StateSpec
 from game.systems import entity
 from game.systems.event import use_item_event as uie
 from game.systems.event.inspect_item_event import InspectItemEvent
@@ -32,9 +34,13 @@ class ManageInventoryAction(Action):
         "Drop": States.CONFIRM_DROP_STACK,
     }
 
+    # stack_inspect_options never changes, so the per-index states and the rendered options are derived from it once
+    _stack_inspect_states: tuple[States, ...] = tuple(stack_inspect_options.values())
+    _stack_inspect_option_rows: tuple[tuple[str], ...] = tuple((opt,) for opt in stack_inspect_options)
+
     @classmethod
-    def get_stack_inspection_options(cls) -> list[list[str]]:
-        return [[opt] for opt in cls.stack_inspect_options.keys()]
+    def get_stack_inspection_options(cls) -> tuple[tuple[str], ...]:
+        return cls._stack_inspect_option_rows
 
     def __init__(self, **kwargs):
         super().__init__("View inventory", "", self.States, self.States.DEFAULT, InputType.SILENT, **kwargs)
@@ -42,145 +48,156 @@ class ManageInventoryAction(Action):
         self.player_ref: entity.entities.Player = None
         self.stack_index: int = None
 
-        # DEFAULT
+        self.install_state_table(self._STATE_TABLE)
+
+    # DEFAULT
+
+    def _default_logic(self, _: any) -> None:
+        if cache.from_cache("player") is None:
+            raise RuntimeError("Cannot launch ManageInventoryAction without a valid Player instance!")
+
+        if self.player_ref is None:
+            self.player_ref = cache.from_cache("player")
+
+        if self.player_ref.inventory.size == 0:
+            self.set_state(self.States.EMPTY)
+        else:
+            self.set_state(self.States.DISPLAY_INVENTORY)
 
-        @self.state_logic(self.States.DEFAULT, InputType.SILENT)
-        def _logic(_: any) -> None:
-            if cache.from_cache("player") is None:
-                raise RuntimeError("Cannot launch ManageInventoryAction without a valid Player instance!")
+    # EMPTY
 
-            if self.player_ref is None:
-                self.player_ref = cache.from_cache("player")
+    def _empty_logic(self, _: any) -> None:
+        self.set_state(self.States.TERMINATE)
 
-            if self.player_ref.inventory.size == 0:
-                self.set_state(self.States.EMPTY)
-            else:
-                self.set_state(self.States.DISPLAY_INVENTORY)
+    def _empty_content(self) -> dict:
+        return ComponentFactory.get(["Your inventory is empty"])
 
-        @self.state_logic(self.States.EMPTY, InputType.ANY)
-        def _logic(_: any) -> None:
+    # DISPLAY_INVENTORY
+
+    def _display_inventory_max(self) -> int:
+        return self.player_ref.inventory.size - 1
+
+    def _display_inventory_logic(self, user_input: int) -> None:
+        if user_input == -1:
             self.set_state(self.States.TERMINATE)
+        else:
+            self.stack_index = user_input
+            self.set_state(self.States.INSPECT_STACK)
+
+    def _display_inventory_content(self) -> dict:
+        return ComponentFactory.get(["What stack would you like to inspect?"], self.player_ref.inventory.to_options())
+
+    # INSPECT STACK
 
-        @self.state_content(self.States.EMPTY)
-        def _logic() -> dict:
-            return ComponentFactory.get(["Your inventory is empty"])
-
-        # DISPLAY_INVENTORY
-
-        @self.state_logic(self.States.DISPLAY_INVENTORY, InputType.INT, -1, lambda: self.player_ref.inventory.size - 1)
-        def _logic(user_input: int) -> None:
-            if user_input == -1:
-                self.set_state(self.States.TERMINATE)
-            else:
-                self.stack_index = user_input
-                self.set_state(self.States.INSPECT_STACK)
-
-        @self.state_content(self.States.DISPLAY_INVENTORY)
-        def _content() -> dict:
-            return ComponentFactory.get(
-                ["What stack would you like to inspect?"], self.player_ref.inventory.to_options()
-            )
-
-        # INSPECT STACK
-        @self.state_logic(self.States.INSPECT_STACK, InputType.INT, -1, len(self.stack_inspect_options) - 1)
-        def _logic(user_input: int) -> None:
-            if user_input == -1:
-                self.set_state(self.States.DISPLAY_INVENTORY)
-            else:
-                selected_option = list(self.stack_inspect_options.keys())[user_input]
-                self.set_state(self.stack_inspect_options[selected_option])
-
-        @self.state_content(self.States.INSPECT_STACK)
-        def _content() -> dict:
-            c = [
-                "What would you like to do with ",
-                StringContent(
-                    value=f"{self.player_ref.inventory.items[self.stack_index].ref.name}", formatting="item_name"
-                ),
+    def _inspect_stack_logic(self, user_input: int) -> None:
+        if user_input == -1:
+            self.set_state(self.States.DISPLAY_INVENTORY)
+        else:
+            self.set_state(self._stack_inspect_states[user_input])
+
+    def _inspect_stack_content(self) -> dict:
+        item = self.player_ref.inventory.items[self.stack_index].ref
+        c = [
+            "What would you like to do with ",
+            StringContent(value=f"{item.name}", formatting="item_name"),
+            "?",
+        ]
+        return ComponentFactory.get(c, self.get_stack_inspection_options())
+
+    # CONFIRM_DROP_STACK
+
+    def _confirm_drop_stack_logic(self, user_input: bool) -> None:
+        if user_input:
+            self.set_state(self.States.DROP_STACK)
+        else:
+            self.set_state(self.States.INSPECT_STACK)
+
+    def _confirm_drop_stack_content(self) -> dict:
+        stack = self.player_ref.inventory.items[self.stack_index]
+        return ComponentFactory.get(
+            [
+                "Are you sure you want to drop ",
+                StringContent(value=stack.ref.name, formatting="item_name"),
+                " ",
+                StringContent(value=f"{stack.quantity}x", formatting="item_quantity"),
                 "?",
             ]
-            return ComponentFactory.get(c, self.get_stack_inspection_options())
-
-        # CONFIRM_DROP_STACK
-
-        @self.state_logic(self.States.CONFIRM_DROP_STACK, InputType.AFFIRMATIVE)
-        def _logic(user_input: bool) -> None:
-            if user_input:
-                self.set_state(self.States.DROP_STACK)
-            else:
-                self.set_state(self.States.INSPECT_STACK)
-
-        @self.state_content(self.States.CONFIRM_DROP_STACK)
-        def _content() -> dict:
-            stack = self.player_ref.inventory.items[self.stack_index]
-            return ComponentFactory.get(
-                [
-                    "Are you sure you want to drop ",
-                    StringContent(value=stack.ref.name, formatting="item_name"),
-                    " ",
-                    StringContent(value=f"{stack.quantity}x", formatting="item_quantity"),
-                    "?",
-                ]
-            )
-
-        # DROP_STACK
-
-        @self.state_logic(self.States.DROP_STACK, InputType.ANY)
-        def _logic(_: any) -> None:
-            self.player_ref.inventory.drop_stack(self.stack_index)
-            self.set_state(self.States.DISPLAY_INVENTORY)
+        )
+
+    # DROP_STACK
+
+    def _drop_stack_logic(self, _: any) -> None:
+        self.player_ref.inventory.drop_stack(self.stack_index)
+        self.set_state(self.States.DISPLAY_INVENTORY)
+
+    def _drop_stack_content(self) -> dict:
+        stack = self.player_ref.inventory.items[self.stack_index]
+        return ComponentFactory.get(
+            [
+                "You dropped ",
+                StringContent(value=f"{stack.quantity}x", formatting="item_quantity"),
+                " ",
+                StringContent(value=stack.ref.name, formatting="item_name"),
+                ".",
+            ]
+        )
 
-        @self.state_content(self.States.DROP_STACK)
-        def _content() -> dict:
-            stack = self.player_ref.inventory.items[self.stack_index]
-            return ComponentFactory.get(
-                [
-                    "You dropped ",
-                    StringContent(value=f"{stack.quantity}x", formatting="item_quantity"),
-                    " ",
-                    StringContent(value=stack.ref.name, formatting="item_name"),
-                    ".",
-                ]
-            )
-
-        @self.state_logic(self.States.DESC_ITEM, InputType.SILENT)
-        def _logic(_: any) -> None:
-            ref = self.player_ref.inventory.items[self.stack_index].ref
-
-            game.add_state_device(InspectItemEvent(ref.id))
-            self.set_state(self.States.INSPECT_STACK)
+    # DESC_ITEM
 
-        # USE_ITEM
+    def _desc_item_logic(self, _: any) -> None:
+        ref = self.player_ref.inventory.items[self.stack_index].ref
 
-        @self.state_logic(self.States.USE_ITEM, InputType.SILENT)
-        def _logic(_: any) -> None:
-            game.add_state_device(uie.UseItemEvent(self.player_ref.inventory.items[self.stack_index].id))
-            self.set_state(self.States.DISPLAY_INVENTORY)
+        game.add_state_device(InspectItemEvent(ref.id))
+        self.set_state(self.States.INSPECT_STACK)
+
+    # USE_ITEM
+
+    def _use_item_logic(self, _: any) -> None:
+        game.add_state_device(uie.UseItemEvent(self.player_ref.inventory.items[self.stack_index].id))
+        self.set_state(self.States.DISPLAY_INVENTORY)
 
-        # EQUIP_ITEM
+    # EQUIP_ITEM
 
-        @self.state_logic(self.States.EQUIP_ITEM, InputType.ANY)
-        def _logic(_: any) -> None:
-            item = self.player_ref.inventory.items[self.stack_index].ref
+    def _equip_item_logic(self, _: any) -> None:
+        item = self.player_ref.inventory.items[self.stack_index].ref
+        equipment_controller = self.player_ref.equipment_controller
+        slot = equipment_controller[item.slot]
 
-            if not self.player_ref.equipment_controller[item.slot].enabled:
-                self.set_state(self.States.EQUIPMENT_SLOT_DISABLED)
-                return
+        if not slot.enabled:
+            self.set_state(self.States.EQUIPMENT_SLOT_DISABLED)
+            return
 
-            if self.player_ref.equipment_controller[item.slot] is not None:
-                self.player_ref.equipment_controller.unequip(item.slot)
+        if slot.item_id is not None:
+            equipment_controller.unequip(item.slot)
 
-            self.player_ref.equipment_controller.equip(item.id)
-            self.set_state(self.States.DEFAULT)
+        equipment_controller.equip(item.id)
+        self.set_state(self.States.DEFAULT)
 
-        @self.state_content(self.States.EQUIP_ITEM)
-        def _content() -> dict:
-            return ComponentFactory.get(
-                [
-                    "You equipped ",
-                    StringContent(value=self.player_ref.inventory.items[self.stack_index].ref.name, style="item_name"),
-                ]
-            )
+    def _equip_item_content(self) -> dict:
+        return ComponentFactory.get(
+            [
+                "You equipped ",
+                StringContent(value=self.player_ref.inventory.items[self.stack_index].ref.name, style="item_name"),
+            ]
+        )
+
+    _STATE_TABLE: ClassVar[dict[Enum, StateSpec]] = {
+        States.DEFAULT: StateSpec(InputType.SILENT, _default_logic),
+        States.EMPTY: StateSpec(InputType.ANY, _empty_logic, _empty_content),
+        States.DISPLAY_INVENTORY: StateSpec(
+            InputType.INT, _display_inventory_logic, _display_inventory_content, -1, _display_inventory_max
+        ),
+        States.INSPECT_STACK: StateSpec(
+            InputType.INT, _inspect_stack_logic, _inspect_stack_content, -1, len(stack_inspect_options) - 1
+        ),
+        States.CONFIRM_DROP_STACK: StateSpec(
+            InputType.AFFIRMATIVE, _confirm_drop_stack_logic, _confirm_drop_stack_content
+        ),
+        States.DROP_STACK: StateSpec(InputType.ANY, _drop_stack_logic, _drop_stack_content),
+        States.DESC_ITEM: StateSpec(InputType.SILENT, _desc_item_logic),
+        States.USE_ITEM: StateSpec(InputType.SILENT, _use_item_logic),
+        States.EQUIP_ITEM: StateSpec(InputType.ANY, _equip_item_logic, _equip_item_content),
+    }
 
     @staticmethod
     @cache.cached([LoadableMixin.LOADER_KEY, "ManageInventoryAction", LoadableMixin.ATTR_KEY])
@@ -4,6 +4,7 @@ Contains the main Room object
 
 import weakref
 from enum import Enum
+from typing import ClassVar
 
 import game
 from game.cache import from_cache, cached
@@ -11,7 +12,7 @@ from game.structures.enums import InputType
 from game.structures.loadable import LoadableMixin
 from game.structures.loadable_factory import LoadableFactory
 from game.structures.messages import ComponentFactory, StringContent
-from game.structures.state_device import FiniteStateDevice
+from game.structures.state_device import FiniteStateDevice, StateSpec
 
 import game.systems.room as room
 import game.systems.room.action.actions as actions
@@ -20,6 +21,10 @@ from loguru import logger
 
 from game.systems.event.events import TextEvent
 
+_ROOM_REQUIRED = (("name", str), ("id", int), ("enter_text", str), ("actions", list))
+_ROOM_OPTIONAL = (("first_enter_text", str),)
+_ROOM_VALIDATOR = LoadableFactory.compile_validator(_ROOM_REQUIRED, _ROOM_OPTIONAL)
+
 
 class Room(LoadableMixin, FiniteStateDevice):
     """
@@ -48,94 +53,133 @@ class Room(LoadableMixin, FiniteStateDevice):
 
         self.enter_text: str = enter_text  # Text that is printed each time room is entered
         self.first_enter_text: str = first_enter_text  # Text only printed the first time the user enters the room
+
+        # Both versions of the room's text are fixed, so they are joined once rather than on every render
+        self._visited_text: str = first_enter_text + "\n" + enter_text
+
+        # The RoomManager's set of visited room ids. It is only ever mutated, never replaced, so a reference to it
+        # stays current and spares each render a trip through room.room_manager.is_visited
+        self._visited_rooms: set[int] = room.room_manager.visited_rooms
         self.id: int = id
         self._action_index: int = None
         self.name: str = name
         self.default_actions_enabled: bool = default_actions_enabled
 
-        # Add default actions to room if enabled
+        # Add default actions to room if enabled. The set of actions is fixed once the Room is built; only their
+        # visibility changes
         if self.default_actions_enabled:
-            self.actions = room.room_manager.get_default_actions() + action_list
+            self.actions: tuple[actions.Action, ...] = tuple(room.room_manager.get_default_actions() + action_list)
         else:
-            self.actions: list[actions.Action] = action_list
+            self.actions: tuple[actions.Action, ...] = tuple(action_list)
+
+        # Visible actions and their menu entries are cached until an Action's visibility changes
+        self._visible_actions: list[actions.Action] | None = None
+        self._options: tuple[tuple[str | StringContent], ...] | None = None
+
+        # Map each tag to the actions that carry it, so that reveal_after_use only touches the matching actions
+        self._tag_index: dict[str, list[actions.Action]] = {}
 
         # Register self as the owner of each Action
         for action in self.actions:
             action.room = weakref.proxy(self)
 
-        @self.state_logic(self.States.DEFAULT, InputType.SILENT)
-        def _logic(_: any) -> None:
-            self.set_state(self.States.DISPLAY_OPTIONS)
+            for tag in action.tags or ():
+                self._tag_index.setdefault(tag, []).append(action)
 
-        @self.state_logic(self.States.DISPLAY_OPTIONS, InputType.INT, 0, lambda: len(self.options) - 1)
-        def _logic(user_input: int) -> None:
-            self._action_index = user_input
-
-            if not self.visible_actions[user_input].is_requirements_fulfilled(from_cache("player")):
-                logger.warning("Requirements not met!")
-                self.set_state(self.States.REQ_NOT_MET)
-                return
-
-            self.set_state(self.States.REQ_MET)
-
-        @self.state_content(self.States.DISPLAY_OPTIONS)
-        def _content():
-            return ComponentFactory.get(
-                [(self.first_enter_text + "\n" if room.room_manager.is_visited(self.id) else "") + self.enter_text],
-                self.options,
-            )
-
-        @self.state_logic(self.States.REQ_MET, InputType.SILENT)
-        def _logic(_) -> None:
-            game.add_state_device(self.visible_actions[self._action_index])
-
-            if self.visible_actions[self._action_index].activation_text not in [None, ""]:
-                game.add_state_device(TextEvent([self.visible_actions[self._action_index].activation_text]))
-
-            if isinstance(self.visible_actions[self._action_index], actions.ExitAction):
-                self.set_state(self.States.LEAVE_ROOM)
-            else:
-                self.set_state(self.States.DISPLAY_OPTIONS)
-
-            # Attempt to reveal actions:
-            if self.visible_actions[self._action_index].reveal_after_use is not None:
-                for reveal_tag in self.visible_actions[self._action_index].reveal_after_use:
-                    for a in self.actions:
-                        if a.tags is not None and reveal_tag in a.tags:
-                            a.visible = True
-
-            # Make action invisible
-            if self.visible_actions[self._action_index].hide_after_use:
-                logger.debug(f"Setting {self.visible_actions[self._action_index]} as hidden...")
-                self.visible_actions[self._action_index].visible = False
-
-        @self.state_logic(self.States.REQ_NOT_MET, InputType.ANY)
-        def _logic(_) -> None:
-            self.set_state(self.States.DISPLAY_OPTIONS)
+        self.install_state_table(self._STATE_TABLE)
+
+    def _default_logic(self, _: any) -> None:
+        self.set_state(self.States.DISPLAY_OPTIONS)
+
+    def _display_options_max(self) -> int:
+        return len(self.options) - 1
+
+    def _display_options_logic(self, user_input: int) -> None:
+        self._action_index = user_input
+
+        if not self.visible_actions[user_input].is_requirements_fulfilled(from_cache("player")):
+            logger.warning("Requirements not met!")
+            self.set_state(self.States.REQ_NOT_MET)
+            return
 
-        @self.state_content(self.States.REQ_NOT_MET)
-        def _content():
-            return ComponentFactory.get(
-                ["You can't do that!"], self.visible_actions[self._action_index].get_requirements_as_options()
-            )
+        self.set_state(self.States.REQ_MET)
 
-        @self.state_logic(self.States.LEAVE_ROOM, InputType.ANY)
-        def _logic(_) -> None:
-            self.set_state(self.States.TERMINATE)
+    def _display_options_content(self) -> dict:
+        return ComponentFactory.get(
+            [self._visited_text if self.id in self._visited_rooms else self.enter_text],
+            self.options,
+        )
 
-        @self.state_content(self.States.LEAVE_ROOM)
-        def _content():
-            return ComponentFactory.get([f"You leave {self.name}"])
+    def _req_met_logic(self, _: any) -> None:
+        # Bound once, since revealing actions below changes which action sits at _action_index
+        action = self.visible_actions[self._action_index]
+
+        game.add_state_device(action)
+
+        if action.activation_text not in [None, ""]:
+            game.add_state_device(TextEvent([action.activation_text]))
+
+        if isinstance(action, actions.ExitAction):
+            self.set_state(self.States.LEAVE_ROOM)
+        else:
+            self.set_state(self.States.DISPLAY_OPTIONS)
+
+        # Attempt to reveal actions:
+        if action.reveal_after_use is not None:
+            for reveal_tag in action.reveal_after_use:
+                for a in self._tag_index.get(reveal_tag, ()):
+                    a.visible = True
+
+        # Make action invisible
+        if action.hide_after_use:
+            logger.debug("Setting {} as hidden...", action)
+            action.visible = False
+
+    def _req_not_met_logic(self, _: any) -> None:
+        self.set_state(self.States.DISPLAY_OPTIONS)
+
+    def _req_not_met_content(self) -> dict:
+        return ComponentFactory.get(
+            ["You can't do that!"], self.visible_actions[self._action_index].get_requirements_as_options()
+        )
+
+    def _leave_room_logic(self, _: any) -> None:
+        self.set_state(self.States.TERMINATE)
+
+    def _leave_room_content(self) -> dict:
+        return ComponentFactory.get([f"You leave {self.name}"])
+
+    _STATE_TABLE: ClassVar[dict[Enum, StateSpec]] = {
+        States.DEFAULT: StateSpec(InputType.SILENT, _default_logic),
+        States.DISPLAY_OPTIONS: StateSpec(
+            InputType.INT, _display_options_logic, _display_options_content, 0, _display_options_max
+        ),
+        States.REQ_MET: StateSpec(InputType.SILENT, _req_met_logic),
+        States.REQ_NOT_MET: StateSpec(InputType.ANY, _req_not_met_logic, _req_not_met_content),
+        States.LEAVE_ROOM: StateSpec(InputType.ANY, _leave_room_logic, _leave_room_content),
+    }
+
+    def invalidate_visible_actions(self) -> None:
+        """Discard the cached visible actions and options so that they are rebuilt on next access"""
+        self._visible_actions = None
+        self._options = None
 
     @property
     def visible_actions(self) -> list[actions.Action]:
         """Returns a list containing only the actions that are visible in the room"""
-        return [action for action in self.actions if action.visible]
+        if self._visible_actions is None:
+            self._visible_actions = [action for action in self.actions if action.visible]
+
+        return self._visible_actions
 
     @property
-    def options(self) -> list[list[str | StringContent]]:
+    def options(self) -> tuple[tuple[str | StringContent], ...]:
         """Returns a formatted string containing a numbered menu of actions"""
-        return [[opt.menu_name] for opt in self.visible_actions]
+        # Immutable, so the same cached options can be handed to every frame
+        if self._options is None:
+            self._options = tuple((opt.menu_name,) for opt in self.visible_actions)
+
+        return self._options
 
     @staticmethod
     @cached([LoadableMixin.LOADER_KEY, "Room", LoadableMixin.ATTR_KEY])
@@ -153,31 +197,16 @@ class Room(LoadableMixin, FiniteStateDevice):
         - first_enter_text: str
         """
 
-        required_fields: list[tuple[str, type]] = [
-            ("name", str),
-            ("id", int),
-            ("enter_text", str),
-            ("actions", list),
-        ]
-
-        optional_fields: list = [
-            ("first_enter_text", str),
-        ]
+        _ROOM_VALIDATOR(json)
 
-        LoadableFactory.validate_fields(required_fields, json)
-        LoadableFactory.validate_fields(optional_fields, json, False, False)
-
-        kwargs = LoadableFactory.collect_optional_fields(optional_fields, json)
+        kwargs = LoadableFactory.collect_optional_fields(_ROOM_OPTIONAL, json)
 
         if json["class"] != "Room":
             raise ValueError(f"Room loader expected class field value of 'Room', got {json['class']} instead!")
 
-        _actions = []
-        for raw_action in json["actions"]:
-            action = LoadableFactory.get(raw_action)
+        _actions = LoadableFactory.get_many(json["actions"])
+        for action in _actions:
             if not isinstance(action, actions.Action):
                 raise TypeError(f"Expected object of type Action, got {type(action)} instead!")
 
-            _actions.append(action)
-
         return Room(json["id"], json["name"], _actions, json["enter_text"], json["name"], **kwargs)
@@ -18,7 +18,7 @@ class RoomManager(manager.Manager):
         super().__init__()
 
         self.rooms: dict[int, room.Room] = {}
-        self.visited_rooms: set[int] = set()
+        self.visited_rooms: set[int] = set()  # Rooms hold a reference to this set, so mutate it rather than reassign
         self._manifest: dict[int, room.Room] = self.rooms
         self._default_actions: list[dict[str, any]] = []  # A set of Actions that are added to every Room by default
 
@@ -64,7 +64,7 @@ class RoomManager(manager.Manager):
 
         if type(r) is int:
             self.visited_rooms.add(r)
-        elif type(r) is room.Room:
+        elif isinstance(r, room.Room):
             self.visited_rooms.add(r.id)
         else:
             raise TypeError(f"Expected type int or Room! Got {type(r)} instead.")
@@ -89,10 +89,11 @@ class RoomManager(manager.Manager):
         if type(room_id) is not int:
             raise TypeError(f"room_id must be an int! Got object of type {type(room_id)} instead.")
 
-        if room_id not in self.rooms:
+        r = self.rooms.get(room_id)
+        if r is None:
             raise ValueError(f"No such room with room_id:{room_id}!")
 
-        return self.rooms[room_id].name
+        return r.name
 
     def load(self) -> None:
         """
@@ -122,7 +123,10 @@ class RoomManager(manager.Manager):
 
     def get_default_actions(self) -> list[Action]:
         """
-        Get deep-copies of the default Room actions.
+        Get fresh instances of the default Room actions.
+
+        Each Room needs its own Actions, since an Action's state handlers are bound to it and it records its owning
+        Room, so the actions are rebuilt from JSON rather than copied from shared templates.
         """
 
-        return [LoadableFactory.get(raw_action) for raw_action in self._default_actions]
+        return LoadableFactory.get_many(self._default_actions)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import copy
 from abc import ABC
 
 import game
@@ -72,7 +71,7 @@ class SkillBase(ABC):
 
         if level in self.level_up_events:
             for event in self.level_up_events[level]:
-                game.add_state_device(copy.deepcopy(event))
+                game.add_state_device(event.clone())
 
         from game.systems.event.events import TextEvent
 
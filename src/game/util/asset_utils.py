@@ -10,6 +10,8 @@ their respective class-defined 'from_json' methods.
 
 import json
 import os
+import re
+from collections.abc import Iterator
 from os.path import exists
 from typing import IO
 
@@ -18,6 +20,12 @@ from loguru import logger
 DEFAULT_ASSET_PATH = "./assets"
 DEFAULT_ASSET_TYPE = "json"
 
+# JSON assets larger than this many bytes have their 'content' entries decoded one at a time by get_asset_content
+CONTENT_STREAM_THRESHOLD = 1 << 20
+
+_json_decoder = json.JSONDecoder()
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
 asset_handlers = {}
 
 
@@ -52,6 +60,13 @@ def get_asset(asset_name: str, file_type: str = DEFAULT_ASSET_TYPE) -> any:
 
     Returns: A parsed representation of the asset. This may take the form of a dict, list, or other collection.
     """
+    return asset_handlers[file_type](open(_get_asset_path(asset_name, file_type), "r"))
+
+
+def _get_asset_path(asset_name: str, file_type: str) -> str:
+    """
+    Build the path of an asset on disk, checking that it has a handler and exists.
+    """
     if file_type not in asset_handlers:
         raise ValueError(f"No handler registered for file type {file_type}!")
 
@@ -63,7 +78,89 @@ def get_asset(asset_name: str, file_type: str = DEFAULT_ASSET_TYPE) -> any:
             f"path: {DEFAULT_ASSET_PATH}"
         )
 
-    return asset_handlers[file_type](open(full_path, "r"))
+    return full_path
+
+
+def get_asset_content(asset_name: str, file_type: str = DEFAULT_ASSET_TYPE) -> Iterator[dict[str, any]]:
+    """
+    Iterate over the entries stored in an asset's top-level 'content' field.
+
+    JSON assets larger than CONTENT_STREAM_THRESHOLD bytes are decoded one entry at a time, so each entry can be built
+    and registered before the next one is parsed. Smaller assets, and other file types, are parsed whole by get_asset.
+
+    args:
+        asset_name: The file name of the asset, excluding file extension.
+        file_type: The file extension of the asset. Default is 'json'.
+
+    Returns: An iterator over the raw entries in the asset's 'content' list, in file order.
+    """
+    full_path = _get_asset_path(asset_name, file_type)
+
+    if file_type != "json" or os.path.getsize(full_path) <= CONTENT_STREAM_THRESHOLD:
+        yield from get_asset(asset_name, file_type)["content"]
+        return
+
+    with open(full_path, "r") as raw_file:
+        text = raw_file.read()
+
+    try:
+        yield from _iter_json_content(text)
+    except json.decoder.JSONDecodeError:
+        logger.error("JSON formatting error in file!")
+        raise
+
+
+def _iter_json_content(text: str) -> Iterator[any]:
+    """
+    Decode the entries of the 'content' list in a JSON object one at a time.
+
+    The object's other top-level values are decoded and discarded. Anything after the 'content' list is not read.
+    """
+
+    def skip_whitespace(index: int) -> int:
+        return _JSON_WHITESPACE.match(text, index).end()
+
+    def expect(index: int, char: str) -> int:
+        if text[index : index + 1] != char:
+            raise json.decoder.JSONDecodeError(f"Expecting '{char}'", text, index)
+
+        return skip_whitespace(index + 1)
+
+    i = expect(skip_whitespace(0), "{")
+    if text[i : i + 1] == "}":
+        raise KeyError("content")
+
+    while True:
+        key, i = _json_decoder.raw_decode(text, i)
+        if not isinstance(key, str):
+            raise json.decoder.JSONDecodeError("Expecting property name enclosed in double quotes", text, i)
+
+        i = expect(skip_whitespace(i), ":")
+
+        if key == "content":
+            i = expect(i, "[")
+            if text[i : i + 1] == "]":
+                return
+
+            while True:
+                entry, i = _json_decoder.raw_decode(text, i)
+                yield entry
+
+                i = skip_whitespace(i)
+                if text[i : i + 1] == "]":
+                    return
+
+                i = expect(i, ",")
+
+        _, i = _json_decoder.raw_decode(text, i)
+
+        i = skip_whitespace(i)
+        if text[i : i + 1] == "}":
+            break
+
+        i = expect(i, ",")
+
+    raise KeyError("content")
 
 
 @asset_handler("json")
@@ -1,5 +1,8 @@
 from game.structures.enums import InputType
 
+# InputTypes that place no constraints on the input range, so any range is valid for them
+_UNBOUNDED_INPUT_TYPES = frozenset((InputType.AFFIRMATIVE, InputType.ANY, InputType.SILENT))
+
 
 def is_valid_range(
     input_type: InputType, min_value: int | None = None, max_value: int | None = None, length: int | None = None
@@ -19,7 +22,7 @@ def is_valid_range(
     if type(input_type) is not InputType:
         raise TypeError(f"Cannot evaluate type {type(input_type)}! Must be of type InputType")
 
-    if input_type == InputType.AFFIRMATIVE or input_type == InputType.ANY or input_type == InputType.SILENT:
+    if input_type in _UNBOUNDED_INPUT_TYPES:
         return True
 
     # Min and max must be int or None and must make sense
@@ -14,7 +14,7 @@ def root_get():
     start = default_timer()
     r = game.state_device_controller.get_current_frame()
     duration = default_timer() - start
-    logger.info(f"Completed state retrieval in {duration}s")
+    logger.info("Completed state retrieval in {}s", duration)
     return r
 
 
@@ -23,7 +23,7 @@ def root_put(user_input: int | str):
     start = default_timer()
     r = game.state_device_controller.deliver_input(user_input)
     duration = default_timer() - start
-    logger.info(f"Completed input submission in {duration}s")
+    logger.info("Completed input submission in {}s", duration)
     return r
 
 
@@ -40,8 +40,13 @@ async def websocket_endpoint(websocket: WebSocket):
     """
 
     await websocket.accept()
-    data = await websocket.receive_json()
+
+    # Send the current frame as soon as the client connects, so that it has something to render without submitting an
+    # input. Reconnecting therefore never advances the game.
+    await websocket.send_text(game.state_device_controller.get_current_frame().model_dump_json())
+
     while True:
+        data = await websocket.receive_json()
         if isinstance(data, dict):
             if "user_input" in data:
                 # Attempt to coerce into an int
@@ -57,7 +62,6 @@ async def websocket_endpoint(websocket: WebSocket):
 
         r = game.state_device_controller.get_current_frame()
         await websocket.send_text(r.model_dump_json())
-        data = await websocket.receive_json()
 
 
 @tx_engine.get("/cache")
@@ -96,4 +100,6 @@ def cli(command: str):
 
 # Begin service logic
 if __name__ == "__main__":
-    exec("fastapi run")
+    import uvicorn
+
+    uvicorn.run(tx_engine)
@@ -0,0 +1,48 @@
+"""
+Helpers shared by the bundled viewers for turning frame content into Rich markup.
+"""
+
+from functools import lru_cache
+
+
+def formatting_to_tags(tags: list[str], opening_tag: bool | None = None, closing_tag: bool | None = None) -> str:
+    """Helper function for format_string"""
+    if opening_tag:
+        return "".join(f"[{tag}]" for tag in tags)
+
+    elif closing_tag:
+        return "".join(f"[/{tag}]" for tag in tags)
+
+    return ""
+
+
+@lru_cache(maxsize=256)
+def _tag_pair(tags: tuple[str, ...]) -> tuple[str, str]:
+    """
+    Return the opening and closing Rich tags for a set of formatting tags. Frames reuse a handful of formatting sets,
+    so the tag strings are built once per set.
+    """
+    return "".join(f"[{tag}]" for tag in tags), "".join(f"[/{tag}]" for tag in tags)
+
+
+def format_string(content: str, tags: list[str] | tuple[str, ...]) -> str:
+    """A helper function that wraps a content str in a set of Rich tags"""
+    opening, closing = _tag_pair(tuple(tags))
+    return opening + content + closing
+
+
+def parse_content(content: list) -> str:
+    """
+    Parse the elements inside the 'content' JSON field of a frame. Translate into a Rich-readable string.
+    """
+    # Fragments are collected and joined once, rather than re-copying the whole buffer for each element
+    parts = []
+    for element in content:
+        if isinstance(element, str):
+            parts.append(element)
+        elif isinstance(element, dict):
+            opening, closing = _tag_pair(tuple(element["formatting"]))
+            parts.append(opening)
+            parts.append(element["value"])
+            parts.append(closing)
+    return "".join(parts)
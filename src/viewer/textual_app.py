@@ -1,3 +1,5 @@
+import asyncio
+from collections import deque
 from dataclasses import dataclass
 
 import requests
@@ -6,43 +8,18 @@ from textual import on
 from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, Static, Input, TabbedContent, TabPane, Label, Button, RichLog
 
-
-# Global helper functions
-def formatting_to_tags(tags: list[str], opening_tag: bool = None, closing_tag: bool = None) -> str:
-    """Helper function for format_string"""
-    buf = ""
-    if opening_tag:
-        for tag in tags:
-            buf = buf + f"[{tag}]"
-
-    elif closing_tag:
-        for tag in tags:
-            buf = buf + f"[/{tag}]"
-
-    return buf
+from rich_markup import parse_content
 
 
-def format_string(content: str, tags: list[str]) -> str:
-    """A helper function that wraps a content str in a set of Rich tags"""
-    return formatting_to_tags(tags, opening_tag=True) + content + formatting_to_tags(tags, closing_tag=True)
-
+# Global helper functions
 
-def parse_content(content: list) -> str:
-    """
-    Parse the elements inside the 'content' JSON field of a frame. Translate into a Rich-readable string.
-    """
-    buf = ""
-    for element in content:
-        if type(element) is str:
-            buf = buf + element
-        elif type(element) is dict:
-            buf = (
-                buf
-                + formatting_to_tags(element["formatting"], opening_tag=True)
-                + element["value"]
-                + formatting_to_tags(element["formatting"], closing_tag=True)
-            )
-    return buf
+# The input restriction regex for each frame input type; None means the input is unrestricted
+_REGEX_BY_INPUT_TYPE: dict[str, str | None] = {
+    "int": r"[0-9]*",
+    "affirmative": r"[y,n,Y,N]",
+    "str": None,
+    "any": None,
+}
 
 
 def input_type_to_regex(input_type: str, input_range: dict = None) -> str | None:
@@ -52,21 +29,10 @@ def input_type_to_regex(input_type: str, input_range: dict = None) -> str | None
     if input_range is not None and type(input_range) is not dict:
         raise TypeError()
 
-    match input_type:
-        case "int":
-            return r"[0-9]*"
-
-        case "affirmative":
-            return r"[y,n,Y,N]"
-
-        case "str":
-            return None
-
-        case "any":
-            return None
-
-        case _:
-            raise RuntimeError("Unknown Input Type!")
+    try:
+        return _REGEX_BY_INPUT_TYPE[input_type]
+    except KeyError:
+        raise RuntimeError("Unknown Input Type!")
 
 
 def get_content_from_frame(frame: dict) -> str:
@@ -85,8 +51,12 @@ def get_options_from_frame(frame: dict) -> list[str] | None:
     return res
 
 
+# The number of previous frames kept for the History tab
+_MAX_HISTORY_ENTRIES = 256
+
+
 # Global helper classes
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HistoryEntry:
     """
     A simple dataclass that holds a record for a previous game frame and the user's input
@@ -130,7 +100,8 @@ class TextualViewer(App):
     def __init__(self):
         super().__init__()
 
-        self.frame_history: list[HistoryEntry] = []
+        # Only the most recent frames are kept; older entries fall off the front of the deque
+        self.frame_history: deque[HistoryEntry] = deque(maxlen=_MAX_HISTORY_ENTRIES)
         self.current_history_index: int | None = None
         self._ip = "http://localhost:8000"
         self._session = requests.Session()
@@ -176,23 +147,26 @@ class TextualViewer(App):
         self.get_child_by_type(MainView).get_child_by_type(TabbedContent).active = tab
 
     @on(Input.Submitted)
-    def submit_input(self, event: Input.Submitted) -> None:
+    async def submit_input(self, event: Input.Submitted) -> None:
         text = self.app.get_child_by_id("primary_user_input").value
-        self._submit_user_input(text)
+
+        # The HTTP calls block, so they run in a worker thread to keep the UI responsive while the server answers
+        await asyncio.to_thread(self._submit_user_input, text)
         self._write_log(f"Sent input: {text}")
         self.app.get_child_by_id("primary_user_input").value = ""
-        frame = self._get_current_frame()
-        text = get_content_from_frame(self._get_current_frame())
+        frame = await asyncio.to_thread(self._get_current_frame)
+        text = get_content_from_frame(frame)
 
         self.game_screen.clear()
         self.game_screen.write(text)
 
-        if get_options_from_frame(frame) is not None:
+        options = get_options_from_frame(frame)
+        if options is not None:
             table = Table()
             for col in frame["components"]["options_format"]["cols"]:
                 table.add_column(col)
 
-            for idx, row in enumerate(get_options_from_frame(frame)):
+            for idx, row in enumerate(options):
                 table.add_row(str(idx), row)
             self.game_screen.write(table)
 
@@ -1,14 +1,35 @@
 import asyncio
 import json
-import os
 from abc import ABC
+from operator import itemgetter
 
 import requests
 from loguru import logger
-from rich import print
+from rich import get_console, print
 
 from websockets.asyncio.client import connect
 
+import rich_markup
+
+
+# The italicized header shown for each input type. Only the int header takes arguments: the input range's min and max
+_HEADER_TEMPLATES: dict[str, str] = {
+    "int": "[italic]Enter a number between ({0} and {1}):[/italic]",
+    "none": "[italic]Press any key:[/italic]",
+    "str": "[italic]Enter a string: [/italic]",
+    "affirmative": "[italic]Enter y, n, yes, or no:[/italic]",
+    "any": "[italic]Press any key...[/italic]",
+}
+
+
+# Pulls the fields shown for an entity out of its summary dict in a single call
+_ENTITY_FIELDS = itemgetter("name", "primary_resource_name", "primary_resource_val", "primary_resource_max")
+
+
+def _entity_to_str(entity_dict: dict[str, any]) -> str:
+    entity_name, primary_resource_name, primary_resource_value, primary_resource_max = _ENTITY_FIELDS(entity_dict)
+    return f"{entity_name}\n{primary_resource_name}]: [{primary_resource_value}/{primary_resource_max}]"
+
 
 class BaseViewer(ABC):
     """
@@ -20,9 +41,11 @@ class BaseViewer(ABC):
         """
         Clear a terminal's contents
 
+        Rich's console writes the clear-screen control codes itself, so no shell is spawned for every frame.
+
         Returns: None
         """
-        os.system("cls")
+        get_console().clear()
 
     @classmethod
     def get_text_header(cls, tx_engine_response: dict) -> str:
@@ -40,60 +63,32 @@ class BaseViewer(ABC):
             if type(tx_engine_response["input_type"]) is str
             else tx_engine_response["input_type"][0]
         )
-        input_range = tx_engine_response["input_range"]
-
-        formatting = ["italic"]
+        template = _HEADER_TEMPLATES.get(input_type)
 
-        match input_type:
-            case "int":
-                hdr = f"Enter a number between ({input_range['min']} and {input_range['max']}):"
-            case "none":
-                hdr = "Press any key:"
-            case "str":
-                hdr = "Enter a string: "
+        if template is None:
+            logger.error(f"Unexpected input type: {input_type}")
+            logger.debug(f"Failed frame: {str(tx_engine_response)}")
+            raise ValueError(f"Unexpected input type: {input_type}")
 
-            case "affirmative":
-                hdr = "Enter y, n, yes, or no:"
-            case "any":
-                hdr = "Press any key..."
-            case _:
-                logger.error(f"Unexpected input type: {input_type}")
-                logger.debug(f"Failed frame: {str(tx_engine_response)}")
-                raise ValueError(f"Unexpected input type: {input_type}")
+        if input_type == "int":
+            input_range = tx_engine_response["input_range"]
+            return template.format(input_range["min"], input_range["max"])
 
-        return cls.format_string(hdr, formatting)
+        return template
 
     @classmethod
-    def formatting_to_tags(cls, tags: list[str], opening_tag: bool = None, closing_tag: bool = None) -> str:
-        buf = ""
-        if opening_tag:
-            for tag in tags:
-                buf = buf + f"[{tag}]"
-
-        elif closing_tag:
-            for tag in tags:
-                buf = buf + f"[/{tag}]"
-
-        return buf
+    def formatting_to_tags(
+        cls, tags: list[str], opening_tag: bool | None = None, closing_tag: bool | None = None
+    ) -> str:
+        return rich_markup.formatting_to_tags(tags, opening_tag, closing_tag)
 
     @classmethod
     def format_string(cls, content: str, tags: list[str]) -> str:
-        return cls.formatting_to_tags(tags, opening_tag=True) + content + cls.formatting_to_tags(tags, closing_tag=True)
+        return rich_markup.format_string(content, tags)
 
     @classmethod
     def parse_content(cls, content: list) -> str:
-        buf = ""
-        for element in content:
-            if type(element) is str:
-                buf = buf + element
-            elif type(element) is dict:
-                buf = (
-                    buf
-                    + cls.formatting_to_tags(element["formatting"], opening_tag=True)
-                    + element["value"]
-                    + cls.formatting_to_tags(element["formatting"], closing_tag=True)
-                )
-        return buf
+        return rich_markup.parse_content(content)
 
     def display(self, tx_engine_response: dict):
         """
@@ -101,30 +96,27 @@ class BaseViewer(ABC):
         """
         self.clear()
 
-        def entity_to_str(entity_dict: dict[str, any]) -> str:
-            entity_name = entity_dict["name"]
-            primary_resource_name = entity_dict["primary_resource_name"]
-            primary_resource_value = entity_dict["primary_resource_val"]
-            primary_resource_max = entity_dict["primary_resource_max"]
-            return f"{entity_name}\n{primary_resource_name}]: [{primary_resource_value}/{primary_resource_max}]"
+        components = tx_engine_response["components"]
 
-        if "enemies" in tx_engine_response["components"]:
-            print("ENEMIES")
-            for enemy in tx_engine_response["components"]["enemies"]:
-                print(entity_to_str(enemy))
+        # The screen is assembled first and printed in one call, so it is written and markup-parsed once per frame
+        lines = []
 
-        if "allies" in tx_engine_response["components"]:
-            print("ALLIES")
-            for ally in tx_engine_response["components"]["allies"]:
-                print(entity_to_str(ally))
+        if "enemies" in components:
+            lines.append("ENEMIES")
+            lines.extend(map(_entity_to_str, components["enemies"]))
 
-        print(self.parse_content(tx_engine_response["components"]["content"]))
+        if "allies" in components:
+            lines.append("ALLIES")
+            lines.extend(map(_entity_to_str, components["allies"]))
 
-        if "options" in tx_engine_response["components"] and type(tx_engine_response["components"]["options"]) is list:
-            for idx, opt in enumerate(tx_engine_response["components"]["options"]):
-                print(f"[{idx}] {self.parse_content(opt)}")
+        lines.append(self.parse_content(components["content"]))
 
-        print(self.get_text_header(tx_engine_response))
+        if "options" in components and type(components["options"]) is list:
+            lines.extend(f"[{idx}] {self.parse_content(opt)}" for idx, opt in enumerate(components["options"]))
+
+        lines.append(self.get_text_header(tx_engine_response))
+
+        print("\n".join(lines))
 
 
 class Viewer(BaseViewer):
@@ -136,7 +128,6 @@ class Viewer(BaseViewer):
         u = input("Enter the IP for the TXEngine server: ")
         self._ip = "http://" + (u if u != "" else "localhost:8000")
         self._session = requests.Session()
-        self.clear = lambda: os.system("cls")
 
     def start_session(self):
         """
@@ -163,12 +154,12 @@ class WebsocketViewer(BaseViewer):
 
     async def client(self) -> None:
         async with connect(f"ws://{self._ip}:8000") as websocket:
-            await websocket.send('{"user_input": ""}')  # Ping to get a baseline response
-            response = await websocket.recv()
+            response = await websocket.recv()  # The server sends the current frame when the connection opens
             while True:
                 self.clear()
                 self.display(json.loads(response))
-                payload = {"user_input": input()}
+                # input() blocks, so it runs in a worker thread to keep the event loop free to answer keepalive pings
+                payload = {"user_input": await asyncio.to_thread(input)}
                 await websocket.send(json.dumps(payload))
                 response = await websocket.recv()
 
@@ -176,10 +167,11 @@ class WebsocketViewer(BaseViewer):
 if __name__ == "__main__":
     import sys
 
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "--ws":
-            client = WebsocketViewer()
-            asyncio.run(client.client())
-
-    client = Viewer()
-    client.start_session()
+    # The websocket client takes one round trip per turn, so it is the default. --ws is still accepted for
+    # compatibility; pass --http-poll to use the GET/PUT client instead.
+    if "--http-poll" in sys.argv[1:]:
+        client = Viewer()
+        client.start_session()
+    else:
+        client = WebsocketViewer()
+        asyncio.run(client.client())
@@ -1,3 +1,5 @@
+import pytest
+
 from game.structures.messages import ComponentFactory
 
 
@@ -39,3 +41,24 @@ def test_content_options():
     assert result["content"]
     assert result["content"] == lst
     assert result["options"] == opt
+
+
+def test_content_tuple():
+    """
+    Test that ComponentFactory accepts tuples as well as lists
+    """
+
+    tpl = ("A", " set of ", "strings")
+    opt = (["one"], ["two"])
+    result = ComponentFactory.get(tpl, opt)
+    assert result["content"] == tpl
+    assert result["options"] == opt
+
+
+def test_content_bad_type():
+    """
+    Test that ComponentFactory rejects content that is not a list or tuple
+    """
+
+    with pytest.raises(TypeError):
+        ComponentFactory.get("A string")
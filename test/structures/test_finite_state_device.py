@@ -1,8 +1,10 @@
 from enum import Enum
+from typing import ClassVar
 
 from game.structures.enums import InputType
+from game.structures.errors import StateDeviceInternalError
 from game.structures.messages import ComponentFactory
-from game.structures.state_device import FiniteStateDevice
+from game.structures.state_device import FiniteStateDevice, StateSpec
 
 import pytest
 
@@ -157,6 +159,25 @@ def test_state_logic_decorator_integration(state, input_type, i_min, i_max, i_le
     assert md.counter == 1  # Verify logic was executed
 
 
+def test_set_state_binds_state_data():
+    """Test that the record for the active state is tracked across transitions and re-registrations."""
+
+    md = MockFiniteStateDevice()
+    assert md._current_state_data is md.state_data[md.States.DEFAULT.value]
+
+    for state in [md.States.A, md.States.B, md.States.DEFAULT]:
+        md.set_state(state)
+        assert md._current_state_data is md.state_data[state.value]
+
+    # Overriding the logic of the active state must take effect immediately
+    @md.state_logic(md.States.DEFAULT, InputType.ANY, override=True)
+    def _logic(_: any) -> None:
+        md.counter += 10
+
+    assert md.input("")
+    assert md.counter == 10
+
+
 # Generic branching FiniteStateDevice used for branching state tests
 class MockBranchingStateDevice(FiniteStateDevice):
     class States(Enum):
@@ -240,3 +261,109 @@ def test_user_branching_state_behavior():
     md.input(None)
     md.input(1)
     assert md.current_state.value == md.States.C.value
+
+
+# FiniteStateDevice whose states are declared with a table of StateSpecs
+class MockTableStateDevice(FiniteStateDevice):
+    class States(Enum):
+        DEFAULT = 0
+        A = 1
+        TERMINATE = -1
+
+    def __init__(self):
+        super().__init__(InputType.SILENT, self.States)
+        self.counter: int = 0
+        self.install_state_table(self._STATE_TABLE)
+
+    def _default_logic(self, _: any) -> None:
+        self.counter += 1
+        self.set_state(self.States.A)
+
+    def _a_logic(self, _: int) -> None:
+        self.counter += 1
+        self.set_state(self.States.TERMINATE)
+
+    def _a_content(self) -> dict:
+        return ComponentFactory.get([str(self.counter)])
+
+    def _a_max(self) -> int:
+        return self.counter + 1
+
+    _STATE_TABLE: ClassVar[dict[Enum, StateSpec]] = {
+        States.DEFAULT: StateSpec(InputType.SILENT, _default_logic),
+        States.A: StateSpec(InputType.INT, _a_logic, _a_content, input_min=0, input_max=_a_max),
+    }
+
+
+def test_install_state_table():
+    md = MockTableStateDevice()
+
+    dd = md.state_data[md.States.A.value]
+    assert dd["input_type"] == InputType.INT
+    assert dd["min"] == 0
+    assert dd["max"]() == 1  # Callable bounds are bound to the instance
+
+    md.input(None)
+    assert md.current_state == md.States.A
+    assert md.domain_max == 2
+    assert md.components["content"] == ["1"]
+
+    md.input(2)
+    assert md.current_state == md.States.TERMINATE
+    assert md.counter == 2
+
+    # Each instance is bound to its own handlers
+    assert MockTableStateDevice().counter == 0
+
+
+def test_install_state_table_repeat():
+    """Test that later installs of an already-validated table produce the same, correctly bound, records."""
+
+    first = MockTableStateDevice()
+    second = MockTableStateDevice()
+
+    for state in [MockTableStateDevice.States.DEFAULT, MockTableStateDevice.States.A]:
+        first_record = first.state_data[state.value]
+        second_record = second.state_data[state.value]
+
+        assert first_record["input_type"] == second_record["input_type"]
+        assert first_record["min"] == second_record["min"]
+        assert second_record["logic"].__self__ is second
+
+    second.input(None)
+    assert second.current_state == MockTableStateDevice.States.A
+    assert first.counter == 0
+
+    # Installing the same table twice on one instance is still a collision
+    with pytest.raises(StateDeviceInternalError):
+        second.install_state_table(MockTableStateDevice._STATE_TABLE)
+
+
+def test_install_state_table_validated_per_class():
+    """Test that a class's table is validated on its first install, even after another class's table was validated"""
+
+    MockTableStateDevice()
+
+    class BadTableStateDevice(MockTableStateDevice):
+        _STATE_TABLE: ClassVar[dict[Enum, StateSpec]] = {
+            MockTableStateDevice.States.DEFAULT: StateSpec(
+                InputType.INT, MockTableStateDevice._default_logic, input_min="0"
+            ),
+        }
+
+    for _ in range(2):
+        with pytest.raises(StateDeviceInternalError):
+            BadTableStateDevice()
+
+
+def test_set_state_unknown():
+    class OtherStates(Enum):
+        DEFAULT = 0
+        Z = 99
+
+    md = MockFiniteStateDevice()
+
+    with pytest.raises(StateDeviceInternalError):
+        md.set_state(OtherStates.Z)
+
+    assert md.current_state == md.States.DEFAULT
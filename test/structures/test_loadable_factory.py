@@ -0,0 +1,76 @@
+import pytest
+
+from game.structures.loadable_factory import LoadableFactory
+
+REQUIRED = (("id", int), ("quantity", (int, float)))
+OPTIONAL = (("silent", bool),)
+
+compiled_validator_cases = [
+    {"class": "Mock", "id": 1, "quantity": 2},
+    {"class": "Mock", "id": 1, "quantity": 2.5, "silent": True},
+    {"class": "Mock", "id": 1},
+    {"class": "Mock", "id": "1", "quantity": 2},
+    {"class": "Mock", "id": 1, "quantity": 2, "silent": "yes"},
+    {"id": 1, "quantity": 2},
+    {"class": 5, "id": 1, "quantity": 2},
+]
+
+
+@pytest.mark.parametrize("json", compiled_validator_cases)
+def test_compile_validator_matches_validate_fields(json: dict):
+    """Test that a compiled validator accepts and rejects exactly what validate_fields does."""
+
+    def validate_fields(j):
+        LoadableFactory.validate_fields(REQUIRED, j)
+        return LoadableFactory.validate_fields(OPTIONAL, j, False, False)
+
+    validator = LoadableFactory.compile_validator(REQUIRED, OPTIONAL)
+
+    try:
+        expected = validate_fields(json)
+    except (TypeError, ValueError) as e:
+        with pytest.raises(type(e)):
+            validator(json)
+    else:
+        assert validator(json) == expected
+
+
+def test_compile_validator_generic_alias():
+    validator = LoadableFactory.compile_validator((("flags", list[list[str | bool]]),))
+
+    assert validator({"class": "FlagEvent", "flags": [["a", True]]})
+
+    with pytest.raises(TypeError):
+        validator({"class": "FlagEvent", "flags": {"a": True}})
+
+
+def test_compile_validator_bad_spec():
+    with pytest.raises(TypeError):
+        LoadableFactory.compile_validator((("id", "int"),))
+
+    with pytest.raises(TypeError):
+        LoadableFactory.compile_validator(((1, int),))
+
+
+def test_get_many():
+    from game.cache import cached, delete_element
+    from game.structures.loadable import LoadableMixin
+
+    path = [LoadableMixin.LOADER_KEY, "_GetManyLoadable", LoadableMixin.ATTR_KEY]
+
+    @cached(path)
+    def loader(json: dict) -> str:
+        return json["value"]
+
+    try:
+        jsons = [{"class": "_GetManyLoadable", "value": "a"}, {"class": "_GetManyLoadable", "value": "b"}]
+        assert LoadableFactory.get_many(jsons) == ["a", "b"]
+        assert LoadableFactory.get_many([]) == []
+
+        with pytest.raises(ValueError):
+            LoadableFactory.get_many([{"class": "_NotALoadableClass"}])
+
+        with pytest.raises(TypeError):
+            LoadableFactory.get_many(["not a dict"])
+    finally:
+        delete_element(path, delete_branch=True)
@@ -153,15 +153,13 @@ def pre_collect_setup():
     entity_manager.register_entity(te_enemy_1)
     entity_manager.register_entity(te_enemy_2)
 
-    # For each ability, teach it to each entity
+    # Teach each testing ability to each entity, skipping any non-testing abilities that might have gotten into the mix
     assert len(ability_manager._manifest) > 0
-    for ability in ability_manager._manifest:
-        # Skip any non-testing abilities that might have gotten into the mix
-        if not ability.startswith(TEST_PREFIX):
-            continue
+    test_abilities = [ability for ability in ability_manager._manifest if ability.startswith(TEST_PREFIX)]
 
-        for entity in entity_manager._manifest.values():
-            if isinstance(entity, CombatEntity):
+    for entity in entity_manager._manifest.values():
+        if isinstance(entity, CombatEntity):
+            for ability in test_abilities:
                 entity.ability_controller.learn(ability)
 
     # Register late to avoid giving it abilities
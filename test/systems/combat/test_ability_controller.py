@@ -0,0 +1,13 @@
+from game.systems.combat.ability_controller import AbilityController
+from systems import TEST_PREFIX
+
+
+def test_sorted_abilities():
+    """Test that AbilityController.sorted_abilities stays sorted and reflects newly learned abilities"""
+    ac = AbilityController([f"{TEST_PREFIX}Ability 3", f"{TEST_PREFIX}Ability 1"])
+
+    assert ac.sorted_abilities == (f"{TEST_PREFIX}Ability 1", f"{TEST_PREFIX}Ability 3")
+    assert ac.sorted_abilities is ac.sorted_abilities
+
+    assert ac.learn(f"{TEST_PREFIX}Ability 2")
+    assert ac.sorted_abilities == (f"{TEST_PREFIX}Ability 1", f"{TEST_PREFIX}Ability 2", f"{TEST_PREFIX}Ability 3")
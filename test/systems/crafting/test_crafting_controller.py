@@ -66,3 +66,16 @@ def test_max_crafts(recipe_id: int, inventory_contents: list[tuple[int, int]], r
     p = Player(name="Crafty Boy", id=1, inventory=InventoryController(items=inventory_contents), recipes=[-110, -111])
 
     assert p.crafting_controller.get_max_crafts(recipe_id) == results
+
+
+def test_recipes_as_options():
+    """Test that each learned recipe is listed, formatted by whether its ingredients are available"""
+    from game.formatting import get_style
+
+    p = Player(name="Crafty Boy", id=1, inventory=InventoryController(items=[(-110, 2)]), recipes=[-112, -113])
+
+    opts = p.crafting_controller.get_recipes_as_options()
+
+    assert len(opts) == 2
+    assert opts[0][0].formatting == get_style("valid_recipe")
+    assert opts[1][0].formatting == get_style("invalid_recipe")
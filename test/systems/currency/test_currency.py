@@ -2,6 +2,7 @@ from copy import deepcopy
 
 import pytest
 
+from game.structures.errors import LoaderClassError
 from game.systems.currency.currency import Currency
 
 
@@ -320,3 +321,16 @@ def test_adjust_bad(currency: str, offsets: list[int]):
     with pytest.raises(TypeError):
         for offset in offsets:
             cur.adjust(offset)
+
+
+from_json_wrong_class_cases = [
+    {"class": "Item", "id": -1, "name": "USD", "stages": {"cents": 1}},
+    {"class": "Item"},
+    {"id": -1, "name": "USD", "stages": {"cents": 1}},
+]
+
+
+@pytest.mark.parametrize("json", from_json_wrong_class_cases)
+def test_from_json_wrong_class(json: dict):
+    with pytest.raises(LoaderClassError):
+        Currency.from_json(json)
@@ -0,0 +1,10 @@
+from game.systems.event.events import TextEvent
+
+
+def test_clone_text_event():
+    event = TextEvent("some text")
+    clone = event.clone()
+
+    assert type(clone) is TextEvent
+    assert clone is not event
+    assert clone.text == event.text
@@ -0,0 +1,57 @@
+import pytest
+
+from game.cache import from_cache
+from game.systems.event.manage_equipped_item_event import ManageEquippedItemEvent
+from game.systems.item.item import Equipment
+
+from ..utils import temporary_item
+
+summary_head = (
+    "helm",
+    "'s Summary",
+    "\n",
+    "Protects the head",
+    "\n",
+    "A sturdy helm",
+    "\n",
+    "Stats:",
+    "\n",
+    " - _tr_health: +3\n - Damage: 0\n - Resistance: 2",
+)
+summary_resistances = ("\n\nType Resistances:", "\n", " - tag_a: 50.0%")
+summary_market_values = ("\n\n", "Market Values:", "\n", " - USD: 1 dollars 50 cents")
+
+
+@pytest.mark.parametrize(
+    "tags, expected",
+    [
+        ({"tag_a": 0.5}, summary_head + summary_resistances + summary_market_values),
+        ({}, summary_head + summary_market_values),
+    ],
+)
+def test_summary_lines(tags: dict[str, float], expected: tuple[str, ...]):
+    """Test that an equipped item's summary lists its market values whether or not it has type resistances"""
+    helm = Equipment(
+        "helm",
+        -256,
+        "A sturdy helm",
+        "Protects the head",
+        "head",
+        0,
+        2,
+        tags=tags,
+        market_values={-110: 150},
+        resource_modifiers={"_tr_health": 3},
+    )
+
+    with temporary_item([helm]):
+        equipment_controller = from_cache("player").equipment_controller
+        previous = equipment_controller["head"].item_id
+        equipment_controller["head"] = -256
+
+        try:
+            event = ManageEquippedItemEvent("head")
+        finally:
+            equipment_controller["head"] = previous
+
+    assert list(event._default_content()["content"]) == list(expected)
@@ -1,5 +1,3 @@
-import copy
-
 import pytest
 
 from game.cache import from_cache, from_storage
@@ -139,7 +137,7 @@ def test_factory_usable_selection_functional():
     """
 
     # Set up test-case dependencies
-    entity = copy.deepcopy(from_cache("managers.EntityManager").get_instance(-110))  # Get a copy of the entity
+    entity = from_cache("managers.EntityManager").get_instance(-110)  # Get a copy of the entity
     entity.inventory.insert_item(-110, 2)
     entity.inventory.insert_item(-111, 3)
     entity.inventory.insert_item(-119, 1)
@@ -168,7 +166,7 @@ def test_factory_usable_selection_filter():
     """
 
     # Set up test-case dependencies
-    entity = copy.deepcopy(from_cache("managers.EntityManager").get_instance(-110))  # Get a copy of the entity
+    entity = from_cache("managers.EntityManager").get_instance(-110)  # Get a copy of the entity
     entity.inventory.insert_item(-110, 2)
     entity.inventory.insert_item(-111, 3)
     entity.inventory.insert_item(-115, 1)
@@ -234,3 +232,54 @@ def test_factory_usable_selection_filter_size_zero():
     tester = EventTester(event, [0], [])
     with pytest.raises(RuntimeError):
         tester.run_tests()
+
+
+def test_listings_rendered_once():
+    """Test that SelectElementEvent renders each listing once, no matter how many frames are drawn"""
+    calls = []
+
+    def to_listing(item_id: int) -> str:
+        calls.append(item_id)
+        return str(item_id)
+
+    e = SelectElementEvent([-110, -111, -112], lambda x: int(x), lambda item_id: item_id < -110, to_listing)
+    e.link()
+    e.input("")
+
+    for _ in range(3):
+        e.to_frame()
+
+    assert calls == [-111, -112]
+
+
+def test_no_filter_skips_default():
+    """Test that a SelectElementEvent without a filter starts directly in SHOW_ELEMENTS"""
+    e = SelectElementEvent([-110, -111, -112], lambda x: int(x))
+    links = e.link()
+
+    tester = EventTester(e, [2], [])
+    tester.run_tests()
+
+    assert e.state_history[1] == SelectElementEvent.States.SHOW_ELEMENTS
+    assert SelectElementEvent.States.DEFAULT not in e.state_history
+    assert from_storage(links["selected_element"]) == -112
+
+
+def test_factory_entity_selection_tuple():
+    """Test that the SelectElementEventFactory's get_select_entity_event function accepts any Sequence, not just
+    lists
+    """
+    from game.systems.entity.entities import CombatEntity
+
+    entities = (CombatEntity(id=-256, name="first"), CombatEntity(id=-257, name="second"))
+
+    event = SelectElementEventFactory.get_select_entity_event(entities)
+    links = event.link()
+
+    tester = EventTester(event, [1], [])
+    tester.run_tests()
+
+    assert from_storage(links["selected_element"]) is entities[1]
+
+    with pytest.raises(TypeError):
+        SelectElementEventFactory.get_select_entity_event(iter(entities))
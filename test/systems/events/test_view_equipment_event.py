@@ -0,0 +1,33 @@
+from game.systems.entity.entities import CombatEntity
+from game.systems.event.view_equipment_event import ViewEquipmentEvent
+from game.systems.inventory import EquipmentController
+
+
+def test_view_equipment_follows_direct_slot_writes():
+    """Test that the cached slot list is rebuilt when a slot is locked or unlocked directly"""
+    owner = CombatEntity(id=-256, name="owner")
+    ec = owner.equipment_controller
+    event = ViewEquipmentEvent(owner)
+    slot = ec.enabled_slots[0]
+
+    enabled_max = event._display_equipment_max()
+
+    ec[slot].enabled = False
+    assert event._display_equipment_max() == enabled_max - 1
+
+    ec[slot].unlock()
+    assert event._display_equipment_max() == enabled_max
+
+
+def test_view_equipment_follows_replaced_controller():
+    """Test that the cached slot list is rebuilt when the target's controller is replaced by one at the same version"""
+    owner = CombatEntity(id=-256, name="owner")
+    event = ViewEquipmentEvent(owner)
+    enabled_max = event._display_equipment_max()
+
+    replacement = EquipmentController(owner)
+    replacement[replacement.enabled_slots[0]] = False
+    replacement.version = owner.equipment_controller.version
+    owner.equipment_controller = replacement
+
+    assert event._display_equipment_max() == enabled_max - 1
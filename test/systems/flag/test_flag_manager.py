@@ -49,3 +49,31 @@ def test_get_flag_bad(key: str, throws: bool):
     if throws:
         with pytest.raises(KeyError):
             flag_manager.set_flag(key, True)
+
+
+def test_set_flags():
+    flag_manager.clear()
+    flag_manager.set_flags([("a", True), ("root.b", True), ("root.c", False), ("a", False)])
+
+    assert not flag_manager.get_flag("a")
+    assert flag_manager.get_flag("root.b")
+    assert not flag_manager.get_flag("root.c")
+
+
+def test_get_flag_subgroup():
+    flag_manager.clear()
+    flag_manager.set_flag("root.branch.leaf", True)
+
+    for key in ["root", "root.branch"]:
+        with pytest.raises(KeyError):
+            flag_manager.get_flag(key)
+
+
+def test_set_flag_over_subgroup():
+    flag_manager.clear()
+    flag_manager.set_flag("root.branch.leaf", True)
+
+    with pytest.raises(KeyError):
+        flag_manager.set_flag("root.branch", True)
+
+    assert flag_manager.get_flag("root.branch.leaf")
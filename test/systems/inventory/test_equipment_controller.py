@@ -0,0 +1,169 @@
+import pytest
+
+from game.systems.inventory import EquipmentController
+
+
+def test_unequip_unknown_slot():
+    ec = EquipmentController()
+
+    with pytest.raises(ValueError):
+        ec.unequip("not a slot")
+
+
+def test_unequip_empty_slot():
+    """Test that unequipping an empty slot succeeds without marking the equipment as changed"""
+    ec = EquipmentController()
+    slot = ec.enabled_slots[0]
+    version = ec.version
+
+    assert ec[slot].item_id is None
+    assert ec.unequip(slot)
+    assert ec[slot].item_id is None
+    assert ec.version == version
+
+
+def test_unequip_disabled_slot():
+    ec = EquipmentController()
+    slot = ec.enabled_slots[0]
+    ec[slot] = False
+
+    assert not ec.unequip(slot)
+
+
+def test_setitem_bool_is_not_item_id():
+    """Test that bools reach EquipSlot.enabled and never EquipSlot.item_id, even though bool subclasses int"""
+    ec = EquipmentController()
+    slot = ec.enabled_slots[0]
+
+    ec[slot] = True
+    assert ec[slot].enabled is True
+    assert ec[slot].item_id is None
+
+    ec[slot] = False
+    assert ec[slot].enabled is False
+    assert ec[slot].item_id is None
+
+    with pytest.raises(TypeError):
+        ec[slot] = 1.0
+
+
+def test_deepcopy():
+    """Test that a deep-copied EquipmentController has its own slots and follows its owner's copy"""
+    from copy import deepcopy
+
+    from game.systems.entity.entities import CombatEntity
+
+    owner = CombatEntity(id=-256, name="owner")
+    ec = owner.equipment_controller
+    slot = ec.enabled_slots[0]
+    ec.version = 3
+
+    copied_owner = deepcopy(owner)
+    copied = copied_owner.equipment_controller
+
+    assert copied is not ec
+    assert copied.owner is copied_owner
+    assert copied.version == ec.version
+    assert copied[slot] == ec[slot]
+    assert copied[slot] is not ec[slot]
+
+    copied[slot] = False
+    assert ec[slot].enabled
+
+
+def test_total_dmg_resistance_cached():
+    """Test that total_dmg_resistance follows the equipment after being cached"""
+    from game.systems.entity.entities import CombatEntity
+    from game.systems.item.item import Equipment
+
+    from ..utils import temporary_item
+
+    with temporary_item([Equipment("helm", -256, "", "", "head", 0, 6)]):
+        owner = CombatEntity(id=-256, name="owner")
+        ec = owner.equipment_controller
+
+        assert ec.total_dmg_resistance == 0
+
+        ec.equip(-256)
+        assert ec.total_dmg_resistance == 6
+        assert ec.total_dmg_resistance == 6
+
+        ec.unequip("head")
+        assert ec.total_dmg_resistance == 0
+
+
+def test_all_tag_resistance_cached():
+    """Test that all_tag_resistance is reused until the equipment changes"""
+    from game.systems.entity.entities import CombatEntity
+    from game.systems.item.item import Equipment
+
+    from ..utils import temporary_item
+
+    with temporary_item([Equipment("helm", -256, "", "", "head", 0, 0, tags={"tag_a": 0.33})]):
+        owner = CombatEntity(id=-256, name="owner")
+        ec = owner.equipment_controller
+
+        assert ec.all_tag_resistance == {}
+        assert ec.all_tag_resistance is ec.all_tag_resistance
+
+        ec.equip(-256)
+        assert ec.all_tag_resistance == {"tag_a": [0.33]}
+
+        ec.unequip("head")
+        assert ec.all_tag_resistance == {}
+
+
+def test_resistance_follows_direct_slot_writes():
+    """Test that the cached resistances are refreshed when a slot is unlocked or assigned directly"""
+    from copy import deepcopy
+
+    from game.systems.entity.entities import CombatEntity
+    from game.systems.item.item import Equipment
+
+    from ..utils import temporary_item
+
+    with temporary_item([Equipment("helm", -256, "", "", "head", 0, 6, tags={"tag_a": 0.33})]):
+        owner = CombatEntity(id=-256, name="owner")
+        ec = owner.equipment_controller
+        ec.equip(-256)
+
+        assert ec.total_dmg_resistance == 6
+        assert ec.all_tag_resistance == {"tag_a": [0.33]}
+
+        ec["head"].enabled = False
+        assert ec.total_dmg_resistance == 0
+        assert ec.all_tag_resistance == {}
+
+        ec["head"].unlock()
+        assert ec.total_dmg_resistance == 6
+        assert ec.all_tag_resistance == {"tag_a": [0.33]}
+
+        ec["head"].item_id = None
+        assert ec.total_dmg_resistance == 0
+        assert ec.all_tag_resistance == {}
+
+        # Slots of a copy report to the copy, not to the original
+        ec["head"].item_id = -256
+        copied = deepcopy(owner).equipment_controller
+        version = ec.version
+
+        copied["head"].item_id = None
+        assert ec.version == version
+        assert ec.total_dmg_resistance == 6
+        assert copied.total_dmg_resistance == 0
+
+
+def test_slots_do_not_keep_controller_alive():
+    """Test that a slot's reference back to its controller is weak"""
+    import weakref
+
+    ec = EquipmentController()
+    slot = ec[ec.enabled_slots[0]]
+    controller_ref = weakref.ref(ec)
+
+    del ec
+    assert controller_ref() is None
+
+    # A slot whose controller is gone can still be written to
+    slot.enabled = False
+    assert not slot.enabled
@@ -0,0 +1,55 @@
+import pytest
+
+from game.cache import from_cache
+
+
+def test_get_slots_copies():
+    """Test that EquipmentManager.get_slots returns equal slots that are independent of the manager's own"""
+    manager = from_cache("managers.EquipmentManager")
+    slots = manager.get_slots()
+
+    assert len(slots) > 0
+
+    for key, slot in slots.items():
+        assert slot == manager[key]
+        assert slot is not manager[key]
+
+        slot.enabled = not slot.enabled
+        assert slot.enabled != manager[key].enabled
+
+
+def test_setitem():
+    """Test that EquipmentManager.__setitem__ routes each value type to the right slot field"""
+    manager = from_cache("managers.EquipmentManager")
+    key = next(iter(manager.get_slots()))
+    original = manager.get_slots()[key]
+
+    try:
+        manager[key] = not original.enabled
+        assert manager[key].enabled != original.enabled
+
+        manager[key] = -1
+        assert manager[key].item_id == -1
+
+        manager[key] = None
+        assert manager[key].item_id is None
+
+        with pytest.raises(TypeError):
+            manager[key] = "1"
+
+        with pytest.raises(KeyError):
+            manager["not a slot"] = True
+    finally:
+        manager[key] = original.enabled
+        manager[key] = original.item_id
+
+
+def test_is_valid_slot_interned():
+    """Test that EquipmentManager.is_valid_slot hands back the same str object as the registered slot key"""
+    manager = from_cache("managers.EquipmentManager")
+    key = next(iter(manager.get_slots()))
+
+    # Build an equal str that is a distinct object
+    copied = "".join(list(key))
+
+    assert manager.is_valid_slot(copied) is key
@@ -0,0 +1,27 @@
+import pytest
+
+from game.systems.item.item import Equipment, Usable
+
+
+def test_usable_rejects_non_event():
+    with pytest.raises(TypeError):
+        Usable("bad usable", -300, "", "", on_use_events=["not an event"])
+
+
+def test_equipment_rejects_non_combat_effect():
+    with pytest.raises(TypeError):
+        Equipment("bad equipment", -301, "", "", "head", 0, 0, start_of_combat_effects=["not an effect"])
+
+
+def test_usable_from_json():
+    json = {"class": "Usable", "name": "potion", "id": -302, "description": "", "functional_description": ""}
+    usable = Usable.from_json(json)
+
+    assert usable.name == "potion"
+    assert usable.on_use_events == []
+
+    with pytest.raises(TypeError):
+        Usable.from_json(json | {"consumable": "yes"})
+
+    with pytest.raises(ValueError):
+        Usable.from_json({k: v for k, v in json.items() if k != "functional_description"})
@@ -1,11 +1,28 @@
+import pytest
+
 from game.systems.entity.entities import CombatEntity
-from game.systems.item.loot import LootTable
+from game.systems.item.loot import AliasTable, LootTable
+
+
+def implied_probabilities(table: AliasTable) -> dict[int, float]:
+    """Reconstruct the exact distribution an AliasTable samples from its columns"""
+    n = len(table)
+    probabilities = {outcome: 0.0 for outcome in table.outcomes}
+
+    for outcome, threshold, alias in zip(table.outcomes, table._thresholds, table._aliases):
+        probabilities[outcome] += threshold / n
+        probabilities[alias] += (1.0 - threshold) / n
+
+    return probabilities
 
 
 def test_loot_table_trivial():
     lt = LootTable(-1, {-110: 1.0}, {1: 1.0})
-    assert len(lt.item_table) == LootTable.ITEM_TABLE_RESOLUTION
-    assert len(lt.drop_table) == LootTable.DROP_TABLE_RESOLUTION
+    assert len(lt.item_table) == 1
+    assert len(lt.drop_table) == 1
+
+    assert lt.item_table.sample() == -110
+    assert lt.drop_table.sample() == 1
 
 
 def test_loot_table_get_loot():
@@ -18,8 +35,44 @@ def test_loot_table_get_loot():
     d_prob = {1: 1.0}
 
     lt = LootTable(-1, item_probabilities=i_prob, drop_probabilities=d_prob)
-    assert len(lt.item_table) == LootTable.ITEM_TABLE_RESOLUTION
-    assert len(lt.drop_table) == LootTable.DROP_TABLE_RESOLUTION
+    assert len(lt.item_table) == len(i_prob)
+    assert len(lt.drop_table) == len(d_prob)
+
+
+alias_table_cases = [
+    {1: 1.0},
+    {1: 0.5, 2: 0.5},
+    {-110: 0.33, -111: 0.33, -112: 0.34},
+    {0: 0.1, 1: 0.6, 2: 0.2, 3: 0.1},
+    {0: 0.001, 1: 0.999},
+    {1: 0.0, 2: 1.0},
+]
+
+
+@pytest.mark.parametrize("probabilities", alias_table_cases)
+def test_alias_table_exact(probabilities: dict[int, float]):
+    """Test that an AliasTable encodes the normalized probabilities exactly"""
+    table = AliasTable(probabilities)
+    total = sum(probabilities.values())
+
+    for outcome, probability in implied_probabilities(table).items():
+        assert probability == pytest.approx(probabilities[outcome] / total)
+
+    assert all(table.sample() in probabilities for _ in range(100))
+
+
+def test_alias_table_bad():
+    with pytest.raises(ValueError):
+        AliasTable({1: -0.5, 2: 1.5})
+
+    with pytest.raises(ValueError):
+        AliasTable({1: 0.0, 2: 0.0})
+
+    with pytest.raises(ValueError):
+        AliasTable({1: 0.5, 2: 0.6})
+
+    with pytest.raises(ValueError):
+        AliasTable({1: 2, 2: 6})
 
 
 def test_lootable_mixin_trivial():
@@ -33,7 +86,38 @@ def test_lootable_mixin_trivial():
     sl = CombatEntity(id=-1, name="TestEntity", item_probabilities=i_prob, drop_probabilities=d_prob)
 
     assert type(sl.loot_table) is LootTable
-    assert len(sl.loot_table.item_table) == LootTable.ITEM_TABLE_RESOLUTION
-    assert sum(sl.loot_table.drop_table) == LootTable.DROP_TABLE_RESOLUTION * 1.0
+    assert len(sl.loot_table.item_table) == len(i_prob)
+    assert sl.loot_table.drop_table.outcomes == [1]
+
+    assert len(sl.get_loot().keys()) == 1  # Exactly one drop, since d_prob always yields 1
+
+
+def test_get_loot_counts():
+    """Test that get_loot aggregates every drop into per-item quantities"""
+    sl = CombatEntity(id=-1, name="TestEntity", item_probabilities={-110: 0.5, -111: 0.5}, drop_probabilities={5: 1.0})
+
+    loot = sl.get_loot()
+
+    assert set(loot) <= {-110, -111}
+    assert sum(loot.values()) == 5
+
+
+def test_alias_table_sample_many():
+    table = AliasTable({1: 0.25, 2: 0.75})
+
+    assert table.sample_many(0) == []
+    assert len(table.sample_many(50)) == 50
+    assert set(table.sample_many(50)) <= {1, 2}
+
+
+def test_alias_table_inexact_floats():
+    """Test that weights whose float sum is not exactly 1.0 are accepted and sampled in the right proportions"""
+    table = AliasTable({1: 0.1, 2: 0.2, 3: 0.7})
+
+    assert implied_probabilities(table) == pytest.approx({1: 0.1, 2: 0.2, 3: 0.7})
+
+
+def test_loot_table_slots():
+    lt = LootTable(-1, {-110: 1.0}, {1: 1.0})
 
-    assert len(sl.get_loot().keys()) == 1  # Technically non-deterministic, but should really always be 1
+    assert not hasattr(lt, "__dict__")
@@ -0,0 +1,28 @@
+from game.systems.requirement.requirements import RequirementsMixin
+
+
+class FakeRequirement:
+    def __init__(self, result: bool):
+        self.result = result
+        self.calls = 0
+
+    def fulfilled(self, entity) -> bool:
+        self.calls += 1
+        return self.result
+
+
+class Holder(RequirementsMixin):
+    pass
+
+
+def test_no_requirements():
+    assert Holder().is_requirements_fulfilled(None)
+
+
+def test_requirements_short_circuit():
+    """Test that requirements after the first unfulfilled one are never checked"""
+    reqs = [FakeRequirement(True), FakeRequirement(False), FakeRequirement(True)]
+    mixin = Holder(requirements=reqs)
+
+    assert not mixin.is_requirements_fulfilled(None)
+    assert [r.calls for r in reqs] == [1, 1, 0]
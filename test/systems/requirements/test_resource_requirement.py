@@ -0,0 +1,33 @@
+from types import SimpleNamespace
+
+import pytest
+
+from game.systems.entity.resource import Resource
+from game.systems.requirement.requirements import ResourceRequirement
+
+
+def entity_with(value: int, max_value: int = 10):
+    return SimpleNamespace(resource_controller={"health": Resource("health", max_value, "Test health", value)})
+
+
+@pytest.mark.parametrize(
+    "adjust_quantity, value, expected",
+    [(5, 5, True), (5, 4, False), (0.5, 5, True), (0.5, 4, False), (1.0, 10, True)],
+)
+def test_resource_requirement(adjust_quantity: int | float, value: int, expected: bool):
+    assert ResourceRequirement("health", adjust_quantity).fulfilled(entity_with(value)) is expected
+
+
+def test_resource_requirement_bad_type():
+    with pytest.raises(TypeError):
+        ResourceRequirement("health", "5")
+
+    with pytest.raises(TypeError):
+        ResourceRequirement("health", True)
+
+
+def test_resource_requirement_description_cached():
+    req = ResourceRequirement("health", 0.5)
+
+    assert req.description is req.description
+    assert req.description[1].value == "50.0%"
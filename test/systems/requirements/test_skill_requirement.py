@@ -30,3 +30,10 @@ def test_trivial():
     r = SkillRequirement(1, 2)
 
     assert r.fulfilled(ce)
+
+
+def test_missing_skill():
+    ce = CombatEntity(id=-1, name="Test Entity")
+
+    # An ID that no skill is registered under should fail the requirement rather than raise
+    assert not SkillRequirement(-999, 1).fulfilled(ce)
@@ -0,0 +1,32 @@
+from unittest import mock
+
+from game.systems.entity.entities import CombatEntity
+from game.systems.inventory import EquipmentController
+from game.systems.item.item import Equipment
+from game.systems.room.action.manage_inventory_action import ManageInventoryAction
+
+from ..utils import temporary_item
+
+
+def test_equip_into_empty_slot():
+    """Test that equipping into an empty slot does not try to unequip it first"""
+    helm = Equipment("helm", -256, "A sturdy helm", "Protects the head", "head", 0, 2)
+
+    with temporary_item([helm]):
+        owner = CombatEntity(id=-256, name="owner")
+        owner.inventory.insert_item(-256, 1)
+        assert owner.equipment_controller["head"].item_id is None
+
+        action = ManageInventoryAction()
+        action.player_ref = owner
+        action.stack_index = 0
+
+        # equip() empties the slot itself, so it is mocked out to leave only the action's own calls
+        with (
+            mock.patch.object(EquipmentController, "equip", autospec=True) as equip,
+            mock.patch.object(EquipmentController, "unequip", autospec=True) as unequip,
+        ):
+            action._equip_item_logic(None)
+
+        unequip.assert_not_called()
+        equip.assert_called_once_with(owner.equipment_controller, -256)
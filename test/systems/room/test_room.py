@@ -0,0 +1,95 @@
+import pytest
+
+from game.systems import room
+from game.systems.room.action.actions import ExitAction
+from game.systems.room.room import Room
+
+
+def get_room() -> Room:
+    action_list = [
+        ExitAction(-1, "Always shown"),
+        ExitAction(-2, "Hidden", visible=False, tags=["secret"]),
+    ]
+    return Room(-1, "Test room", action_list, "A test room", default_actions_enabled=False)
+
+
+def test_visible_actions_cached():
+    r = get_room()
+
+    assert r.visible_actions is r.visible_actions
+    assert r.options == (("Always shown",),)
+
+
+def test_visible_actions_invalidated():
+    r = get_room()
+    assert r.options == (("Always shown",),)
+
+    # Changing an action's visibility must be reflected in the owning room
+    for action in r._tag_index["secret"]:
+        action.visible = True
+
+    assert [a.menu_name for a in r.visible_actions] == ["Always shown", "Hidden"]
+    assert r.options == (("Always shown",), ("Hidden",))
+
+    r.actions[0].visible = False
+    assert r.options == (("Hidden",),)
+
+
+def test_visited_rooms_shared():
+    r = get_room()
+
+    # Rooms read the RoomManager's set directly, so visits recorded after construction must still be seen
+    room.room_manager.visit_room(r.id)
+    try:
+        assert r.id in r._visited_rooms
+    finally:
+        room.room_manager.visited_rooms.discard(r.id)
+
+
+def test_display_options_bounds():
+    r = get_room()
+    r.reset()
+    r.input("")
+
+    assert r.current_state == Room.States.DISPLAY_OPTIONS
+    assert r.validate_input(0)
+    assert not r.validate_input(1)  # The hidden action is not selectable
+
+    # Bounds are bound per instance even though the state table is shared
+    other = Room(-2, "Other room", [ExitAction(-1, "A"), ExitAction(-2, "B")], "", default_actions_enabled=False)
+    other.reset()
+    other.input("")
+    assert other.validate_input(1)
+
+
+def test_get_name():
+    r = get_room()
+    room.room_manager.register_room(r)
+    try:
+        assert room.room_manager.get_name(r.id) == "Test room"
+    finally:
+        del room.room_manager.rooms[r.id]
+
+    with pytest.raises(ValueError):
+        room.room_manager.get_name(r.id)
+
+    with pytest.raises(TypeError):
+        room.room_manager.get_name(str(r.id))
+
+
+def test_from_json():
+    json = {
+        "class": "Room",
+        "id": -1,
+        "name": "Test room",
+        "enter_text": "A test room",
+        "actions": [{"class": "ExitAction", "target_room": -2, "menu_name": "Leave"}],
+    }
+
+    r = Room.from_json(json)
+    assert [a.menu_name for a in r.actions][-1] == "Leave"
+
+    with pytest.raises(TypeError):
+        Room.from_json(
+            {**json, "actions": [{"class": "Item", "name": "Not an action", "id": -1, "description": "An item"}]}
+        )
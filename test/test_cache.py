@@ -1,6 +1,7 @@
 import pytest
 
 from game.cache import (
+    decode_path,
     from_cache,
     get_cache,
     cache_element,
@@ -50,6 +51,21 @@ def test_delete_element():
     assert from_cache("root.branch") is None
 
 
+def test_decode_path():
+    """
+    Test that 'decode_path' splits dot-notation and passes list paths through unchanged
+    """
+    assert tuple(decode_path("root.branch")) == ("root", "branch")
+    assert decode_path("root.branch") is decode_path("root.branch")  # String paths are memoized
+    assert decode_path(["root", "branch"]) == ["root", "branch"]
+
+    with pytest.raises(TypeError):
+        decode_path(["root", 1])
+
+    with pytest.raises(TypeError):
+        decode_path(1)
+
+
 def test_cache_element():
     """
     Test that 'cache_element' can correctly store elements in the cache
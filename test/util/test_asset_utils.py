@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from game.util import asset_utils
+from game.util.asset_utils import get_asset_content
+
+asset = {
+    "name": "test asset",
+    "tags": {"list": [1, 2, 3], "text": ']}, "content": ['},
+    "content": [
+        {"class": "Currency", "id": -1, "name": "coin [a]", "nested": {"content": []}},
+        {"class": "Currency", "id": -2, "values": [1.5, None, True, "x"]},
+        [],
+        "string entry",
+    ],
+    "after": {"ignored": True},
+}
+
+
+@pytest.fixture
+def asset_dir(tmp_path, monkeypatch):
+    """Point the asset utils at a temporary directory, decoding every asset one entry at a time"""
+    monkeypatch.setattr(asset_utils, "DEFAULT_ASSET_PATH", str(tmp_path))
+    monkeypatch.setattr(asset_utils, "CONTENT_STREAM_THRESHOLD", 0)
+    return tmp_path
+
+
+@pytest.mark.parametrize("indent", [None, 4])
+def test_get_asset_content_streamed(asset_dir, indent):
+    """Test that a streamed asset yields the same entries as parsing it whole"""
+    (asset_dir / "test.json").write_text(json.dumps(asset, indent=indent))
+
+    assert list(get_asset_content("test")) == asset["content"]
+
+
+def test_get_asset_content_small_asset(asset_dir, monkeypatch):
+    """Test that an asset under the threshold is parsed whole and yields the same entries"""
+    monkeypatch.setattr(asset_utils, "CONTENT_STREAM_THRESHOLD", 1 << 20)
+    (asset_dir / "test.json").write_text(json.dumps(asset))
+
+    assert list(get_asset_content("test")) == asset["content"]
+
+
+def test_get_asset_content_is_incremental(asset_dir):
+    """Test that entries are yielded before the rest of the content list is decoded"""
+    (asset_dir / "test.json").write_text('{"content": [{"id": 1}, {"id": 2}, not json]}')
+    entries = get_asset_content("test")
+
+    assert next(entries) == {"id": 1}
+    assert next(entries) == {"id": 2}
+
+    with pytest.raises(json.JSONDecodeError):
+        next(entries)
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"content": [1, 2,]}', '{"content": [1 2]}', '{"content" [1]}', '["content"]', '{"a": 1,, "content": []}'],
+)
+def test_get_asset_content_malformed(asset_dir, text):
+    (asset_dir / "test.json").write_text(text)
+
+    with pytest.raises(json.JSONDecodeError):
+        list(get_asset_content("test"))
+
+
+@pytest.mark.parametrize("text", ["{}", '{"a": 1}'])
+def test_get_asset_content_missing(asset_dir, text):
+    (asset_dir / "test.json").write_text(text)
+
+    with pytest.raises(KeyError):
+        list(get_asset_content("test"))
+
+
+def test_get_asset_content_empty(asset_dir):
+    (asset_dir / "test.json").write_text('{"content": [ ]}')
+
+    assert list(get_asset_content("test")) == []